@@ -3,42 +3,221 @@ import xmltodict
 import pandas as pd
 import collections
 import copy
+from lxml import etree
+from core.loader.model_cache import ModelCache
+from core.loader.utils_data_loader import is_archive, list_archive_members, join_file_path, open_file
+from core.model.string_table import compact_nodes, compact_edges
+
+# namespace of the 'type' attribute of ArchiMate elements, relationships and view nodes
+XSI_TYPE = '{http://www.w3.org/2001/XMLSchema-instance}type'
+
+# subtrees of an ArchiMate exchange file which are never read, per loading profile
+# ('global' = MCCGlobal and RefPaGlobal, 'views' = MCCViews and the algorithms built on it)
+SKIPPED_SUBTREES = {
+    'global': ['views', 'diagrams', 'view', 'organizations', 'item', 'propertyDefinitions', 'propertyDefinition',
+               'properties', 'property', 'documentation'],
+    'views': ['organizations', 'item', 'propertyDefinitions', 'propertyDefinition', 'properties', 'property',
+              'documentation', 'style'],
+}
+
+# element types of the ArchiMate layers, a layer name can be used instead of its element types in the type filters
+ARCHIMATE_LAYERS = {
+    'strategy': ['Resource', 'Capability', 'ValueStream', 'CourseOfAction'],
+    'business': ['BusinessActor', 'BusinessRole', 'BusinessCollaboration', 'BusinessInterface', 'BusinessProcess',
+                 'BusinessFunction', 'BusinessInteraction', 'BusinessEvent', 'BusinessService', 'BusinessObject',
+                 'Contract', 'Representation', 'Product'],
+    'application': ['ApplicationComponent', 'ApplicationCollaboration', 'ApplicationInterface', 'ApplicationFunction',
+                    'ApplicationInteraction', 'ApplicationProcess', 'ApplicationEvent', 'ApplicationService',
+                    'DataObject'],
+    'technology': ['Node', 'Device', 'SystemSoftware', 'TechnologyCollaboration', 'TechnologyInterface', 'Path',
+                   'CommunicationNetwork', 'TechnologyFunction', 'TechnologyProcess', 'TechnologyInteraction',
+                   'TechnologyEvent', 'TechnologyService', 'Artifact', 'Equipment', 'Facility',
+                   'DistributionNetwork', 'Material'],
+    'motivation': ['Stakeholder', 'Driver', 'Assessment', 'Goal', 'Outcome', 'Principle', 'Requirement',
+                   'Constraint', 'Meaning', 'Value'],
+    'implementation_migration': ['WorkPackage', 'Deliverable', 'ImplementationEvent', 'Plateau', 'Gap'],
+}
 
 
 class DataLoader:
 
-    def __init__(self, path: str = ''):
+    def __init__(self, path: str = '', cache_dir: str = None):
+        """Constructor
+
+        :param str path: The path to the directory which contains all files one want to load
+        :param str cache_dir: The directory where the extracted data of the files is cached (None = no cache)
+        """
         self.__path = path
+        self.__cache = ModelCache(cache_dir) if cache_dir is not None else None
+
+    @property
+    def cache(self) -> ModelCache or None:
+        """Method to get the cache for the extracted data of the files
+
+        :return: cache
+        :rtype: [ModelCache | None]
+        """
+        return self.__cache
 
     def load_file_names(self, path: str = '') -> list:
-        """Method to get all names of the files in a special directory.
+        """Method to get all names of the files in a special directory or in a zip or tar archive.
 
-        :param path: The path to the directory which contains all files one want to load
+        :param path: The path to the directory or archive which contains all files one want to load
         :return: A list with the names of all files in it
         :rtype: list
         """
         if len(path) == 0:
-            list_of_files = os.listdir(self.__path)
+            path = self.__path
+
+        if is_archive(path):
+            list_of_files = list_archive_members(path)
         else:
             list_of_files = os.listdir(path)
 
         return list_of_files
 
+    def get_file_path(self, filename: str) -> str:
+        """Method to get the path of a file returned by load_file_names, which can be passed to load_file
+
+        :param str filename: The name of the file
+        :return: doc_path
+        :rtype: str
+        """
+        return join_file_path(self.__path, filename)
+
     @staticmethod
-    def load_file(doc_path: str) -> dict:
+    def load_file(doc_path: str, profile: str = None, element_types: list = None,
+                  relationship_types: list = None) -> dict:
         """Method to load one specific file
 
-        :param doc_path: The path to the file one want to load
+        :param doc_path: The path to the file one want to load (can be gzip compressed or in an archive)
+            or its content as bytes, see open_file
+        :param str profile: The loading profile ('global' | 'views'), subtrees the profile doesn't need are dropped
+            while parsing (None = load the complete document)
+        :param list element_types: The element types (or ArchiMate layers) of the elements to load (None = all),
+            the other elements and their relationships are dropped while parsing
+        :param list relationship_types: The relationship types of the relationships to load (None = all)
         :return: An ordered dictionary with all xml elements in it
         :rtype: dict
         """
+        skipped_subtrees = set(SKIPPED_SUBTREES[profile]) if profile is not None else set()
+        allowed_element_types = DataLoader.expand_element_types(element_types)
+        allowed_relationship_types = set(relationship_types) if relationship_types is not None else None
+        # ids of the dropped elements (the elements are located before the relationships in an exchange file)
+        dropped_elements_ids = set()
+
+        def postprocessor(path, key, value):
+            # drop every subtree the profile doesn't need as soon as it is parsed
+            if key in skipped_subtrees:
+                return None
+            # drop the elements and relationships the type filters exclude
+            if key == 'element' and allowed_element_types is not None and \
+                    value.get('@xsi:type') not in allowed_element_types:
+                dropped_elements_ids.add(value.get('@identifier'))
+                return None
+            if key == 'relationship' and \
+                    (allowed_relationship_types is not None and value.get('@xsi:type') not in allowed_relationship_types
+                     or value.get('@source') in dropped_elements_ids or value.get('@target') in dropped_elements_ids):
+                return None
+            return key, value
+
+        if len(skipped_subtrees) == 0 and allowed_element_types is None and allowed_relationship_types is None:
+            postprocessor = None
+
         # open the file
-        with open(doc_path, encoding='utf-8') as file:
+        with open_file(doc_path) as file:
             # convert xml document into dict
-            doc = xmltodict.parse(file.read(), encoding='utf-8')
+            doc = xmltodict.parse(file, encoding='utf-8', postprocessor=postprocessor)
 
         return doc
 
+    @staticmethod
+    def iterparse_file(doc_path: str, profile: str = None, element_types: list = None,
+                       relationship_types: list = None) -> dict:
+        """Method to load one specific file with an incremental parser. Instead of building a dict for the whole
+        document only the attributes the graphs need are collected into flat lists, out of which the DataFrames are
+        created once.
+
+        :param doc_path: The path to the file one want to load (can be gzip compressed or in an archive)
+            or its content as bytes, see open_file
+        :param str profile: The loading profile ('global' | 'views'). With 'global' the views are skipped, with
+            'views' only the nodes and edges the views can reference are kept (None = everything)
+        :param list element_types: The element types (or ArchiMate layers) of the elements to load (None = all),
+            the other elements and their relationships are skipped while parsing
+        :param list relationship_types: The relationship types of the relationships to load (None = all)
+        :return: A dict with the nodes (label|type) and edges (source|target|type) of the model and a list of
+            its views (name|nodes|edges)
+        :rtype: dict
+        """
+        # flat columns for the nodes and edges of the model
+        nodes_ids, nodes_labels, nodes_types = [], [], []
+        edges_ids, edges_sources, edges_targets, edges_types = [], [], [], []
+        views = []
+
+        allowed_element_types = DataLoader.expand_element_types(element_types)
+        allowed_relationship_types = set(relationship_types) if relationship_types is not None else None
+        dropped_elements_ids = set()
+
+        skipped_subtrees = SKIPPED_SUBTREES[profile] if profile is not None else []
+        handled_tags = ['element', 'relationship'] + (['view'] if 'view' not in skipped_subtrees else [])
+        with open_file(doc_path) as file:
+            context = etree.iterparse(file, events=('end',),
+                                      tag=['{*}' + tag for tag in handled_tags + skipped_subtrees])
+            for event, element in context:
+                tag = etree.QName(element).localname
+                if tag in skipped_subtrees:
+                    # free the subtree right away, it is never read
+                    element.clear()
+                    continue
+                elif tag == 'element':
+                    if allowed_element_types is not None and element.get(XSI_TYPE) not in allowed_element_types:
+                        dropped_elements_ids.add(element.get('identifier'))
+                    else:
+                        nodes_ids.append(element.get('identifier'))
+                        nodes_types.append(element.get(XSI_TYPE))
+                        nodes_labels.append(element.findtext('{*}name'))
+                elif tag == 'relationship':
+                    if not (allowed_relationship_types is not None and
+                            element.get(XSI_TYPE) not in allowed_relationship_types or
+                            element.get('source') in dropped_elements_ids or
+                            element.get('target') in dropped_elements_ids):
+                        edges_ids.append(element.get('identifier'))
+                        edges_sources.append(element.get('source'))
+                        edges_targets.append(element.get('target'))
+                        edges_types.append(element.get(XSI_TYPE))
+                else:
+                    views.append({'name': element.findtext('{*}name'),
+                                  'nodes': DataLoader.__get_view_element_nodes(element),
+                                  'edges': [connection.get('relationshipRef')
+                                            for connection in element.iterfind('{*}connection')]})
+                # free the handled element and its already handled siblings
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+            del context
+
+        # the labels and ids are interned and the types are stored as categories (see StringTable)
+        nodes = compact_nodes(pd.DataFrame({'label': nodes_labels, 'type': nodes_types},
+                                           index=pd.Index(nodes_ids, dtype=object), columns=['label', 'type'],
+                                           dtype=object))
+        edges = compact_edges(pd.DataFrame({'source': edges_sources, 'target': edges_targets, 'type': edges_types},
+                                           index=pd.Index(edges_ids, dtype=object),
+                                           columns=['source', 'target', 'type'], dtype=object))
+
+        if profile == 'views':
+            # keep only the nodes which are drawn in a view and the edges which can be part of a view
+            # (drawn in a view or between two drawn nodes)
+            view_nodes_ids = set()
+            view_edges_ids = set()
+            for view in views:
+                view_nodes_ids.update(view['nodes'])
+                view_edges_ids.update(view['edges'])
+            nodes = nodes[nodes.index.isin(view_nodes_ids)]
+            edges = edges[edges.index.isin(view_edges_ids) |
+                          (edges['source'].isin(view_nodes_ids) & edges['target'].isin(view_nodes_ids))]
+
+        return {'nodes': nodes, 'edges': edges, 'views': views}
+
     @staticmethod
     def get_all_nodes(doc: dict) -> pd.DataFrame:
         """Method to extract all nodes out of an xml/ArchiMate file.
@@ -48,7 +227,7 @@ class DataLoader:
         :rtype: pd.DataFrame
         """
         # get all nodes out of the xml document (list of dicts)
-        xml_nodes = doc['model']['elements']['element']
+        xml_nodes = DataLoader.__get_model_objects(doc, 'elements', 'element')
 
         nodes = pd.DataFrame(columns=['label', 'type'])
 
@@ -61,7 +240,7 @@ class DataLoader:
             # append 'node' to 'nodes'
             nodes.loc[node_id] = [node_label, node_type]
 
-        return nodes
+        return compact_nodes(nodes)
 
     @staticmethod
     def get_all_edges(doc: dict) -> pd.DataFrame:
@@ -72,7 +251,7 @@ class DataLoader:
         :rtype: pd.DataFrame
         """
         # get all edges out of the xml document (list of dicts)
-        xml_edges = doc['model']['relationships']['relationship']
+        xml_edges = DataLoader.__get_model_objects(doc, 'relationships', 'relationship')
 
         edges = pd.DataFrame(columns=['source', 'target', 'type'])
 
@@ -86,7 +265,7 @@ class DataLoader:
             # append 'edge' to 'edges'
             edges.loc[edge_id] = [edge_source, edge_target, edge_type]
 
-        return edges
+        return compact_edges(edges)
 
     def get_view_nodes(self, view: collections.OrderedDict) -> dict:
         """Method to get global ids of all nodes of a viewpoint out of xml document
@@ -150,7 +329,8 @@ class DataLoader:
         """
         graph_views = doc['model']['views']['diagrams']['view']
 
-        return graph_views
+        # if there is only one view, xmltodict doesn't create a list
+        return DataLoader.__as_list(graph_views)
 
     @staticmethod
     def get_view_edges(view: collections.OrderedDict) -> list:
@@ -186,96 +366,261 @@ class DataLoader:
             return []
 
     @staticmethod
-    def get_all_view_nodes_objects(doc: dict, view_nodes: dict) -> pd.DataFrame:
+    def build_document_index(doc: dict) -> dict:
+        """Method to build the index of an xml document which is used to get the nodes and edges of its viewpoints
+        by hash lookups instead of scanning all elements and relationships for every viewpoint.
+
+        :param dict doc: The dict object of the xml file of the current input model
+        :return: index (nodes: id -> position, edges: id -> position, sources/targets: node id -> positions of
+            its outgoing/incoming edges, edges_sources/edges_targets: source/target of the edge at every position)
+        :rtype: dict
+        """
+        model_nodes = DataLoader.__get_model_objects(doc, 'elements', 'element')
+        model_edges = DataLoader.__get_model_objects(doc, 'relationships', 'relationship')
+
+        return DataLoader.__build_index([node['@identifier'] for node in model_nodes],
+                                        [edge['@identifier'] for edge in model_edges],
+                                        [edge['@source'] for edge in model_edges],
+                                        [edge['@target'] for edge in model_edges])
+
+    @staticmethod
+    def build_table_index(nodes: pd.DataFrame, edges: pd.DataFrame) -> dict:
+        """Method to build the same index as build_document_index for the nodes and edges tables of a model
+
+        :param pd.DataFrame nodes: The nodes of the complete input model (label|type)
+        :param pd.DataFrame edges: The edges of the complete input model (source|target|type)
+        :return: index
+        :rtype: dict
+        """
+        return DataLoader.__build_index(list(nodes.index), list(edges.index), list(edges['source']),
+                                        list(edges['target']))
+
+    @staticmethod
+    def get_all_view_nodes_objects(doc: dict, view_nodes: dict, index: dict = None) -> pd.DataFrame:
         """Method to get all nodes of a viewpoint out of xml document
 
         :param dict doc: The dict object of the xml file of the current input model
-        :param list nodes_ids: List of all node ids which are part of the viewpoint
+        :param dict view_nodes: Set of all nodes which are part of the viewpoint
+        :param dict index: The index of 'doc' (see build_document_index), will be built if not given
         :return: nodes
         :rtype: pd.DataFrame
         """
-        # initialize the DataFrame for the nodes
-        nodes = pd.DataFrame(columns=['label', 'type'])
-
-        nodes_ids = list(view_nodes.keys())
+        if index is None:
+            index = DataLoader.build_document_index(doc)
         # get all nodes of the complete input model
-        model_nodes = doc['model']['elements']['element']
-
-        # iterate over all nodes in 'model_nodes'
-        for i in range(0, len(model_nodes)):
-            # get the node id of the current node
-            node_id = model_nodes[i]['@identifier']
+        model_nodes = DataLoader.__get_model_objects(doc, 'elements', 'element')
 
-            # check if the node id of the current node is in the list of node ids of the viewpoint ('nodes_ids')
-            if node_id in nodes_ids:
-                # get label and type of the current node
-                node_label = model_nodes[i]['name']['#text']
-                node_type = model_nodes[i]['@xsi:type']
+        nodes_ids, nodes_labels, nodes_types = [], [], []
+        # resolve the nodes of the viewpoint in the order of the input model
+        for position in DataLoader.get_view_nodes_positions(index, view_nodes):
+            nodes_ids.append(model_nodes[position]['@identifier'])
+            nodes_labels.append(model_nodes[position]['name']['#text'])
+            nodes_types.append(model_nodes[position]['@xsi:type'])
 
-                # append the current node to 'nodes'
-                nodes.loc[node_id] = [node_label, node_type]
-
-        return nodes
+        return compact_nodes(pd.DataFrame({'label': nodes_labels, 'type': nodes_types},
+                                          index=pd.Index(nodes_ids, dtype=object), columns=['label', 'type'],
+                                          dtype=object))
 
     @staticmethod
-    def get_all_view_edges_objects(doc: dict, edges_ids: list, view_nodes: dict) -> pd.DataFrame:
+    def get_all_view_edges_objects(doc: dict, edges_ids: list, view_nodes: dict, index: dict = None) -> pd.DataFrame:
         """Method to get all edges of a viewpoint out of xml document
 
         :param dict doc: The dict object of the xml file of the current input model
         :param dict view_nodes: Set of all nodes which are part of the viewpoint
         :param list edges_ids: List of all edge ids which are part of the viewpoint
+        :param dict index: The index of 'doc' (see build_document_index), will be built if not given
         :return: edges_objects
         :rtype: pd.DataFrame
         """
-        # initialize the DataFrame for the edges_objects
-        edges_objects = pd.DataFrame(columns=['source', 'target', 'type'])
-
+        if index is None:
+            index = DataLoader.build_document_index(doc)
         # get all edges_objects of the complete input model
-        model_edges = doc['model']['relationships']['relationship']
-
-        nodes_ids = list(view_nodes.keys())
-
-        # iterate over all edges_objects in 'model_edges'
-        for i in range(0, len(model_edges)):
-            # get the node id of the current edge
-            edge_id = model_edges[i]['@identifier']
-            # get source and target node of the current edge
-            edge_source = model_edges[i]['@source']
-            edge_target = model_edges[i]['@target']
-            # get the type of the current edge
-            edge_type = model_edges[i]['@xsi:type']
-
-            # check if 'edge_id' is in 'edges_ids'
-            if edge_id in edges_ids:
-                # add edge to 'edges_objects'
-                edges_objects.loc[edge_id] = [edge_source, edge_target, edge_type]
-
-            # check if 'nodes_ids' contains 'edge_source'
-            elif edge_source in nodes_ids:
-                # get children of the 'edge_source'
-                source_node_children = view_nodes[edge_source]
-                # check if 'source_node_children' contains 'edge_target'
-                # this is the case if target node is nested in source node
-                if edge_target in source_node_children:
-                    # add edge to 'edges_objects'
-                    edges_objects.loc[edge_id] = [edge_source, edge_target, edge_type]
-
-            # check the reverse case form above
-            # check if 'nodes_ids' contains 'edge_target'
-            elif edge_target in nodes_ids:
-                # get children of the 'edge_target'
-                target_node_children = view_nodes[edge_target]
-                # check if 'target_node_children' contains 'edge_source'
-                # this is the case if source node is nested in target node
-                if edge_source in target_node_children:
-                    # add edge to 'edges_objects'
-                    edges_objects.loc[edge_id] = [edge_source, edge_target, edge_type]
+        model_edges = DataLoader.__get_model_objects(doc, 'relationships', 'relationship')
 
-            else:
-                # continue with the next edge
-                continue
+        edges_ids_list, edges_sources, edges_targets, edges_types = [], [], [], []
+        # resolve the edges of the viewpoint in the order of the input model
+        for position in DataLoader.get_view_edges_positions(index, edges_ids, view_nodes):
+            edges_ids_list.append(model_edges[position]['@identifier'])
+            edges_sources.append(model_edges[position]['@source'])
+            edges_targets.append(model_edges[position]['@target'])
+            edges_types.append(model_edges[position]['@xsi:type'])
+
+        return compact_edges(pd.DataFrame({'source': edges_sources, 'target': edges_targets, 'type': edges_types},
+                                          index=pd.Index(edges_ids_list, dtype=object),
+                                          columns=['source', 'target', 'type'], dtype=object))
+
+    @staticmethod
+    def get_view_nodes_frame(nodes: pd.DataFrame, view_nodes: dict, index: dict = None) -> pd.DataFrame:
+        """Method to get all nodes of a viewpoint out of the nodes of the complete input model
+
+        :param pd.DataFrame nodes: The nodes of the complete input model (label|type)
+        :param dict view_nodes: Set of all nodes which are part of the viewpoint
+        :param dict index: The index of the model (see build_table_index), will be built if not given
+        :return: nodes
+        :rtype: pd.DataFrame
+        """
+        if index is None:
+            return nodes[nodes.index.isin(list(view_nodes.keys()))]
+
+        return nodes.iloc[DataLoader.get_view_nodes_positions(index, view_nodes)]
 
-        return edges_objects
+    @staticmethod
+    def get_view_edges_frame(edges: pd.DataFrame, edges_ids: list, view_nodes: dict,
+                             index: dict = None) -> pd.DataFrame:
+        """Method to get all edges of a viewpoint out of the edges of the complete input model. Same rules as in
+        get_all_view_edges_objects: an edge is part of the viewpoint if it is drawn in the viewpoint or if one of its
+        nodes is nested in the other one.
+
+        :param pd.DataFrame edges: The edges of the complete input model (source|target|type)
+        :param list edges_ids: List of all edge ids which are part of the viewpoint
+        :param dict view_nodes: Set of all nodes which are part of the viewpoint
+        :param dict index: The index of the model (see build_table_index), will be built if not given
+        :return: edges
+        :rtype: pd.DataFrame
+        """
+        if index is None:
+            index = DataLoader.__build_index([], list(edges.index), list(edges['source']), list(edges['target']))
+
+        return edges.iloc[DataLoader.get_view_edges_positions(index, edges_ids, view_nodes)]
+
+    @staticmethod
+    def __build_index(nodes_ids: list, edges_ids: list, edges_sources: list, edges_targets: list) -> dict:
+        """Method to build the index of a model out of the ids of its nodes and the ids, sources and targets
+        of its edges
+
+        :return: index
+        :rtype: dict
+        """
+        index = {'nodes': {}, 'edges': {}, 'sources': {}, 'targets': {}, 'edges_sources': edges_sources,
+                 'edges_targets': edges_targets}
+        for position, node_id in enumerate(nodes_ids):
+            index['nodes'].setdefault(node_id, position)
+        for position, edge_id in enumerate(edges_ids):
+            index['edges'].setdefault(edge_id, position)
+            index['sources'].setdefault(edges_sources[position], []).append(position)
+            index['targets'].setdefault(edges_targets[position], []).append(position)
+
+        return index
+
+    @staticmethod
+    def get_view_nodes_positions(index: dict, view_nodes: dict) -> list:
+        """Method to get the positions of all nodes of a viewpoint in the model
+
+        :param dict index: The index of the model (see build_document_index and build_table_index)
+        :param dict view_nodes: Set of all nodes which are part of the viewpoint
+        :return: positions (ascending)
+        :rtype: list
+        """
+        return sorted(index['nodes'][node_id] for node_id in view_nodes if node_id in index['nodes'])
+
+    @staticmethod
+    def get_view_edges_positions(index: dict, edges_ids: list, view_nodes: dict) -> list:
+        """Method to get the positions of all edges of a viewpoint in the model. An edge is part of the viewpoint
+        if it is drawn in the viewpoint or if its target is nested in its source (or the other way round).
+
+        :param dict index: The index of the model (see build_document_index and build_table_index)
+        :param list edges_ids: List of all edge ids which are part of the viewpoint
+        :param dict view_nodes: Set of all nodes which are part of the viewpoint
+        :return: positions (ascending)
+        :rtype: list
+        """
+        edges_sources = index['edges_sources']
+        edges_targets = index['edges_targets']
+        positions = set()
+
+        # all edges which are drawn in the viewpoint
+        for edge_id in edges_ids:
+            if edge_id in index['edges']:
+                positions.add(index['edges'][edge_id])
+
+        for node_id, node_children in view_nodes.items():
+            # all edges whose target node is nested in their source node
+            for position in index['sources'].get(node_id, []):
+                if edges_targets[position] in node_children:
+                    positions.add(position)
+            # all edges whose source node is nested in their target node
+            # (only if the source node isn't part of the viewpoint, then the check above decides)
+            for position in index['targets'].get(node_id, []):
+                if edges_sources[position] not in view_nodes and edges_sources[position] in node_children:
+                    positions.add(position)
+
+        return sorted(positions)
+
+    @staticmethod
+    def expand_element_types(element_types: list) -> set:
+        """Method to get the set of element types of an element type filter, the names of ArchiMate layers
+        (see ARCHIMATE_LAYERS) are replaced by the element types of the layer
+
+        :param list element_types: The element types and/or layer names (None = no filter)
+        :return: element_types (None = no filter)
+        :rtype: set
+        """
+        if element_types is None:
+            return None
+
+        expanded_element_types = set()
+        for element_type in element_types:
+            expanded_element_types.update(ARCHIMATE_LAYERS.get(str(element_type).lower(), [element_type]))
+
+        return expanded_element_types
+
+    @staticmethod
+    def __get_model_objects(doc: dict, collection: str, tag: str) -> list:
+        """Method to get the elements or relationships of an xml document as a list (a collection can be empty
+        after the type filters of load_file dropped all of its objects)
+
+        :param dict doc: The dict object of the xml file of the current input model
+        :param str collection: The collection ('elements' | 'relationships')
+        :param str tag: The tag of the objects in the collection ('element' | 'relationship')
+        :return: objects
+        :rtype: list
+        """
+        objects = doc['model'].get(collection)
+        if objects is None or objects.get(tag) is None:
+            return []
+
+        return DataLoader.__as_list(objects[tag])
+
+    @staticmethod
+    def __as_list(objects) -> list:
+        """Method to get a list of xml objects. If there is only one object, xmltodict doesn't create a list.
+
+        :param objects: A single object or a list of objects
+        :return: objects
+        :rtype: list
+        """
+        if isinstance(objects, list):
+            return objects
+        return [objects]
+
+    @staticmethod
+    def __get_view_element_nodes(view: etree.Element) -> dict:
+        """Method to get global ids of all nodes of a parsed view element (and the ids of their encapsulated nodes).
+        Counterpart of get_view_nodes for the incremental parser.
+
+        :param etree.Element view: The view element
+        :return: view_nodes as key:value (key = global id of node, value = list of the ids of the encapsulated nodes)
+        :rtype: dict
+        """
+        view_nodes = {}
+        unhandled_nodes = list(view.iterfind('{*}node'))
+
+        while len(unhandled_nodes) > 0:
+            current_node = unhandled_nodes.pop(0)
+            current_node_children = list(current_node.iterfind('{*}node'))
+
+            if current_node.get(XSI_TYPE) == 'Label':
+                # label nodes are ignored
+                continue
+            elif current_node.get(XSI_TYPE) == 'Container':
+                # the container node itself is ignored, only its children are handled
+                unhandled_nodes += current_node_children
+            else:
+                unhandled_nodes += current_node_children
+                # ignore all children which are from type 'label' or 'container'
+                view_nodes[current_node.get('elementRef')] = [child.get('elementRef') for child in current_node_children
+                                                              if child.get('elementRef') is not None]
+        return view_nodes
 
     @staticmethod
     def __get_node_object(nodes: list, node_id: str) -> list:
@@ -0,0 +1,118 @@
+import os
+import hashlib
+import pickle
+import tempfile
+from core.loader.utils_data_loader import open_file
+
+# version of the extracted data; has to be increased whenever the loader or the layout of the entries changes
+LOADER_VERSION = '4'
+
+
+class ModelCache:
+
+    def __init__(self, cache_dir: str) -> None:
+        """Constructor
+
+        :param str cache_dir: The directory where the extracted data of the input models is stored
+        """
+        self.__cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> str:
+        """Method to get the cache directory
+
+        :return: cache_dir
+        :rtype: str
+        """
+        return self.__cache_dir
+
+    @staticmethod
+    def compute_file_hash(doc_path: str) -> str:
+        """Method to compute the hash of the (decompressed) content of a file
+
+        :param str doc_path: The path to the file (see open_file)
+        :return: file_hash (sha256 as hex string)
+        :rtype: str
+        """
+        file_hash = hashlib.sha256()
+        with open_file(doc_path) as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def get_filtered_kind(kind: str, element_types: list = None, relationship_types: list = None) -> str:
+        """Method to get the kind of extracted data which was loaded with type filters, so differently filtered
+        entries of the same file don't overwrite each other
+
+        :param str kind: The kind of extracted data ('graph', 'views', 'view-names' or the kind of a view, see
+            get_view_kind)
+        :param list element_types: The element types the data was loaded with, with the layer names already replaced
+            by their element types (see DataLoader.expand_element_types), so equal filters share their entries
+            (None = all)
+        :param list relationship_types: The relationship types the data was loaded with (None = all)
+        :return: kind
+        :rtype: str
+        """
+        if element_types is None and relationship_types is None:
+            return kind
+
+        filters = [sorted(set(types)) if types is not None else None
+                   for types in [element_types, relationship_types]]
+        return kind + '-' + hashlib.sha256(repr(filters).encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def get_view_kind(view_name: str) -> str:
+        """Method to get the kind of the extracted data of a single view, the name of the view is hashed, so it can
+        contain any character
+
+        :param str view_name: The name of the view
+        :return: kind
+        :rtype: str
+        """
+        return 'view-' + hashlib.sha256(view_name.encode('utf-8')).hexdigest()[:16]
+
+    def get_entry_path(self, file_hash: str, kind: str) -> str:
+        """Method to get the path of a cache entry
+
+        :param str file_hash: The hash of the content of the input file
+        :param str kind: The kind of extracted data ('graph', 'views', ..., see get_filtered_kind)
+        :return: entry_path
+        :rtype: str
+        """
+        return os.path.join(self.__cache_dir, file_hash + '-' + LOADER_VERSION + '-' + kind + '.pickle')
+
+    def load(self, file_hash: str, kind: str) -> dict or None:
+        """Method to load the extracted data of an input file
+
+        :param str file_hash: The hash of the content of the input file
+        :param str kind: The kind of extracted data ('graph', 'views', ..., see get_filtered_kind)
+        :return: If the entry exists: entry, Else: None
+        :rtype: [dict | None]
+        """
+        try:
+            with open(self.get_entry_path(file_hash, kind), 'rb') as file:
+                return pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def save(self, file_hash: str, kind: str, entry: dict) -> None:
+        """Method to save the extracted data of an input file
+
+        :param str file_hash: The hash of the content of the input file
+        :param str kind: The kind of extracted data ('graph', 'views', ..., see get_filtered_kind)
+        :param dict entry: The extracted data
+        """
+        # write into a temporary file first, so parallel loaders never read a half written entry
+        handle, tmp_path = tempfile.mkstemp(dir=self.__cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.get_entry_path(file_hash, kind))
+        except BaseException:
+            # don't leave the temporary file of a failed write in the cache directory
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,200 @@
+from lxml import etree
+from core.loader.data_loader import XSI_TYPE
+from core.loader.utils_data_loader import open_file, map_files, Executor
+
+# how a run handles invalid input files ('skip' = leave them out, 'abort' = raise a ModelValidationError)
+ON_INVALID_OPTIONS = ['skip', 'abort']
+
+
+class ModelValidationError(Exception):
+
+    def __init__(self, problems: dict) -> None:
+        """Constructor
+
+        :param dict problems: The problems of all invalid files (key = path of the file, value = list of problems)
+        """
+        self.__problems = problems
+        super().__init__('\n'.join(doc_path + ': ' + problem for doc_path, file_problems in problems.items()
+                                   for problem in file_problems))
+
+    @property
+    def problems(self) -> dict:
+        """Method to get the problems of all invalid files
+
+        :return: problems
+        :rtype: dict
+        """
+        return self.__problems
+
+
+def validate_file(doc_path: str, profile: str = None) -> list:
+    """Method to check if a file contains all structures the DataLoader relies on.
+    Top-level function so it can be sent to worker processes.
+
+    :param str doc_path: The path to the file (see open_file)
+    :param str profile: The loading profile ('global' | 'views'), with 'global' the views aren't checked
+        (None = check everything)
+    :return: A list with a description of every problem (empty if the file is valid)
+    :rtype: list
+    """
+    problems = []
+    elements_ids = set()
+    relationships = []
+    views_count = 0
+    check_views = profile != 'global'
+
+    try:
+        with open_file(doc_path) as file:
+            context = etree.iterparse(file, events=('end',), tag=['{*}element', '{*}relationship', '{*}view'])
+            for event, element in context:
+                tag = etree.QName(element).localname
+                if tag == 'element':
+                    elements_ids.add(element.get('identifier'))
+                    problems += _check_identified_object('element', element, ['identifier', XSI_TYPE])
+                    problems += _check_name('element', element)
+                elif tag == 'relationship':
+                    # keep the source and target to check them when all elements are known
+                    relationships.append((element.get('identifier'), element.get('source'), element.get('target')))
+                    problems += _check_identified_object('relationship', element,
+                                                         ['identifier', 'source', 'target', XSI_TYPE])
+                else:
+                    views_count += 1
+                    if check_views:
+                        problems += _check_name('view', element)
+                        problems += _check_view_content(element)
+                element.clear()
+            root_tag = etree.QName(context.root).localname
+            del context
+    except (etree.XMLSyntaxError, OSError, EOFError) as error:
+        problems.append('file can\'t be read: ' + str(error))
+        return problems
+
+    if root_tag != 'model':
+        problems.append('root element is \'' + root_tag + '\' instead of \'model\'')
+
+    # relationships can connect elements and other relationships
+    relationships_ids = set(relationship[0] for relationship in relationships)
+    for relationship_id, source, target in relationships:
+        for attribute, reference in [('source', source), ('target', target)]:
+            if reference is not None and reference not in elements_ids and reference not in relationships_ids:
+                problems.append('relationship \'' + str(relationship_id) + '\': ' + attribute + ' \'' + reference +
+                                '\' doesn\'t exist')
+
+    if check_views and profile is not None and views_count == 0:
+        problems.append('model has no views')
+
+    return problems
+
+
+def validate_files(doc_paths: list, profile: str = None, jobs: int = 1, executor: Executor = None) -> dict:
+    """Method to check all files in parallel (see validate_file)
+
+    :param list doc_paths: The paths of all files
+    :param str profile: The loading profile ('global' | 'views')
+    :param int jobs: Number of worker processes (1 = serial, None = number of processors)
+    :param Executor executor: Executor to use instead of a new process pool
+    :return: The problems of all invalid files (key = path of the file, value = list of problems)
+    :rtype: dict
+    """
+    problems = map_files(validate_file, doc_paths, jobs, executor, profile=profile)
+
+    return {doc_path: file_problems for doc_path, file_problems in zip(doc_paths, problems) if len(file_problems) > 0}
+
+
+def check_files(filenames: list, doc_paths: list, on_invalid: str = None, profile: str = None, jobs: int = 1,
+                executor: Executor = None) -> tuple:
+    """Method to run the pre-flight check of the input files before they are loaded
+
+    :param list filenames: The names of all files
+    :param list doc_paths: The paths of all files (in the order of 'filenames')
+    :param str on_invalid: How invalid files are handled (None = no check, 'skip' = print their problems and leave
+        them out, 'abort' = raise a ModelValidationError with the problems of all invalid files)
+    :param str profile: The loading profile ('global' | 'views')
+    :param int jobs: Number of worker processes (1 = serial, None = number of processors)
+    :param Executor executor: Executor to use instead of a new process pool
+    :return: (filenames, doc_paths) of all valid files
+    :rtype: tuple
+    """
+    if on_invalid is None:
+        return filenames, doc_paths
+    if on_invalid not in ON_INVALID_OPTIONS:
+        raise ValueError('on_invalid has to be one of ' + str(ON_INVALID_OPTIONS) + ', not \'' + str(on_invalid) + '\'')
+
+    problems = validate_files(doc_paths, profile, jobs, executor)
+    if len(problems) > 0 and on_invalid == 'abort':
+        raise ModelValidationError(problems)
+
+    valid_filenames, valid_doc_paths = [], []
+    for filename, doc_path in zip(filenames, doc_paths):
+        if doc_path in problems:
+            for problem in problems[doc_path]:
+                print('Skipping \'' + doc_path + '\': ' + problem)
+            continue
+        valid_filenames.append(filename)
+        valid_doc_paths.append(doc_path)
+
+    return valid_filenames, valid_doc_paths
+
+
+def _check_identified_object(kind: str, element: etree.Element, attributes: list) -> list:
+    """Method to check if an element or relationship has all attributes the loader reads
+
+    :param str kind: The kind of the object ('element' | 'relationship')
+    :param etree.Element element: The parsed object
+    :param list attributes: The names of the required attributes
+    :return: problems
+    :rtype: list
+    """
+    problems = []
+    for attribute in attributes:
+        if element.get(attribute) is None:
+            name = 'xsi:type' if attribute == XSI_TYPE else attribute
+            problems.append(kind + ' \'' + str(element.get('identifier')) + '\': missing attribute \'' + name + '\'')
+
+    return problems
+
+
+def _check_name(kind: str, element: etree.Element) -> list:
+    """Method to check if an element or view has exactly one name with a text and an attribute (like xml:lang),
+    which is parsed into {'@xml:lang': ..., '#text': ...} by xmltodict
+
+    :param str kind: The kind of the object ('element' | 'view')
+    :param etree.Element element: The parsed object
+    :return: problems
+    :rtype: list
+    """
+    names = element.findall('{*}name')
+    prefix = kind + ' \'' + str(element.get('identifier')) + '\': '
+    if len(names) == 0:
+        return [prefix + 'missing name']
+    elif len(names) > 1:
+        return [prefix + 'more than one name']
+    elif names[0].text is None or len(names[0].text.strip()) == 0:
+        return [prefix + 'empty name']
+    elif len(names[0].attrib) == 0:
+        return [prefix + 'name without attributes (e.g. xml:lang)']
+
+    return []
+
+
+def _check_view_content(view: etree.Element) -> list:
+    """Method to check if the nodes and connections of a view have all attributes the loader reads
+
+    :param etree.Element view: The parsed view
+    :return: problems
+    :rtype: list
+    """
+    problems = []
+    prefix = 'view \'' + str(view.get('identifier')) + '\': '
+    for node in view.iter('{*}node'):
+        node_type = node.get(XSI_TYPE)
+        if node_type is None:
+            problems.append(prefix + 'node \'' + str(node.get('identifier')) + '\': missing attribute \'xsi:type\'')
+        elif node_type not in ['Label', 'Container'] and node.get('elementRef') is None:
+            problems.append(prefix + 'node \'' + str(node.get('identifier')) + '\': missing attribute \'elementRef\'')
+    for connection in view.iter('{*}connection'):
+        if connection.get('relationshipRef') is None:
+            problems.append(prefix + 'connection \'' + str(connection.get('identifier')) +
+                            '\': missing attribute \'relationshipRef\'')
+
+    return problems
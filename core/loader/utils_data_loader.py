@@ -0,0 +1,189 @@
+import os
+import io
+import contextlib
+import collections
+import functools
+import gzip
+import tarfile
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+# separator between the path of an archive and the name of a file in it (e.g. 'models.zip::model.xml')
+ARCHIVE_SEPARATOR = '::'
+# first bytes of gzip compressed content
+GZIP_MAGIC = b'\x1f\x8b'
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path: str) -> bool:
+    """Method to check if a path points to a zip or tar archive
+
+    :param str path: The path
+    :return: True|False
+    :rtype: bool
+    """
+    return path.lower().endswith(ARCHIVE_SUFFIXES) and os.path.isfile(path)
+
+
+def list_archive_members(archive_path: str) -> list:
+    """Method to get the names of all files in a zip or tar archive
+
+    :param str archive_path: The path to the archive
+    :return: A list with the names of all files (directories are left out)
+    :rtype: list
+    """
+    if archive_path.lower().endswith('.zip'):
+        with zipfile.ZipFile(archive_path) as archive:
+            return [info.filename for info in archive.infolist() if not info.is_dir()]
+    else:
+        with tarfile.open(archive_path, 'r:*') as archive:
+            return [member.name for member in archive.getmembers() if member.isfile()]
+
+
+def is_tar_member(doc_path) -> bool:
+    """Method to check if a path points to a file in a tar archive ('<archive>::<name>')
+
+    :param doc_path: The path to the file or the content of the file as bytes (see open_file)
+    :return: True|False
+    :rtype: bool
+    """
+    return isinstance(doc_path, str) and ARCHIVE_SEPARATOR in doc_path and \
+        not doc_path.split(ARCHIVE_SEPARATOR, 1)[0].lower().endswith('.zip')
+
+
+def read_tar_members(doc_paths: list):
+    """Generator which yields the paths of all files in the order of 'doc_paths', but with the files in tar archives
+    replaced by their content (bytes, see open_file). Opening a tar archive for every file means to decompress and
+    scan the archive from its start again, so every archive is read in one sequential pass instead. Files which are
+    requested in another order than the one of the archive are kept in memory until they are yielded.
+
+    :param list doc_paths: The paths of all files
+    :return: A generator of the paths or contents of all files
+    """
+    # number of requests of every file in an archive, only these files are read
+    requests = collections.Counter(tuple(doc_path.split(ARCHIVE_SEPARATOR, 1)) for doc_path in doc_paths
+                                   if is_tar_member(doc_path))
+    archives = {}
+    try:
+        for doc_path in doc_paths:
+            if not is_tar_member(doc_path):
+                yield doc_path
+                continue
+
+            archive_path, filename = doc_path.split(ARCHIVE_SEPARATOR, 1)
+            if archive_path not in archives:
+                archives[archive_path] = (tarfile.open(archive_path, 'r|*'), {})
+            archive, contents = archives[archive_path]
+            # read the archive up to the requested file
+            while filename not in contents:
+                member = archive.next()
+                if member is None:
+                    raise KeyError('filename \'' + filename + '\' not found in \'' + archive_path + '\'')
+                if member.isfile() and (archive_path, member.name) in requests:
+                    contents[member.name] = archive.extractfile(member).read()
+
+            requests[(archive_path, filename)] -= 1
+            if requests[(archive_path, filename)] == 0:
+                yield contents.pop(filename)
+            else:
+                yield contents[filename]
+    finally:
+        for archive, contents in archives.values():
+            archive.close()
+
+
+def join_file_path(path: str, filename: str) -> str:
+    """Method to build the path of a file in a directory or in an archive
+
+    :param str path: The path to the directory or archive
+    :param str filename: The name of the file
+    :return: doc_path
+    :rtype: str
+    """
+    if is_archive(path):
+        return path + ARCHIVE_SEPARATOR + filename
+    else:
+        return os.path.join(path, filename)
+
+
+def get_file_signature(doc_path: str) -> tuple:
+    """Method to get a signature of a file which changes whenever the file is changed (modification time and size).
+    Files in an archive get the signature of the archive.
+
+    :param str doc_path: The path to the file (see open_file)
+    :return: signature (None if the file doesn't exist)
+    :rtype: tuple
+    """
+    path = doc_path.split(ARCHIVE_SEPARATOR, 1)[0]
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+@contextlib.contextmanager
+def open_file(doc_path: str or bytes):
+    """Method to open a file for reading in binary mode. The file can be gzip compressed ('.gz') and can be a file
+    in a zip or tar archive ('<archive>::<name>'), in both cases it is decompressed while it is read.
+
+    :param doc_path: The path to the file or the content of the file as bytes (gzip compressed content is detected)
+    :return: A binary file object
+    """
+    with contextlib.ExitStack() as stack:
+        if isinstance(doc_path, bytes):
+            filename = '.gz' if doc_path.startswith(GZIP_MAGIC) else ''
+            file = stack.enter_context(io.BytesIO(doc_path))
+        elif ARCHIVE_SEPARATOR in doc_path:
+            archive_path, filename = doc_path.split(ARCHIVE_SEPARATOR, 1)
+            if archive_path.lower().endswith('.zip'):
+                archive = stack.enter_context(zipfile.ZipFile(archive_path))
+                file = stack.enter_context(archive.open(filename))
+            else:
+                archive = stack.enter_context(tarfile.open(archive_path, 'r:*'))
+                file = stack.enter_context(archive.extractfile(filename))
+        else:
+            filename = doc_path
+            file = stack.enter_context(open(doc_path, 'rb'))
+
+        if filename.lower().endswith('.gz'):
+            file = stack.enter_context(gzip.GzipFile(fileobj=file, mode='rb'))
+
+        yield file
+
+
+def uses_workers(jobs: int = 1, executor: Executor = None) -> bool:
+    """Method to check if map_files hands the files to an executor or a process pool instead of loading them
+    serially. The results of worker processes are unpickled copies, which don't share the strings of this process.
+
+    :param int jobs: Number of worker processes (1 = serial, None = number of processors)
+    :param Executor executor: Executor to use instead of a new process pool
+    :return: True|False
+    :rtype: bool
+    """
+    return executor is not None or jobs is None or jobs > 1
+
+
+def map_files(function, doc_paths: list, jobs: int = 1, executor: Executor = None, **kwargs) -> list:
+    """Method to apply a loader function to all files. The files are handled in parallel if more than one job
+    or an executor is given. The results are always in the order of 'doc_paths'. Files in tar archives are handed to
+    'function' as their content (see read_tar_members).
+
+    :param function: Top-level function which is called with the path of one file (and 'kwargs')
+    :param list doc_paths: The paths of all files
+    :param int jobs: Number of worker processes (1 = serial, None = number of processors)
+    :param Executor executor: Executor to use instead of a new process pool
+    :return: The results of 'function' for all files
+    :rtype: list
+    """
+    function = functools.partial(function, **kwargs)
+    doc_paths = read_tar_members(doc_paths)
+
+    if executor is not None:
+        return list(executor.map(function, doc_paths))
+    elif jobs is None or jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as process_pool:
+            return list(process_pool.map(function, doc_paths))
+    else:
+        return [function(doc_path) for doc_path in doc_paths]
@@ -0,0 +1,114 @@
+import pandas as pd
+
+
+class AdjacencyIndex:
+
+    def __init__(self, edges: pd.DataFrame) -> None:
+        """Constructor of the source->edges and target->edges indexes of a graph. The indexes are kept up to date
+        when edges are added or deleted, so they fit graphs which are changed (like the rm_graph). The edges of a
+        node are kept in the order of 'edges' (added edges are appended).
+
+        :param pd.DataFrame edges: The edges of the graph (source|target|type), the index holds the edge ids
+        """
+        self.__out_edges = {}
+        self.__in_edges = {}
+        self.__edges = {}
+        self.__edges_count = 0
+        for edge_id, source, target in zip(edges.index, edges['source'], edges['target']):
+            self.add_edge(edge_id, source, target)
+
+    def add_edge(self, edge_id: str, source: str, target: str) -> None:
+        """Method to add an edge to the indexes
+
+        :param str edge_id: The id of the edge
+        :param str source: The id of the source node
+        :param str target: The id of the target node
+        """
+        if edge_id in self.__edges:
+            self.delete_edge(edge_id)
+
+        # the sequence number keeps the order of the edges over the source and target indexes
+        self.__edges[edge_id] = (self.__edges_count, source, target)
+        self.__edges_count = self.__edges_count + 1
+        self.__out_edges.setdefault(source, []).append(edge_id)
+        self.__in_edges.setdefault(target, []).append(edge_id)
+
+    def delete_edge(self, edge_id: str) -> None:
+        """Method to delete an edge from the indexes, unknown edges are ignored
+
+        :param str edge_id: The id of the edge
+        """
+        edge = self.__edges.pop(edge_id, None)
+        if edge is None:
+            return
+
+        _, source, target = edge
+        self.__out_edges[source].remove(edge_id)
+        self.__in_edges[target].remove(edge_id)
+
+    def get_out_edges(self, node_id: str) -> list:
+        """Method to get the ids of all edges which have the node as their source
+
+        :param str node_id: The id of the node
+        :return: out_edges (edge ids)
+        :rtype: list
+        """
+        return list(self.__out_edges.get(node_id, []))
+
+    def get_in_edges(self, node_id: str) -> list:
+        """Method to get the ids of all edges which have the node as their target
+
+        :param str node_id: The id of the node
+        :return: in_edges (edge ids)
+        :rtype: list
+        """
+        return list(self.__in_edges.get(node_id, []))
+
+    def get_in_degree(self, node_id: str) -> int:
+        """Method to get the number of edges which have the node as their target
+
+        :param str node_id: The id of the node
+        :return: in_degree
+        :rtype: int
+        """
+        return len(self.__in_edges.get(node_id, []))
+
+    def get_out_degree(self, node_id: str) -> int:
+        """Method to get the number of edges which have the node as their source
+
+        :param str node_id: The id of the node
+        :return: out_degree
+        :rtype: int
+        """
+        return len(self.__out_edges.get(node_id, []))
+
+    def get_successors(self, node_id: str) -> list:
+        """Method to get the targets of all edges which have the node as their source (in the order of the edges)
+
+        :param str node_id: The id of the node
+        :return: successors (node ids)
+        :rtype: list
+        """
+        return [self.__edges[edge_id][2] for edge_id in self.__out_edges.get(node_id, [])]
+
+    def get_predecessors(self, node_id: str) -> list:
+        """Method to get the sources of all edges which have the node as their target (in the order of the edges)
+
+        :param str node_id: The id of the node
+        :return: predecessors (node ids)
+        :rtype: list
+        """
+        return [self.__edges[edge_id][1] for edge_id in self.__in_edges.get(node_id, [])]
+
+    def get_neighbours(self, node_id: str) -> list:
+        """Method to get the other node of all edges of the node (in the order of the edges)
+
+        :param str node_id: The id of the node
+        :return: neighbours (node ids)
+        :rtype: list
+        """
+        # a self loop is in both indexes, but is only counted once
+        edges_ids = set(self.__out_edges.get(node_id, [])) | set(self.__in_edges.get(node_id, []))
+        edges = sorted(self.__edges[edge_id] for edge_id in edges_ids)
+
+        return [target if source == node_id else source for _, source, target in edges]
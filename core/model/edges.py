@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 from core.model.utils_edges import compute_distinct_edges, edge_exists
+from core.model.row_buffer import RowBuffer
+from core.model.string_table import STRING_TABLE
 
 
 class Edges:
@@ -10,8 +13,12 @@ class Edges:
         :param pd.DataFrame edges: Set of all edges
         """
         self.__edges = edges
+        # added edges are collected here and appended to 'edges' when it is read
+        self.__pending_edges = RowBuffer()
         self.__distinct_edges = None
         self.__stats = None
+        # True if 'edges' is shared with a snapshot, it is copied before it is changed in place
+        self.__shared = False
 
     @property
     def edges(self) -> pd.DataFrame:
@@ -20,22 +27,65 @@ class Edges:
         :return: edges
         :rtype: pd.DataFrame
         """
+        self.flush()
         return self.__edges
 
     @edges.setter
     def edges(self, edges: pd.DataFrame) -> None:
         self.__edges = edges
+        self.__pending_edges = RowBuffer()
+        self.__shared = False
+        self.__stats = None
+
+    def flush(self) -> None:
+        """Method to append all pending edges to 'edges'
+
+        """
+        if self.__pending_edges.rows_count > 0:
+            self.__edges = self.__pending_edges.flush(self.__edges)
+            # store the types as categorical column like in the input tables
+            STRING_TABLE.categorize_types(self.__edges)
+
+    def snapshot(self) -> 'Edges':
+        """Method to get a copy of the edges, which shares 'edges' until one of both copies changes it
+
+        :return: snapshot
+        :rtype: Edges
+        """
+        self.flush()
+        snapshot = Edges(self.__edges)
+        snapshot.__distinct_edges = self.__distinct_edges
+        snapshot.__stats = self.__stats
+        snapshot.__shared = True
+        self.__shared = True
+
+        return snapshot
+
+    def __unshare(self) -> None:
+        """Method to copy 'edges' before it is changed in place, if it is shared with a snapshot
+
+        """
+        self.flush()
+        # the statistics are computed again after the change
+        self.__stats = None
+        if self.__shared is True:
+            self.__edges = self.__edges.copy()
+            self.__shared = False
 
     @property
     def distinct_edges(self) -> pd.DataFrame:
         """Method to get all distinct edges
 
-        :return: distinct_edges (index=source+target+type)
+        :return: distinct_edges (index=edge key, see compute_edge_key)
         :rtype: pd.DataFrame
         """
 
         return self.__distinct_edges
 
+    @distinct_edges.setter
+    def distinct_edges(self, distinct_edges: pd.DataFrame) -> None:
+        self.__distinct_edges = distinct_edges
+
     def initialize_distinct_edges(self, nodes: pd.DataFrame, distinct_nodes: pd.DataFrame) -> None:
         """Method to compute the distinct edges of a graph
 
@@ -53,48 +103,95 @@ class Edges:
         edge_id = edge.name
 
         # check if 'edge' already exists
-        if edge_exists(self.edges, edge_id) is False:
+        if self.edge_exists(edge_id) is False:
             edge_source_node_id = str(edge.loc['source'].name)
             edge_target_node_id = str(edge.loc['target'].name)
             edge_type = edge.loc['type']
             edge_frequency = edge.loc['frequency']
             # add edge to 'edges'
-            self.__edges.loc[edge_id] = [edge_source_node_id, edge_target_node_id, edge_type, edge_frequency]
+            self.__pending_edges.add_row(edge_id, [edge_source_node_id, edge_target_node_id, edge_type,
+                                                   edge_frequency])
+            self.__stats = None
             return True
         else:
             return False
 
-    def delete_root_edges(self) -> None:
-        """Method to delete all root edges of a graph
+    def edge_exists(self, edge_id: str) -> bool:
+        """Method to check if an edge exists (as a pending or an appended edge)
+
+        :param str edge_id: The id of the edge
+        :return: True|False
+        :rtype: bool
         """
-        root_edges = self.__edges[self.__edges['type'] == 'root_edge']
+        if self.__pending_edges.row_exists(edge_id) is True:
+            return True
 
-        root_edges_index = list(root_edges.index)
+        return edge_exists(self.__edges, edge_id)
 
-        for i in range(0, len(root_edges)):
-            current_root_edge_id = root_edges_index[i]
-            self.__edges.drop(current_root_edge_id, axis=0, inplace=True)
+    def delete_root_edges(self) -> None:
+        """Method to delete all root edges of a graph
+        """
+        self.delete_edges_where(lambda edges: edges['type'] == 'root_edge')
 
     def delete_edge(self, edge_id: str):
         """ Method to delete an edge
 
         :param str edge_id: The edge of the edge you want to delete
         """
+        self.__unshare()
         self.__edges.drop(edge_id, axis=0, inplace=True)
 
+    def delete_edges(self, edges_ids) -> pd.Index:
+        """Method to delete many edges at once (in one pass over the edges instead of one drop per edge)
+
+        :param edges_ids: The ids of the edges you want to delete, unknown ids are ignored
+        :return: deleted_edges_ids
+        :rtype: pd.Index
+        """
+        self.flush()
+        return self.__delete_edges_by_mask(self.__edges.index.isin(list(edges_ids)))
+
+    def delete_edges_where(self, predicate) -> pd.Index:
+        """Method to delete all edges which match a predicate (in one pass over the edges)
+
+        :param predicate: A function, which gets the edges (pd.DataFrame) and returns a boolean mask of the edges
+            to delete, e.g. lambda edges: edges['type'] == 'root_edge'
+        :return: deleted_edges_ids
+        :rtype: pd.Index
+        """
+        self.flush()
+        return self.__delete_edges_by_mask(np.asarray(predicate(self.__edges), dtype=bool))
+
+    def __delete_edges_by_mask(self, mask: np.ndarray) -> pd.Index:
+        """Method to delete the edges of a boolean mask. The kept edges are selected into a new frame, so a frame
+        which is shared with a snapshot isn't changed.
+
+        :param np.ndarray mask: True for every edge to delete (in the order of 'edges')
+        :return: deleted_edges_ids
+        :rtype: pd.Index
+        """
+        deleted_edges_ids = self.__edges.index[mask]
+        if len(deleted_edges_ids) > 0:
+            self.__edges = self.__edges[~mask]
+            self.__shared = False
+            self.__stats = None
+
+        return deleted_edges_ids
+
     def compute_reference_edges(self, nodes: pd.DataFrame) -> None:
         """Method to mark all edges that should be in the final rm_graph
 
         :param pd.DataFrame nodes: The set of nodes that should be in the final rm_graph
         """
 
+        self.__unshare()
         # get the number of all columns in the edges DataFrame
         number_of_columns = len(self.__edges.columns)
         # insert new column ('is_part_of_reference') into edges DataFrame with False as default entries
         self.__edges.insert(number_of_columns, 'is_part_of_reference', False)
 
-        # get a list of all node ids
-        nodes_index = list(nodes.index)
+        # get a set of all node ids
+        nodes_index = set(nodes.index)
         # get a list of all edge ids
         edges_index = list(self.edges.index)
 
@@ -121,7 +218,10 @@ class Edges:
         """
         edge_list = list(self.edges['type'])
         if self.__stats is None and (len(edge_list) > 1 and type(edge_list[0]) is not None):
-            self.__stats = self.edges.groupby('type').size()
+            stats = self.edges.groupby('type', observed=True).size()
+            # sort by type like the stats of an object column (a categorical column is grouped in the order of its
+            # categories)
+            self.__stats = stats.set_axis(stats.index.astype(object)).sort_index()
             return self.__stats
         else:
             return self.__stats
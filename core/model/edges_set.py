@@ -1,8 +1,9 @@
 import pandas as pd
-import copy
 
 from core.model.utils_edges_set import distinct_edge_exists, calculate_delete_costs, calculate_insert_costs, \
     calculate_move_costs, calculate_source_node_move_costs
+from core.model.row_buffer import RowBuffer
+from core.model.string_table import STRING_TABLE
 
 
 class EdgesSet:
@@ -14,6 +15,8 @@ class EdgesSet:
             source and target include the complete node as a pd.Series
         """
         self.__edges_set = pd.DataFrame(columns=['source', 'target', 'type', 'frequency', 'cost_value'])
+        # new distinct edges are collected here and appended to 'edges_set' when it is read
+        self.__pending_edges = RowBuffer()
 
     @property
     def edges_set(self) -> pd.DataFrame:
@@ -22,14 +25,25 @@ class EdgesSet:
         :return: edges_set
         :rtype: pd.DataFrame
         """
+        self.flush()
         return self.__edges_set
 
+    def flush(self) -> None:
+        """Method to append all pending distinct edges to 'edges_set'
+
+        """
+        if self.__pending_edges.rows_count > 0:
+            self.__edges_set = self.__pending_edges.flush(self.__edges_set)
+            # store the types as categorical column like in the input tables
+            STRING_TABLE.categorize_types(self.__edges_set)
+
     def get_most_frequent_edge(self) -> pd.Series:
         """Method to get the edge with the highest value for 'cost_value'
 
-        :return: most_frequent_edge
+        :return: most_frequent_edge (a copy of the row, the source and target nodes are shared, they aren't changed)
         :rtype: pd.Series
         """
+        self.flush()
         # get the most frequent edges according to the cost_value
         most_frequent_edges = self.__edges_set[self.__edges_set['cost_value'] == self.__edges_set['cost_value'].max()]
 
@@ -37,7 +51,7 @@ class EdgesSet:
         if len(most_frequent_edges) is 0:
             return None
         else:
-            most_frequent_edge = copy.deepcopy(most_frequent_edges.iloc[0])
+            most_frequent_edge = most_frequent_edges.iloc[0].copy()
 
             return most_frequent_edge
 
@@ -51,6 +65,7 @@ class EdgesSet:
         :param float delete_cost: The delete costs
         :param float target_node_frequency: The frequency of the target node of 'edge'
         """
+        self.flush()
         # calculate the different costs for 'edge'
         edge_frequency = float(self.__edges_set.loc[edge_id]['frequency'])
         insert_costs = float(calculate_insert_costs(target_node_frequency, insert_cost))
@@ -78,20 +93,22 @@ class EdgesSet:
 
         :param str edge_id: The index of the edge
         """
-
+        self.flush()
         self.__edges_set.drop(edge_id, axis=0, inplace=True)
 
-    def add_distinct_edge(self, distinct_edge: pd.Series) -> None:
+    def add_distinct_edge(self, distinct_edge: pd.Series, weight: int = 1) -> None:
         """Method to add a new distinct edge to the edges_set
 
         :param pd.Series distinct_edge: The edge you want to add (source|target|type|frequency|cost_value)
             source and target include the complete node as a pd.Series
+        :param int weight: The number of graphs the edge is added for (the frequency is multiplied with it)
         """
         # get the id of the distinct edge
         distinct_edge_id = distinct_edge.name
 
-        # check if 'distinct_edge' already exists in 'edges_set'
-        if distinct_edge_exists(self.__edges_set, distinct_edge_id) is False:
+        # check if 'distinct_edge' already exists in 'edges_set' (as a pending or an appended edge)
+        if self.__pending_edges.row_exists(distinct_edge_id) is False and \
+                distinct_edge_exists(self.__edges_set, distinct_edge_id) is False:
             # get source and target node of 'distinct_edge' (as pd.Series)
             distinct_edge_source_node = distinct_edge.loc['source']
             distinct_edge_target_node = distinct_edge.loc['target']
@@ -99,13 +116,23 @@ class EdgesSet:
             # get type and frequency of 'distinct_edge'
             distinct_edge_type = distinct_edge.loc['type']
             distinct_edge_frequency = distinct_edge.loc['frequency']
+            if weight != 1:
+                distinct_edge_frequency = distinct_edge_frequency * weight
 
             # insert 'distinct_edge' into 'edges_set'
-            self.__edges_set.loc[distinct_edge_id] = [distinct_edge_source_node, distinct_edge_target_node,
-                                                      distinct_edge_type, distinct_edge_frequency, None]
+            self.__pending_edges.add_row(distinct_edge_id, [distinct_edge_source_node, distinct_edge_target_node,
+                                                            distinct_edge_type, distinct_edge_frequency, None])
+        elif self.__pending_edges.row_exists(distinct_edge_id) is True:
+            distinct_edge_frequency = distinct_edge.loc['frequency']
+            frequency_position = self.__edges_set.columns.get_loc('frequency')
+            new_frequency = float(self.__pending_edges.get_value(distinct_edge_id, frequency_position)) + \
+                float(distinct_edge_frequency) * weight
+            # update the frequency of the pending 'distinct_edge'
+            self.__pending_edges.set_value(distinct_edge_id, frequency_position, new_frequency)
         else:
             distinct_edge_frequency = distinct_edge.loc['frequency']
-            new_frequency = float(self.__edges_set.loc[distinct_edge_id]['frequency']) + float(distinct_edge_frequency)
+            new_frequency = float(self.__edges_set.loc[distinct_edge_id]['frequency']) + \
+                float(distinct_edge_frequency) * weight
             # update the frequency of 'distinct_edge' in 'edges_set'
             self.__edges_set.at[distinct_edge_id, 'frequency'] = new_frequency
 
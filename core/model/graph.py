@@ -1,11 +1,12 @@
 from core.model.nodes import *
 from core.model.edges import *
 from core.model.nodes_set import NodesSet
-from core.model.utils_nodes import node_exists
-from core.model.utils_edges import edge_exists
 from core.model.nodes_clusters import *
+from core.model.adjacency_index import AdjacencyIndex
 from core.model.utils_graph import *
+from core.model.utils_keys import compute_readable_tables
 import re
+import copy
 
 CHARACTERS = (
         string.ascii_letters
@@ -26,6 +27,11 @@ class Graph:
         self.__nodes = Nodes(nodes)
         self.__edges = Edges(edges)
         self.__nodes_clusters = NodesClusters()
+        self.__adjacency_index = None
+        # the version is increased with every change of the nodes or edges, the derived data (e.g. the content hash
+        # or the nodes clusters) is computed at most once per version
+        self.__version = 0
+        self.__derived_data = {}
 
     @property
     def nodes(self) -> pd.DataFrame:
@@ -39,25 +45,104 @@ class Graph:
     @nodes.setter
     def nodes(self, nodes: pd.DataFrame) -> None:
         self.__nodes.nodes = nodes
+        self.__change()
+        self.__adjacency_index = None
+
+    @property
+    def version(self) -> int:
+        """Method to get the version of the graph, it is increased with every change of the nodes or edges by the
+        methods of the graph
+
+        :return: version
+        :rtype: int
+        """
+        return self.__version
+
+    def __change(self) -> None:
+        """Method to increase the version after the nodes or edges were changed, the derived data of the previous
+        version is dropped
+
+        """
+        self.__version = self.__version + 1
+        self.__derived_data = {}
+
+    def _before_change(self) -> None:
+        """Method which is called by every method of the graph before it changes the nodes or edges, subclasses
+        which share their nodes and edges with other graphs can override it to copy them on the first change
+
+        """
+        pass
+
+    def __get_derived_data(self, name: str, compute):
+        """Method to get data which is derived from the nodes and edges. It is computed on the first access and
+        kept until the nodes or edges are changed (see version).
+
+        :param str name: The name of the derived data
+        :param compute: A function without parameters, which computes the derived data
+        :return: derived_data
+        """
+        if name not in self.__derived_data:
+            self.__derived_data[name] = compute()
+
+        return self.__derived_data[name]
 
     @property
     def distinct_nodes(self) -> pd.DataFrame:
         """Method to get all distinct nodes of a graph
 
-        :return: distinct_nodes in the format index|label|type (index=label+type)
+        :return: distinct_nodes in the format index|label|type (index=node key, see compute_node_key), None if they
+            weren't initialized for the current version of the graph
         :rtype: pd.DataFrame
         """
-        return self.__nodes.distinct_nodes
+        return self.__derived_data.get('distinct_nodes')
+
+    @distinct_nodes.setter
+    def distinct_nodes(self, distinct_nodes: pd.DataFrame) -> None:
+        self.__set_derived_data('distinct_nodes', distinct_nodes)
+
+    def __set_derived_data(self, name: str, derived_data) -> None:
+        """Method to set derived data, which was computed outside of the graph (e.g. loaded from the cache), for
+        the current version
+
+        :param str name: The name of the derived data
+        :param derived_data: The derived data (None = not computed)
+        """
+        if derived_data is None:
+            self.__derived_data.pop(name, None)
+        else:
+            self.__derived_data[name] = derived_data
 
     @property
     def nodes_clusters(self) -> pd.DataFrame:
         """Method to get the nodes clusters of a graph
 
-        :return: nodes_clusters
+        :return: nodes_clusters (empty if they weren't computed for the current version of the graph)
         :rtype: pd.DataFrame
         """
+        if 'nodes_clusters' not in self.__derived_data:
+            # the clusters of a previous version are outdated
+            return pd.DataFrame()
+
         return self.__nodes_clusters.nodes_clusters
 
+    @property
+    def content_hash(self) -> str:
+        """Method to get the canonical hash of the nodes and edges of the graph (see compute_graph_hash)
+
+        :return: content_hash
+        :rtype: str
+        """
+        return self.__get_derived_data('content_hash', self._compute_content_hash)
+
+    def _compute_content_hash(self) -> str:
+        """Method to compute the canonical hash of the nodes and edges, subclasses which don't keep their nodes and
+        edges as own tables can override it
+
+        :return: content_hash
+        :rtype: str
+        """
+        return compute_graph_hash(self.nodes, self.edges)
+
     @property
     def edges(self) -> pd.DataFrame:
         """All edges (source, target, type)
@@ -70,15 +155,82 @@ class Graph:
     @edges.setter
     def edges(self, edges: pd.DataFrame) -> None:
         self.__edges.edges = edges
+        self.__change()
+        self.__adjacency_index = None
+
+    @property
+    def adjacency_index(self) -> AdjacencyIndex:
+        """Method to get the source->edges and target->edges indexes of the graph, they are built on the first access
+        and kept up to date by add_edge, delete_edge and delete_root_edges
+
+        :return: adjacency_index
+        :rtype: AdjacencyIndex
+        """
+        if self.__adjacency_index is None:
+            self.__adjacency_index = AdjacencyIndex(self.edges)
+
+        return self.__adjacency_index
 
     @property
     def distinct_edges(self) -> pd.DataFrame:
         """Method to get all distinct edges of a graph
 
-        :return: distinct_edges in the format index|source|target|type (index=source+target+type)
+        :return: distinct_edges in the format index|source|target|type (index=edge key, see compute_edge_key), None
+            if they weren't initialized for the current version of the graph
         :rtype: pd.DataFrame
         """
-        return self.__edges.distinct_edges
+        return self.__derived_data.get('distinct_edges')
+
+    @distinct_edges.setter
+    def distinct_edges(self, distinct_edges: pd.DataFrame) -> None:
+        self.__set_derived_data('distinct_edges', distinct_edges)
+
+    @property
+    def high_level_nodes(self) -> list:
+        """Method to get the high level nodes of the graph (all nodes which are the target of no edge)
+
+        :return: high_level_nodes (node ids)
+        :rtype: list
+        """
+        return self.__get_derived_data('high_level_nodes',
+                                       lambda: compute_high_level_nodes(self.nodes, self.edges,
+                                                                        adjacency=self.adjacency_index))
+
+    @property
+    def node_stats(self) -> pd.Series:
+        """Method to get the number of nodes per type
+
+        :return: node_stats (None if the graph has less than two nodes)
+        :rtype: pd.Series
+        """
+        return self.__nodes.node_stats
+
+    @property
+    def edge_stats(self) -> pd.Series:
+        """Method to get the number of edges per type
+
+        :return: edge_stats (None if the graph has less than two edges)
+        :rtype: pd.Series
+        """
+        return self.__edges.edge_stats
+
+    def snapshot(self) -> 'Graph':
+        """Method to get a copy of the graph, which shares the nodes and edges with the graph until one of both
+        changes them with the methods of the graph (copy-on-write). Taking the snapshot costs O(1) instead of the
+        full recursive copy of copy.deepcopy.
+
+        :return: snapshot
+        :rtype: Graph
+        """
+        snapshot = copy.copy(self)
+        snapshot.__nodes = self.__nodes.snapshot()
+        snapshot.__edges = self.__edges.snapshot()
+        snapshot.__nodes_clusters = self.__nodes_clusters.snapshot()
+        snapshot.__derived_data = dict(self.__derived_data)
+        # the adjacency index is changed in place, the snapshot builds its own one
+        snapshot.__adjacency_index = None
+
+        return snapshot
 
     def add_node(self, node: pd.Series, node_frequency) -> bool:
         """Method to add a new node to an existing graph
@@ -86,14 +238,29 @@ class Graph:
         :param node: The node to add to the existing graph
         :param node_frequency: The frequency of the current node
         """
-        return self.__nodes.add_node(node, node_frequency)
+        self._before_change()
+        node_added = self.__nodes.add_node(node, node_frequency)
+        if node_added is True:
+            self.__change()
+
+        return node_added
 
     def initialize_distinct_nodes(self):
-        """Method to initialize the distinct_nodes
+        """Method to initialize the distinct_nodes (once per version of the graph)
 
+        """
+        self.__get_derived_data('distinct_nodes', self.__compute_distinct_nodes)
+
+    def __compute_distinct_nodes(self) -> pd.DataFrame:
+        """Method to compute the distinct_nodes
+
+        :return: distinct_nodes
+        :rtype: pd.DataFrame
         """
         self.__nodes.initialize_distinct_nodes(self.edges)
 
+        return self.__nodes.distinct_nodes
+
     def node_exists(self, node_id: str) -> bool:
         """Method to check if a specific nodes exists in the graph
 
@@ -101,29 +268,89 @@ class Graph:
         :return: True|False
         :rtype: bool
         """
-        return node_exists(self.nodes, node_id)
+        return self.__nodes.node_exists(node_id)
 
     def delete_node(self, node_id: str) -> None:
         """Method to delete a node
 
         :param str node_id: The id of the node you want to delete
         """
+        self._before_change()
         self.__nodes.delete_node(node_id)
+        self.__change()
+
+    def delete_nodes(self, nodes_ids) -> pd.Index:
+        """Method to delete many nodes at once, their edges are kept (like with delete_node)
+
+        :param nodes_ids: The ids of the nodes you want to delete, unknown ids are ignored
+        :return: deleted_nodes_ids
+        :rtype: pd.Index
+        """
+        self._before_change()
+        return self.__change_if_deleted(self.__nodes.delete_nodes(nodes_ids))
+
+    def delete_nodes_where(self, predicate) -> pd.Index:
+        """Method to delete all nodes which match a predicate, their edges are kept (like with delete_node)
+
+        :param predicate: A function, which gets the nodes (pd.DataFrame) and returns a boolean mask of the nodes
+            to delete
+        :return: deleted_nodes_ids
+        :rtype: pd.Index
+        """
+        self._before_change()
+        return self.__change_if_deleted(self.__nodes.delete_nodes_where(predicate))
+
+    def __change_if_deleted(self, deleted_ids: pd.Index) -> pd.Index:
+        """Method to increase the version, if nodes or edges were deleted
+
+        :param pd.Index deleted_ids: The ids of the deleted nodes or edges
+        :return: deleted_ids
+        :rtype: pd.Index
+        """
+        if len(deleted_ids) > 0:
+            self.__change()
+
+        return deleted_ids
+
+    def keep_induced_subgraph(self, nodes_ids) -> None:
+        """Method to reduce the graph to the subgraph induced by a set of nodes: all other nodes and all edges which
+        don't have both their source and their target in the set are deleted
+
+        :param nodes_ids: The ids of the nodes to keep
+        """
+        nodes_ids = set(nodes_ids)
+        self.delete_nodes_where(lambda nodes: ~nodes.index.isin(nodes_ids))
+        kept_nodes_ids = list(self.nodes.index)
+        self.delete_edges_where(lambda edges: ~(edges['source'].isin(kept_nodes_ids) &
+                                                edges['target'].isin(kept_nodes_ids)))
 
     def compute_reference_nodes(self, rm_graph_nodes: list) -> None:
         """Method to mark all reference model nodes in the graph
 
         :param list rm_graph_nodes: The set of all nodes which should be included in the rm_graph
         """
-
+        self._before_change()
         self.__nodes.compute_reference_nodes(rm_graph_nodes)
+        self.__change()
 
     def compute_nodes_clusters(self) -> None:
-        """Method to compute the nodes clusters for the graph.
+        """Method to compute the nodes clusters for the graph (once per version of the graph).
 
         :return:
         """
-        self.__nodes_clusters.cluster_by_high_level_nodes(self.nodes, self.edges)
+        self.__get_derived_data('nodes_clusters', self.__compute_nodes_clusters)
+
+    def __compute_nodes_clusters(self) -> pd.DataFrame:
+        """Method to compute the nodes clusters, the clusters of a previous version are replaced
+
+        :return: nodes_clusters
+        :rtype: pd.DataFrame
+        """
+        self.__nodes_clusters = NodesClusters()
+        self.__nodes_clusters.cluster_by_high_level_nodes(self.nodes, self.edges, self.adjacency_index,
+                                                          self.high_level_nodes)
+
+        return self.__nodes_clusters.nodes_clusters
         # self.__nodes_clusters.compute_nodes_clusters(self.nodes)
         # self.__nodes_clusters.compute_cluster_connectivities(self.edges)
         # self.__nodes_clusters.update_node_ids(self.nodes)
@@ -133,7 +360,15 @@ class Graph:
 
         :param edge: The edge to add to the existing graph
         """
-        return self.__edges.add_edge(edge)
+        self._before_change()
+        edge_added = self.__edges.add_edge(edge)
+        if edge_added is True:
+            self.__change()
+            if self.__adjacency_index is not None:
+                self.__adjacency_index.add_edge(edge.name, str(edge.loc['source'].name),
+                                                str(edge.loc['target'].name))
+
+        return edge_added
 
     def edge_exists(self, edge_id: str) -> bool:
         """Method to check if a specific edge exists
@@ -142,31 +377,89 @@ class Graph:
         :return: True|False
         :rtype: bool
         """
-        return edge_exists(self.edges, edge_id)
+        return self.__edges.edge_exists(edge_id)
 
     def initialize_distinct_edges(self) -> None:
-        """Method to initialize the distinct edges
+        """Method to initialize the distinct edges (once per version of the graph)
 
+        """
+        self.__get_derived_data('distinct_edges', self.__compute_distinct_edges)
+
+    def __compute_distinct_edges(self) -> pd.DataFrame:
+        """Method to compute the distinct edges
+
+        :return: distinct_edges
+        :rtype: pd.DataFrame
         """
         self.__edges.initialize_distinct_edges(self.nodes, self.distinct_nodes)
 
+        return self.__edges.distinct_edges
+
     def delete_root_edges(self) -> None:
         """Method to delete all root edges of the graph
         """
-        self.__edges.delete_root_edges()
+        self.delete_edges_where(lambda edges: edges['type'] == 'root_edge')
 
     def delete_edge(self, edge_id: str) -> None:
         """Method to delete an edge
 
         :param str edge_id: The id of the edge you want to delete
         """
+        self._before_change()
+        if self.__adjacency_index is not None:
+            self.__adjacency_index.delete_edge(edge_id)
         self.__edges.delete_edge(edge_id)
+        self.__change()
+
+    def delete_edges(self, edges_ids) -> pd.Index:
+        """Method to delete many edges at once
+
+        :param edges_ids: The ids of the edges you want to delete, unknown ids are ignored
+        :return: deleted_edges_ids
+        :rtype: pd.Index
+        """
+        self._before_change()
+        return self.__delete_from_adjacency_index(self.__edges.delete_edges(edges_ids))
+
+    def delete_edges_where(self, predicate) -> pd.Index:
+        """Method to delete all edges which match a predicate
+
+        :param predicate: A function, which gets the edges (pd.DataFrame) and returns a boolean mask of the edges
+            to delete
+        :return: deleted_edges_ids
+        :rtype: pd.Index
+        """
+        self._before_change()
+        return self.__delete_from_adjacency_index(self.__edges.delete_edges_where(predicate))
+
+    def __delete_from_adjacency_index(self, deleted_edges_ids: pd.Index) -> pd.Index:
+        """Method to remove deleted edges from the adjacency index (if it was built)
+
+        :param pd.Index deleted_edges_ids: The ids of the deleted edges
+        :return: deleted_edges_ids
+        :rtype: pd.Index
+        """
+        if self.__adjacency_index is not None:
+            for edge_id in deleted_edges_ids:
+                self.__adjacency_index.delete_edge(edge_id)
+
+        return self.__change_if_deleted(deleted_edges_ids)
 
     def compute_reference_edges(self) -> None:
         """Method to mark all edges that should be in the final rm_graph
         """
-
+        self._before_change()
         self.__edges.compute_reference_edges(self.nodes)
+        self.__change()
+
+    def get_readable_tables(self) -> tuple:
+        """Method to get the nodes and edges of the graph with the readable ids (label+type) instead of the node and
+        edge keys, like they are written to the output files
+
+        :return: (nodes, edges)
+        :rtype: tuple
+        """
+        return compute_readable_tables(self.nodes, self.edges)
 
     def to_lxml_element(self, view_name: str = None, root_element: etree.Element = None) -> etree.Element:
         """Method to compute etree.Element for the graph. This is necessary if you want to create the ArchiMate xml file.
@@ -225,9 +518,8 @@ class Graph:
                 # get the view element if the view name already exists
                 view_name_element = root_element.xpath('./views/diagrams/view/name[text()="' + view_name + '"]')[0]
                 view = view_name_element.find('../')
-        # get the nodes and edges of the current graph
-        nodes = self.nodes
-        edges = self.edges
+        # get the nodes and edges of the current graph (with their readable ids)
+        nodes, edges = self.get_readable_tables()
 
         # get the subelement 'elements' of the root_element
         elements = root_element.find('./elements')
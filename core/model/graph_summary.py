@@ -0,0 +1,39 @@
+from core.model.graph import *
+
+
+class GraphSummary:
+
+    def __init__(self, graph: Graph) -> None:
+        """Constructor of the compact data of an input graph, which is kept instead of the graph when the input
+        models are folded one after another (see MCCGlobal.fold_models). It holds all the RefPa clustering needs.
+
+        :param Graph graph: The input graph, its nodes clusters are computed here
+        """
+        graph.compute_nodes_clusters()
+        self.__content_hash = graph.content_hash
+        self.__nodes_clusters = graph.nodes_clusters
+
+    @property
+    def content_hash(self) -> str:
+        """Method to get the canonical hash of the input graph (see compute_graph_hash)
+
+        :return: content_hash
+        :rtype: str
+        """
+        return self.__content_hash
+
+    @property
+    def nodes_clusters(self) -> pd.DataFrame:
+        """Method to get the nodes clusters of the input graph
+
+        :return: nodes_clusters
+        :rtype: pd.DataFrame
+        """
+        return self.__nodes_clusters
+
+    def compute_nodes_clusters(self) -> None:
+        """Method to compute the nodes clusters, they were already computed when the summary was created
+
+        :return:
+        """
+        pass
@@ -1,6 +1,10 @@
+import numpy as np
 import pandas as pd
 from core.model.utils_nodes import node_exists, compute_distinct_nodes
 from core.model.edges import *
+from core.model.row_buffer import RowBuffer
+from core.model.string_table import STRING_TABLE
+from core.model.utils_keys import compute_node_key
 
 
 class Nodes:
@@ -11,8 +15,12 @@ class Nodes:
         :param pd.DataFrame nodes: Set of all nodes
         """
         self.__nodes = nodes
+        # added nodes are collected here and appended to 'nodes' when it is read
+        self.__pending_nodes = RowBuffer()
         self.__distinct_nodes = None
         self.__stats = None
+        # True if 'nodes' is shared with a snapshot, it is copied before it is changed in place
+        self.__shared = False
 
     @property
     def nodes(self) -> pd.DataFrame:
@@ -21,56 +29,152 @@ class Nodes:
         :return: nodes
         :rtype: pd.DataFrame
         """
+        self.flush()
         return self.__nodes
 
     @nodes.setter
     def nodes(self, nodes: pd.DataFrame) -> None:
         self.__nodes = nodes
+        self.__pending_nodes = RowBuffer()
+        self.__shared = False
+        self.__stats = None
+
+    def flush(self) -> None:
+        """Method to append all pending nodes to 'nodes'
+
+        """
+        if self.__pending_nodes.rows_count > 0:
+            self.__nodes = self.__pending_nodes.flush(self.__nodes)
+            # store the types as categorical column like in the input tables (the type None of the root node is
+            # stored as missing value)
+            STRING_TABLE.categorize_types(self.__nodes, allow_missing_types=True)
+
+    def snapshot(self) -> 'Nodes':
+        """Method to get a copy of the nodes, which shares 'nodes' until one of both copies changes it
+
+        :return: snapshot
+        :rtype: Nodes
+        """
+        self.flush()
+        snapshot = Nodes(self.__nodes)
+        snapshot.__distinct_nodes = self.__distinct_nodes
+        snapshot.__stats = self.__stats
+        snapshot.__shared = True
+        self.__shared = True
+
+        return snapshot
+
+    def __unshare(self) -> None:
+        """Method to copy 'nodes' before it is changed in place, if it is shared with a snapshot
+
+        """
+        self.flush()
+        # the statistics are computed again after the change
+        self.__stats = None
+        if self.__shared is True:
+            self.__nodes = self.__nodes.copy()
+            self.__shared = False
 
     @property
     def distinct_nodes(self) -> pd.DataFrame:
         """Method to get all distinct nodes
 
-        :return: distinct_nodes (index=label+type)
+        :return: distinct_nodes (index=node key, see compute_node_key)
         :rtype: pd.DataFrame
         """
 
         return self.__distinct_nodes
 
+    @distinct_nodes.setter
+    def distinct_nodes(self, distinct_nodes: pd.DataFrame) -> None:
+        self.__distinct_nodes = distinct_nodes
+
     def add_node(self, node: pd.Series, node_frequency) -> bool:
         """Method to add a new node to a set of existing nodes
 
         :param pd.Series node: The node to add to the set of existing nodes
         :param node_frequency: The frequency of the current node
         """
-        node_id = str(node.loc['label']) + str(node.loc['type'])
+        node_id = compute_node_key(node.loc['label'], node.loc['type'])
 
-        if node_exists(self.nodes, node_id) is False:
-            self.__nodes.loc[node_id] = [node.loc['label'], node.loc['type'], node_frequency]
+        if self.node_exists(node_id) is False:
+            self.__pending_nodes.add_row(node_id, [node.loc['label'], node.loc['type'], node_frequency])
+            self.__stats = None
             return True
         else:
             return False
 
+    def node_exists(self, node_id: str) -> bool:
+        """Method to check if a node exists (as a pending or an appended node)
+
+        :param str node_id: The id of the node
+        :return: True|False
+        :rtype: bool
+        """
+        if self.__pending_nodes.row_exists(node_id) is True:
+            return True
+
+        return node_exists(self.__nodes, node_id)
+
     def initialize_distinct_nodes(self, edges: pd.DataFrame) -> None:
         """Method to initialize the distinct nodes
 
         :param pd.DataFrame edges: The edges of the graph
         """
-        self.__distinct_nodes = compute_distinct_nodes(self.__nodes, edges)
+        self.__distinct_nodes = compute_distinct_nodes(self.nodes, edges)
 
     def delete_node(self, node_id: str):
         """Method tot delete a node
 
         :param str node_id: The id of the node you want to delete
         """
+        self.__unshare()
         self.__nodes.drop(node_id, axis=0, inplace=True)
 
+    def delete_nodes(self, nodes_ids) -> pd.Index:
+        """Method to delete many nodes at once (in one pass over the nodes instead of one drop per node)
+
+        :param nodes_ids: The ids of the nodes you want to delete, unknown ids are ignored
+        :return: deleted_nodes_ids
+        :rtype: pd.Index
+        """
+        self.flush()
+        return self.__delete_nodes_by_mask(self.__nodes.index.isin(list(nodes_ids)))
+
+    def delete_nodes_where(self, predicate) -> pd.Index:
+        """Method to delete all nodes which match a predicate (in one pass over the nodes)
+
+        :param predicate: A function, which gets the nodes (pd.DataFrame) and returns a boolean mask of the nodes
+            to delete, e.g. lambda nodes: nodes['is_part_of_reference'] == False
+        :return: deleted_nodes_ids
+        :rtype: pd.Index
+        """
+        self.flush()
+        return self.__delete_nodes_by_mask(np.asarray(predicate(self.__nodes), dtype=bool))
+
+    def __delete_nodes_by_mask(self, mask: np.ndarray) -> pd.Index:
+        """Method to delete the nodes of a boolean mask. The kept nodes are selected into a new frame, so a frame
+        which is shared with a snapshot isn't changed.
+
+        :param np.ndarray mask: True for every node to delete (in the order of 'nodes')
+        :return: deleted_nodes_ids
+        :rtype: pd.Index
+        """
+        deleted_nodes_ids = self.__nodes.index[mask]
+        if len(deleted_nodes_ids) > 0:
+            self.__nodes = self.__nodes[~mask]
+            self.__shared = False
+            self.__stats = None
+
+        return deleted_nodes_ids
+
     def compute_reference_nodes(self, rm_graph_nodes: list) -> None:
         """Method to mark all reference model nodes in the graph
 
         :param list rm_graph_nodes: The set of all nodes which should be included in the rm_graph
         """
 
+        self.__unshare()
         number_of_columns = len(self.__nodes.columns)
         self.__nodes.insert(number_of_columns, "is_part_of_reference", False)
 
@@ -83,7 +187,10 @@ class Nodes:
     def node_stats(self) -> pd.Series:
         nodes_list = list(self.nodes['type'])
         if self.__stats is None and (len(nodes_list) >1 and type(nodes_list[0]) is not None):
-            self.__stats = self.nodes.groupby('type').size()
+            stats = self.nodes.groupby('type', observed=True).size()
+            # sort by type like the stats of an object column (a categorical column is grouped in the order of its
+            # categories)
+            self.__stats = stats.set_axis(stats.index.astype(object)).sort_index()
             return self.__stats
         else:
             return self.__stats
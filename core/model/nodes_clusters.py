@@ -1,6 +1,7 @@
 import pandas as pd
 import copy
 import numpy as np
+from core.model.adjacency_index import AdjacencyIndex
 from core.model.utils_nodes_clusters import compute_node_index, compute_connectivity, compute_high_level_nodes, \
     compute_child_nodes
 
@@ -12,6 +13,8 @@ class NodesClusters:
 
         """
         self.__nodes_clusters = pd.DataFrame()
+        # True if 'nodes_clusters' is shared with a snapshot, it is copied before it is changed in place
+        self.__shared = False
 
     @property
     def nodes_clusters(self) -> pd.DataFrame:
@@ -22,11 +25,33 @@ class NodesClusters:
         """
         return self.__nodes_clusters
 
+    def snapshot(self) -> 'NodesClusters':
+        """Method to get a copy of the nodes clusters, which shares 'nodes_clusters' until one of both copies changes it
+
+        :return: snapshot
+        :rtype: NodesClusters
+        """
+        snapshot = copy.copy(self)
+        snapshot.__shared = True
+        self.__shared = True
+
+        return snapshot
+
+    def __unshare(self) -> None:
+        """Method to copy 'nodes_clusters' before it is changed in place, if it is shared with a snapshot
+        (the lists of nodes are replaced, not changed, so they stay shared)
+
+        """
+        if self.__shared is True:
+            self.__nodes_clusters = self.__nodes_clusters.copy()
+            self.__shared = False
+
     def compute_nodes_clusters(self, nodes: pd.DataFrame) -> None:
         """ Method to compute the nodes_clusters for a graph. Cluster criteria is the type of the nodes.
 
         :param pd.DataFrame nodes: The set of all nodes of the graph
         """
+        self.__unshare()
         self.__nodes_clusters['nodes'] = None
         self.__nodes_clusters['evaluation_metric'] = None
 
@@ -56,6 +81,7 @@ class NodesClusters:
         :param pd.DataFrame edges: The set of all edges of the graph.
         """
         # get all ids of nodes_clusters
+        self.__unshare()
         nodes_clusters_index = list(self.__nodes_clusters.index)
 
         # iterate over all clusters in 'nodes_clusters'
@@ -72,11 +98,12 @@ class NodesClusters:
             self.__nodes_clusters.at[current_cluster_index, 'evaluation_metric'] = current_cluster_connectivity
 
     def update_node_ids(self, nodes: pd.DataFrame) -> None:
-        """Method to update the node_ids of the nodes in the single clusters to the unique node_ids (label+type)
+        """Method to update the node_ids of the nodes in the single clusters to the unique node_ids (node keys)
 
         :param pd.DataFrame nodes: The set of all nodes of the graph
         """
         # get all ids of nodes_clusters
+        self.__unshare()
         node_clusters_index = list(self.__nodes_clusters.index)
 
         # iterate over all clusters in 'nodes_clusters'
@@ -96,14 +123,17 @@ class NodesClusters:
             # set the list with the new node ids in 'nodes_clusters'
             self.__nodes_clusters.at[cluster_name, 'nodes'] = new_cluster_nodes
 
-    def cluster_by_high_level_nodes(self, nodes: pd.DataFrame, edges: pd.DataFrame) -> None:
+    def cluster_by_high_level_nodes(self, nodes: pd.DataFrame, edges: pd.DataFrame, adjacency: AdjacencyIndex = None,
+                                    high_level_nodes: list = None) -> None:
+        self.__unshare()
         self.__nodes_clusters['nodes'] = None
         self.__nodes_clusters['evaluation_metric'] = None
 
-        high_level_nodes = compute_high_level_nodes(nodes, edges)
+        if high_level_nodes is None:
+            high_level_nodes = compute_high_level_nodes(nodes, edges, adjacency=adjacency)
 
         for high_level_node in high_level_nodes:
-            child_nodes = compute_child_nodes(high_level_node, edges)
+            child_nodes = compute_child_nodes(high_level_node, edges, adjacency)
             updated_child_nodes = []
             for child_node in child_nodes:
                 updated_child_nodes.append(compute_node_index(nodes, child_node))
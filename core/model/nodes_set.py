@@ -1,6 +1,8 @@
 import pandas as pd
 
-from core.model.utils_nodes_set import distinct_node_exists
+from core.model.utils_nodes_set import distinct_node_exists, compute_nodes_lookup
+from core.model.row_buffer import RowBuffer
+from core.model.string_table import STRING_TABLE
 
 
 class NodesSet:
@@ -10,6 +12,11 @@ class NodesSet:
 
         """
         self.__nodes_set = pd.DataFrame(columns=['label', 'type', 'frequency', 'isRoot'])
+        # new distinct nodes are collected here and appended to 'nodes_set' when it is read
+        self.__pending_nodes = RowBuffer()
+        # (label, type) -> position of the node in 'nodes_set', built for the index in 'nodes_lookup_index'
+        self.__nodes_lookup = {}
+        self.__nodes_lookup_index = None
 
     @property
     def nodes_set(self) -> pd.DataFrame:
@@ -17,8 +24,18 @@ class NodesSet:
 
         :return:
         """
+        self.flush()
         return self.__nodes_set
 
+    def flush(self) -> None:
+        """Method to append all pending distinct nodes to 'nodes_set'
+
+        """
+        if self.__pending_nodes.rows_count > 0:
+            self.__nodes_set = self.__pending_nodes.flush(self.__nodes_set)
+            # store the types as categorical column like in the input tables
+            STRING_TABLE.categorize_types(self.__nodes_set)
+
     def get_node(self, node_label: str, node_type: str) -> pd.Series or None:
         """Method to query a special node out of nodes_set
 
@@ -27,36 +44,53 @@ class NodesSet:
         :return: If node exists: result_node, Else: None
         :rtype: [pd.Series | None]
         """
-        result_node = self.__nodes_set[
-            (self.__nodes_set['label'] == node_label) & (self.__nodes_set['type'] == node_type)]
+        nodes_set = self.nodes_set
 
-        if len(result_node) > 0:
-            return result_node.iloc[0]
+        # the lookup is rebuilt when rows were appended to or dropped from 'nodes_set'
+        if self.__nodes_lookup_index is not nodes_set.index:
+            self.__nodes_lookup = compute_nodes_lookup(nodes_set)
+            self.__nodes_lookup_index = nodes_set.index
+
+        node_position = self.__nodes_lookup.get((node_label, node_type))
+        if node_position is not None:
+            return nodes_set.iloc[node_position]
 
         else:
             return None
 
-    def add_distinct_node(self, distinct_node: pd.Series) -> None:
+    def add_distinct_node(self, distinct_node: pd.Series, weight: int = 1) -> None:
         """Method to add a new node to the nodes_set
 
         :param pd.Series distinct_node: The node you want to add (label|type|frequency|isRoot)
+        :param int weight: The number of graphs the node is added for (the frequency is multiplied with it)
         """
         # get the id of the distinct node
         distinct_node_id = distinct_node.name
 
-        # check if 'distinct_node' already exists
-        if distinct_node_exists(self.__nodes_set, distinct_node_id) is False:
+        # check if 'distinct_node' already exists (as a pending or an appended node)
+        if self.__pending_nodes.row_exists(distinct_node_id) is False and \
+                distinct_node_exists(self.__nodes_set, distinct_node_id) is False:
             # get all the necessary attributes of 'distinct_node'
             distinct_node_label = distinct_node.loc['label']
             distinct_node_type = distinct_node.loc['type']
             distinct_node_frequency = distinct_node.loc['frequency']
+            if weight != 1:
+                distinct_node_frequency = distinct_node_frequency * weight
             distinct_node_is_root = distinct_node.loc['isRoot']
 
             # add 'distinct_node' to 'nodes_set'
-            self.__nodes_set.loc[distinct_node_id] = [distinct_node_label, distinct_node_type,
-                                                      distinct_node_frequency, distinct_node_is_root]
+            self.__pending_nodes.add_row(distinct_node_id, [distinct_node_label, distinct_node_type,
+                                                            distinct_node_frequency, distinct_node_is_root])
+        elif self.__pending_nodes.row_exists(distinct_node_id) is True:
+            # update the frequency of the pending 'distinct_node'
+            distinct_node_frequency = distinct_node.loc['frequency']
+            frequency_position = self.__nodes_set.columns.get_loc('frequency')
+            new_frequency = float(self.__pending_nodes.get_value(distinct_node_id, frequency_position)) + \
+                float(distinct_node_frequency) * weight
+            self.__pending_nodes.set_value(distinct_node_id, frequency_position, new_frequency)
         else:
             # update the frequency of 'distinct_node' in 'nodes_set'
             distinct_node_frequency = distinct_node.loc['frequency']
-            new_frequency = float(self.__nodes_set.loc[distinct_node_id]['frequency']) + float(distinct_node_frequency)
+            new_frequency = float(self.__nodes_set.loc[distinct_node_id]['frequency']) + \
+                float(distinct_node_frequency) * weight
             self.__nodes_set.at[distinct_node_id, 'frequency'] = new_frequency
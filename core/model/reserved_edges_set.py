@@ -1,4 +1,6 @@
 import pandas as pd
+from core.model.row_buffer import RowBuffer
+from core.model.string_table import STRING_TABLE
 
 
 class ReservedEdgesSet:
@@ -8,11 +10,23 @@ class ReservedEdgesSet:
 
         """
         self.__reserved_edges_set = pd.DataFrame(columns=['source', 'target', 'type', 'source_node_id', 'frequency'])
+        # new edges are collected here and appended to 'reserved_edges_set' when it is read
+        self.__pending_edges = RowBuffer()
 
     @property
     def reserved_edges_set(self) -> pd.DataFrame:
+        self.flush()
         return self.__reserved_edges_set
 
+    def flush(self) -> None:
+        """Method to append all pending edges to 'reserved_edges_set'
+
+        """
+        if self.__pending_edges.rows_count > 0:
+            self.__reserved_edges_set = self.__pending_edges.flush(self.__reserved_edges_set)
+            # store the types as categorical column like in the input tables
+            STRING_TABLE.categorize_types(self.__reserved_edges_set)
+
     def get_edge(self, edge_id: str) -> pd.Series:
         """Method to get a specific edge of 'reserved_edges_set'
 
@@ -20,7 +34,7 @@ class ReservedEdgesSet:
         :return: Specific edge
         :rtype: pd.Series
         """
-        return self.__reserved_edges_set.loc[edge_id]
+        return self.reserved_edges_set.loc[edge_id]
 
     def get_relevant_edges(self, edge_source: str) -> pd.DataFrame:
         """Method to get all relevant edges according to their source_node
@@ -29,7 +43,8 @@ class ReservedEdgesSet:
         :return: A set of relevant edges
         :rtype: pd.DataFrame
         """
-        return self.__reserved_edges_set[self.__reserved_edges_set['source_node_id'] == edge_source]
+        reserved_edges_set = self.reserved_edges_set
+        return reserved_edges_set[reserved_edges_set['source_node_id'] == edge_source]
 
     def add_edge(self, edge: pd.Series) -> None:
         """Method to add an edge to 'reserved_edges_set'
@@ -42,11 +57,17 @@ class ReservedEdgesSet:
         edge_type = edge.loc['type']
         edge_source_node_id = str(edge.loc['source'].name)
         edge_frequency = edge.loc['frequency']
-        self.__reserved_edges_set.loc[edge_id] = [edge_source_node, edge_target_node, edge_type, edge_source_node_id, edge_frequency]
+        row = [edge_source_node, edge_target_node, edge_type, edge_source_node_id, edge_frequency]
+        if edge_id in self.__reserved_edges_set.index:
+            # overwrite the already appended edge
+            self.__reserved_edges_set.loc[edge_id] = row
+        else:
+            self.__pending_edges.add_row(edge_id, row)
 
     def delete_edge(self, edge_id: str) -> None:
         """Method to delete a specific edge out of 'reserved_edges_set'
 
         :param str edge_id: The index of the edge
         """
+        self.flush()
         self.__reserved_edges_set.drop(edge_id, axis=0, inplace=True)
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+
+class RowBuffer:
+
+    def __init__(self) -> None:
+        """Constructor of the buffer for rows, which are appended to a pd.DataFrame. Instead of enlarging the frame
+        row by row (each 'df.loc[new_id] = [...]' copies the complete frame), the rows are collected as plain lists
+        and appended to the frame at once, when it is flushed.
+
+        """
+        self.__rows = {}
+
+    @property
+    def rows_count(self) -> int:
+        """Method to get the number of pending rows
+
+        :return: rows_count
+        :rtype: int
+        """
+        return len(self.__rows)
+
+    def add_row(self, row_id: str, row: list) -> None:
+        """Method to add a new row
+
+        :param str row_id: The id (index) of the row
+        :param list row: The values of the row (in the order of the columns of the frame)
+        """
+        self.__rows[row_id] = list(row)
+
+    def row_exists(self, row_id: str) -> bool:
+        """Method to check if a row is pending
+
+        :param str row_id: The id of the row
+        :return: True|False
+        :rtype: bool
+        """
+        return row_id in self.__rows
+
+    def get_value(self, row_id: str, column_position: int):
+        """Method to get a value of a pending row
+
+        :param str row_id: The id of the row
+        :param int column_position: The position of the column
+        :return: value
+        """
+        return self.__rows[row_id][column_position]
+
+    def set_value(self, row_id: str, column_position: int, value) -> None:
+        """Method to set a value of a pending row. Like 'df.at' on an integer column, an integral float is stored
+        as an integer, if the row holds an integer.
+
+        :param str row_id: The id of the row
+        :param int column_position: The position of the column
+        :param value: The new value
+        """
+        row = self.__rows[row_id]
+        old_value = row[column_position]
+        if isinstance(old_value, (int, np.integer)) and not isinstance(old_value, (bool, np.bool_)) and \
+                isinstance(value, (float, np.floating)) and float(value).is_integer():
+            value = int(value)
+        row[column_position] = value
+
+    def flush(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Method to append all pending rows to a frame. The dtypes are inferred from the values of each column,
+        as they would be by enlarging the frame row by row. A categorical column stays categorical, if all of its
+        pending values are known categories.
+
+        :param pd.DataFrame frame: The frame the rows belong to
+        :return: frame (a new frame, if rows were pending)
+        :rtype: pd.DataFrame
+        """
+        if len(self.__rows) == 0:
+            return frame
+
+        rows_ids = list(self.__rows)
+        rows = list(self.__rows.values())
+        self.__rows = {}
+
+        columns = list(frame.columns)
+        for row_id, row in zip(rows_ids, rows):
+            if len(row) != len(columns):
+                raise ValueError('cannot set a row with mismatched columns (row ' + str(row_id) + ')')
+
+        pending_columns = {}
+        for column_position, column in enumerate(columns):
+            # fill an object array cell by cell, the values may be pd.Series themselves
+            values = np.empty(len(rows), dtype=object)
+            for i, row in enumerate(rows):
+                values[i] = row[column_position]
+            pending_column = pd.Series(values, index=rows_ids, dtype=object).infer_objects()
+            column_dtype = frame[column].dtype
+            if isinstance(column_dtype, pd.CategoricalDtype) and pending_column.notna().all() and \
+                    pending_column.isin(column_dtype.categories).all():
+                # keep a categorical column (e.g. the types), if all values are known categories
+                pending_column = pending_column.astype(column_dtype)
+            pending_columns[column] = pending_column
+        pending_frame = pd.DataFrame(pending_columns, columns=columns)
+
+        if len(frame) == 0:
+            return pending_frame
+
+        return pd.concat([frame, pending_frame])
@@ -0,0 +1,172 @@
+import sys
+import pandas as pd
+
+
+class StringTable:
+
+    def __init__(self) -> None:
+        """Constructor of the string table, which is shared by all input models of a run. The labels and ids of the
+        models are interned, so equal strings of different models (and the node ids in the source|target columns
+        of the edges) are stored once. The types are stored as categorical columns with codes into one list of all
+        known types, which grows when a model brings a type that wasn't seen before.
+
+        """
+        self.__types = []
+        self.__types_dtype = pd.CategoricalDtype([])
+
+    @property
+    def types(self) -> list:
+        """Method to get all known types (in the order they were seen)
+
+        :return: types
+        :rtype: list
+        """
+        return list(self.__types)
+
+    @property
+    def types_dtype(self) -> pd.CategoricalDtype:
+        """Method to get the dtype of the type columns (categories = all known types)
+
+        :return: types_dtype
+        :rtype: pd.CategoricalDtype
+        """
+        return self.__types_dtype
+
+    @staticmethod
+    def intern_values(values) -> list:
+        """Method to intern all strings of a sequence of values, other values (e.g. None) are kept
+
+        :param values: The values
+        :return: interned_values
+        :rtype: list
+        """
+        return [sys.intern(value) if type(value) is str else value for value in values]
+
+    def add_types(self, types) -> pd.CategoricalDtype:
+        """Method to add types to the known types
+
+        :param types: The types, the ones which are already known are skipped
+        :return: types_dtype (a new dtype, if a type was added)
+        :rtype: pd.CategoricalDtype
+        """
+        known_types = set(self.__types)
+        # the types are interned, so they can be compared by identity like the literals of the code
+        new_types = [sys.intern(current_type) if type(current_type) is str else current_type
+                     for current_type in pd.unique(pd.Series(list(types), dtype=object))
+                     if current_type not in known_types]
+        if len(new_types) > 0:
+            self.__types = self.__types + new_types
+            self.__types_dtype = pd.CategoricalDtype(self.__types)
+
+        return self.__types_dtype
+
+    def compact_table(self, table: pd.DataFrame, strings_columns: list, intern_index: bool = True) -> pd.DataFrame:
+        """Method to intern the ids and strings of a table (nodes: label, edges: source|target) and to store its
+        types as categorical column. A type column with a missing type is kept as it is, because a categorical
+        column would turn None into NaN.
+
+        :param pd.DataFrame table: The nodes (label|type) or edges (source|target|type) of an input model
+        :param list strings_columns: The columns of 'table' which hold strings
+        :param bool intern_index: If False the index of 'table' is kept as it is
+        :return: compacted_table (a new table)
+        :rtype: pd.DataFrame
+        """
+        columns = {}
+        for column in table.columns:
+            if column in strings_columns:
+                columns[column] = pd.Series(self.intern_values(table[column]), index=table.index, dtype=object)
+            elif column == 'type' and table[column].notna().all():
+                types_dtype = self.add_types(table[column])
+                columns[column] = table[column].astype(types_dtype)
+            else:
+                columns[column] = table[column]
+
+        compacted_table = pd.DataFrame(columns, columns=table.columns)
+        if intern_index:
+            compacted_table.index = pd.Index(self.intern_values(table.index), dtype=object)
+
+        return compacted_table
+
+    def categorize_types(self, table: pd.DataFrame, allow_missing_types: bool = False) -> None:
+        """Method to store the type column of a table, which is built row by row (e.g. the nodes_set or the nodes of
+        the rm_graph), as categorical column in place. A categorical column is kept as it is, an object column (e.g.
+        after rows with a new type were appended) is cast again.
+
+        :param pd.DataFrame table: The table (a table without type column is skipped)
+        :param bool allow_missing_types: If True a missing type (the type None of the root node of the rm_graph) is
+            stored as missing value of the categorical column (NaN, see compute_node_key), else a type column with a
+            missing type is kept as it is
+        """
+        if 'type' not in table.columns or isinstance(table['type'].dtype, pd.CategoricalDtype):
+            return
+
+        missing_types = table['type'].isna()
+        if missing_types.any() and not allow_missing_types:
+            return
+
+        types_dtype = self.add_types(table['type'][~missing_types])
+        table['type'] = table['type'].astype(types_dtype)
+
+
+# the string table of all input models of the current process
+STRING_TABLE = StringTable()
+
+
+def compact_nodes(nodes: pd.DataFrame) -> pd.DataFrame:
+    """Method to intern the ids and labels of nodes and to store their types as categorical column
+
+    :param pd.DataFrame nodes: The nodes (label|type)
+    :return: compacted_nodes
+    :rtype: pd.DataFrame
+    """
+    return STRING_TABLE.compact_table(nodes, ['label'])
+
+
+def compact_edges(edges: pd.DataFrame) -> pd.DataFrame:
+    """Method to intern the ids, sources and targets of edges and to store their types as categorical column
+
+    :param pd.DataFrame edges: The edges (source|target|type)
+    :return: compacted_edges
+    :rtype: pd.DataFrame
+    """
+    return STRING_TABLE.compact_table(edges, ['source', 'target'])
+
+
+def compact_entry(entry: dict) -> dict:
+    """Method to intern the tables of extracted data (nodes|edges, optional distinct_nodes|distinct_edges and the
+    distinct tables of its views), which were unpickled out of the cache or from a worker process. Unpickled tables
+    hold their own copies of the strings and the types of the process which extracted them.
+
+    :param dict entry: The extracted data (see load_graph and extract_graph_views)
+    :return: compacted_entry (a new dict, the other values are kept)
+    :rtype: dict
+    """
+    compacted_entry = dict(entry)
+    compacted_entry['nodes'] = compact_nodes(entry['nodes'])
+    compacted_entry['edges'] = compact_edges(entry['edges'])
+    compacted_entry.update(compact_distinct_tables(entry))
+    if 'views' in entry:
+        compacted_entry['views'] = [dict(view, **compact_distinct_tables(view)) for view in entry['views']]
+
+    return compacted_entry
+
+
+def compact_distinct_tables(entry: dict) -> dict:
+    """Method to intern the distinct nodes and edges of extracted data
+
+    :param dict entry: The extracted data of a model or a view (distinct_nodes|distinct_edges, missing or None
+        tables are skipped)
+    :return: compacted_tables (distinct_nodes|distinct_edges)
+    :rtype: dict
+    """
+    compacted_tables = {}
+    # the keys (index) of the distinct tables are kept like in freshly computed ones, the node keys in the index of
+    # the distinct nodes are the names of the nodes in the source|target columns of the distinct edges
+    if entry.get('distinct_nodes') is not None:
+        compacted_tables['distinct_nodes'] = STRING_TABLE.compact_table(entry['distinct_nodes'], ['label'],
+                                                                        intern_index=False)
+    if entry.get('distinct_edges') is not None:
+        compacted_tables['distinct_edges'] = STRING_TABLE.compact_table(entry['distinct_edges'], [],
+                                                                        intern_index=False)
+
+    return compacted_tables
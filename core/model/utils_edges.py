@@ -1,55 +1,66 @@
+import numpy as np
 import pandas as pd
+from core.model.utils_keys import compute_node_key, compute_edge_key
 
 
-def compute_distinct_edges(edges: pd.DataFrame, nodes: pd.DataFrame, distinct_nodes: pd.DataFrame) -> pd.DataFrame:
-    """Method to compute the distinct edges for Edges
+def compute_distinct_edges(edges: pd.DataFrame, nodes: pd.DataFrame, distinct_nodes: pd.DataFrame,
+                           nodes_keys: dict = None, edges_positions: np.ndarray = None) -> pd.DataFrame:
+    """Method to compute the distinct edges for Edges. The keys of the sources and targets are joined to all edges at
+    once and the edges are grouped by source key+target key+type. Edges whose source or target isn't in 'nodes' are
+    left out.
 
     :param pd.DataFrame edges: The set of all edges of a graph
     :param pd.DataFrame nodes: The set of all nodes of a graph
     :param pd.DataFrame distinct_nodes: The set of all distinct nodes of a graph
-    :return: A set of distinct edges
-    :rtype: pd.DataFrame
+    :param dict nodes_keys: The key of every node id in 'nodes' (see compute_nodes_keys), will be computed if not
+        given
+    :param np.ndarray edges_positions: The positions of the edges in 'edges' (e.g. the edges of a view in the edges
+        of its model), all edges if not given
+    :return: A set of distinct edges (in the order of the first edge of every key, source and target include the
+        complete distinct node as a pd.Series)
+    :rtype: pd.DataFrame (index = edge key, see compute_edge_key)
     """
-    # initialize the set for the unique edges
-    unique_edges_set = pd.DataFrame(columns=['source', 'target', 'type', 'frequency'])
-
-    # iterate over all edges in 'edges'
-    for i in range(0, len(edges)):
-        # get all necessary attributes of the current_edge
-        current_edge = edges.iloc[i]
-        try:
-            current_edge_source = nodes.loc[current_edge.loc['source']]
-        except KeyError:
-            break
-        current_edge_target = nodes.loc[current_edge.loc['target']]
-        current_edge_source_id = str(current_edge_source.loc['label']) + str(current_edge_source.loc['type'])
-        current_edge_target_id = str(current_edge_target.loc['label']) + str(current_edge_target.loc['type'])
-        current_edge_source_node = distinct_nodes.loc[current_edge_source_id]
-        current_edge_target_node = distinct_nodes.loc[current_edge_target_id]
-        current_edge_type = str(current_edge.loc['type'])
-        current_edge_id = str(current_edge_source_id) + str(current_edge_target_id) + str(current_edge_type)
-
-        # check if 'current_edge' is not already in 'unique_edges_set'
-        if current_edge_id not in list(unique_edges_set.index):
-
-            # exception handling
-            try:
-                # add 'current_edge' to 'unique_edges_set'
-                unique_edges_set.loc[current_edge_id] = [current_edge_source_node, current_edge_target_node,
-                                                         current_edge_type, 1]
-            except Exception as e:
-                if hasattr(e, 'message'):
-                    print(e.message)
-                else:
-                    print(e)
-
-        # check if 'current_edge' is already in 'unique_edges_set'
-        elif current_edge_id in list(unique_edges_set.index):
-            # update the frequency of 'current_edge' in 'unique_edges_set'
-            new_frequency = float(unique_edges_set.loc[current_edge_id]['frequency']) + float(1.0)
-            unique_edges_set.at[current_edge_id, 'frequency'] += new_frequency
-
-    return unique_edges_set
+    columns = ['source', 'target', 'type', 'frequency']
+    if nodes_keys is None:
+        nodes_keys = {}
+        for node_id, node_label, node_type in zip(nodes.index, nodes['label'], nodes['type']):
+            nodes_keys.setdefault(node_id, compute_node_key(node_label, node_type))
+
+    # join the keys of the source and target nodes to the edges
+    if edges_positions is None:
+        edges_positions = slice(None)
+    sources_keys = edges['source'].iloc[edges_positions].map(nodes_keys)
+    targets_keys = edges['target'].iloc[edges_positions].map(nodes_keys)
+    known_edges = (sources_keys.notna() & targets_keys.notna()).values
+    if not known_edges.any():
+        return pd.DataFrame(columns=columns)
+    sources_keys = sources_keys.values[known_edges]
+    targets_keys = targets_keys.values[known_edges]
+    edges_types = [str(edge_type) for edge_type in edges['type'].iloc[edges_positions].values[known_edges]]
+
+    # group the edges by source key+target key+type (the node keys have a fixed width, so the joined value is
+    # unambiguous), the codes are numbered in the order of the first edge of every group
+    values = [source_key + target_key + edge_type
+              for source_key, target_key, edge_type in zip(sources_keys, targets_keys, edges_types)]
+    codes = pd.factorize(np.asarray(values, dtype=object))[0]
+    frequencies = np.bincount(codes)
+    first_positions = np.unique(codes, return_index=True)[1]
+    distinct_keys = [compute_edge_key(sources_keys[position], targets_keys[position], edges_types[position])
+                     for position in first_positions]
+
+    # every distinct node is looked up once, all its edges share the same pd.Series
+    distinct_nodes_rows = {}
+    sources = np.empty(len(first_positions), dtype=object)
+    targets = np.empty(len(first_positions), dtype=object)
+    for i, position in enumerate(first_positions):
+        for cells, node_key in [(sources, sources_keys[position]), (targets, targets_keys[position])]:
+            if node_key not in distinct_nodes_rows:
+                distinct_nodes_rows[node_key] = distinct_nodes.loc[node_key]
+            cells[i] = distinct_nodes_rows[node_key]
+
+    return pd.DataFrame({'source': sources, 'target': targets,
+                         'type': np.asarray(edges_types, dtype=object)[first_positions], 'frequency': frequencies},
+                        index=pd.Index(distinct_keys, dtype=object), columns=columns)
 
 
 def compute_nodes_ids(edge_source_node: pd.Series, edge_target_node: pd.Series,
@@ -84,9 +95,8 @@ def edge_exists(edges: pd.DataFrame, edge_id: str) -> bool:
     :return: True|False
     :rtype: bool
     """
-    edges_index = list(edges.index)
-
-    if edge_id not in edges_index:
+    # hash lookup in the index of 'edges'
+    if edge_id not in edges.index:
         return False
     else:
         return True
@@ -9,10 +9,8 @@ def distinct_edge_exists(edges_set: pd.DataFrame, edge_id: str) -> bool:
     :return: True | False
     :rtype: bool
     """
-
-    edges_set_index = list(edges_set.index)
-
-    if edge_id in edges_set_index:
+    # hash lookup in the index of 'edges_set'
+    if edge_id in edges_set.index:
         return True
     else:
         return False
@@ -1,6 +1,8 @@
 from lxml import etree
 import string
 import random
+import hashlib
+import numpy as np
 
 CHARACTERS = (
         string.ascii_letters
@@ -152,3 +154,65 @@ def element_to_xml_string(element) -> str:
         .decode("utf-8")
     # return string
     return element_string
+
+
+def compute_graph_hash(nodes, edges, nodes_positions: np.ndarray = None, edges_positions: np.ndarray = None) -> str:
+    """Method to compute a canonical hash of the content of a graph. The nodes are sorted by their label and type and
+    the node ids are replaced by the position of the node in this order, so graphs which only differ in their ids or in
+    the order of their nodes and edges (e.g. the same model exported twice) get the same hash
+
+    :param pd.DataFrame nodes: The nodes of the graph (label|type)
+    :param pd.DataFrame edges: The edges of the graph (source|target|type)
+    :param np.ndarray nodes_positions: The positions of the nodes of the graph in 'nodes' (e.g. the nodes of a view in
+        the nodes of its model), all nodes if not given
+    :param np.ndarray edges_positions: The positions of the edges of the graph in 'edges', all edges if not given
+    :return: graph_hash (sha256 as hex string)
+    :rtype: str
+    """
+    # only the hashed columns are taken from the tables, not a slice of the complete tables
+    if nodes_positions is None:
+        nodes_positions = slice(None)
+    if edges_positions is None:
+        edges_positions = slice(None)
+    nodes_ids = nodes.index[nodes_positions]
+    labels = nodes['label'].iloc[nodes_positions]
+    nodes_types = nodes['type'].iloc[nodes_positions]
+    sources = edges['source'].iloc[edges_positions]
+    targets = edges['target'].iloc[edges_positions]
+    edges_types = edges['type'].iloc[edges_positions]
+
+    # sort by the repr, so missing labels|types can be compared with strings (the sort is stable, nodes with the same
+    # label and type keep their order)
+    sorted_nodes = sorted(zip(nodes_ids, labels, nodes_types), key=lambda node: (repr(node[1]), repr(node[2])))
+    positions = {}
+    for position, (node_id, label, node_type) in enumerate(sorted_nodes):
+        positions.setdefault(node_id, position)
+
+    # edges which reference unknown nodes keep their raw ids (as string, so they can't collide with a position)
+    content = ([(label, node_type) for node_id, label, node_type in sorted_nodes],
+               sorted([(positions.get(source, str(source)), positions.get(target, str(target)), edge_type)
+                       for source, target, edge_type in zip(sources, targets, edges_types)],
+                      key=repr))
+
+    return hashlib.sha256(repr(content).encode('utf-8')).hexdigest()
+
+
+def deduplicate_graphs(graphs: list) -> tuple:
+    """Method to merge graphs with the same content (see compute_graph_hash) into one representative
+
+    :param list graphs: The graphs
+    :return: (representatives, weights) the first graph of every content in the order of 'graphs' and the number of
+        graphs with this content
+    :rtype: tuple
+    """
+    weights = {}
+    representatives = {}
+    for graph in graphs:
+        graph_hash = graph.content_hash
+        if graph_hash in weights:
+            weights[graph_hash] += 1
+        else:
+            weights[graph_hash] = 1
+            representatives[graph_hash] = graph
+
+    return list(representatives.values()), list(weights.values())
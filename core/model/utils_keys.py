@@ -0,0 +1,102 @@
+import hashlib
+import pandas as pd
+
+# the number of bytes of the digest of a key (a key is written as hex string with two characters per byte)
+KEY_SIZE = 8
+
+
+def compute_node_key(node_label, node_type) -> str:
+    """Method to compute the key of a node (the index of distinct nodes, nodes_set and rm_graph). The key is a fixed
+    width digest of label and type. Unlike the readable id label+type (label 'OrderP' + type 'rocess' is the same
+    id as label 'Order' + type 'Process'), the length of the label is part of the digested value, so different
+    pairs of label and type don't share a key.
+
+    :param node_label: The label of the node
+    :param node_type: The type of the node
+    :return: node_key
+    :rtype: str
+    """
+    if node_type is not None and node_type != node_type:
+        # a missing type of a categorical type column (NaN) is the type None of the root node
+        node_type = None
+    node_label = str(node_label)
+    value = str(len(node_label)) + ':' + node_label + str(node_type)
+
+    return hashlib.blake2b(value.encode('utf-8', 'surrogatepass'), digest_size=KEY_SIZE).hexdigest()
+
+
+# the key of the root node of the rm_graph (label None and type None, readable id 'NoneNone')
+ROOT_NODE_KEY = compute_node_key(None, None)
+
+
+def compute_edge_key(source_key: str, target_key: str, edge_type) -> str:
+    """Method to compute the key of an edge (the index of distinct edges, edges_set and rm_graph) out of the keys
+    of its source and target node and its type. The node keys have a fixed width, so the joined value is
+    unambiguous.
+
+    :param str source_key: The key of the source node (see compute_node_key)
+    :param str target_key: The key of the target node (see compute_node_key)
+    :param edge_type: The type of the edge
+    :return: edge_key
+    :rtype: str
+    """
+    value = source_key + target_key + str(edge_type)
+
+    return hashlib.blake2b(value.encode('utf-8', 'surrogatepass'), digest_size=KEY_SIZE).hexdigest()
+
+
+def compute_readable_node_id(node_label, node_type) -> str:
+    """Method to compute the readable id of a node, which is used in the exported files
+
+    :param node_label: The label of the node
+    :param node_type: The type of the node
+    :return: readable_node_id (label+type)
+    :rtype: str
+    """
+    return str(node_label) + str(node_type)
+
+
+def compute_readable_tables(nodes: pd.DataFrame, edges: pd.DataFrame) -> tuple:
+    """Method to replace the node and edge keys in the tables of a graph with their readable ids (node: label+type,
+    edge: source+target+type, root edge: 'None'+label+type+'root_edge'). Ids which are no keys (e.g. the ids of
+    the elements of an input model) are kept.
+
+    :param pd.DataFrame nodes: The nodes of the graph (label|type|...)
+    :param pd.DataFrame edges: The edges of the graph (source|target|type|...)
+    :return: (readable_nodes, readable_edges) copies of the tables
+    :rtype: tuple
+    """
+    if isinstance(nodes['type'].dtype, pd.CategoricalDtype) and nodes['type'].isna().any():
+        # the missing type of the root node is None again, like in an object column
+        nodes = nodes.copy()
+        nodes['type'] = pd.Series([None if pd.isna(node_type) else node_type for node_type in nodes['type']],
+                                  index=nodes.index, dtype=object)
+
+    readable_nodes_ids = {}
+    for node_id, node_label, node_type in zip(nodes.index, nodes['label'], nodes['type']):
+        if node_id == compute_node_key(node_label, node_type):
+            readable_nodes_ids[node_id] = compute_readable_node_id(node_label, node_type)
+
+    readable_edges_ids = []
+    readable_sources = []
+    readable_targets = []
+    for edge_id, source, target, edge_type in zip(edges.index, edges['source'], edges['target'], edges['type']):
+        readable_source = readable_nodes_ids.get(source, source)
+        readable_target = readable_nodes_ids.get(target, target)
+        if isinstance(source, str) and isinstance(target, str) and edge_id == compute_edge_key(source, target,
+                                                                                                  edge_type):
+            if edge_type == 'root_edge':
+                edge_id = 'None' + str(readable_target) + 'root_edge'
+            else:
+                edge_id = str(readable_source) + str(readable_target) + str(edge_type)
+        readable_edges_ids.append(edge_id)
+        readable_sources.append(readable_source)
+        readable_targets.append(readable_target)
+
+    readable_nodes = nodes.rename(index=readable_nodes_ids)
+    readable_edges = edges.copy()
+    readable_edges.index = pd.Index(readable_edges_ids, dtype=object)
+    readable_edges['source'] = readable_sources
+    readable_edges['target'] = readable_targets
+
+    return readable_nodes, readable_edges
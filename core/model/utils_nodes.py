@@ -1,37 +1,72 @@
+import numpy as np
 from core.model.edges import *
+from core.model.adjacency_index import AdjacencyIndex
+from core.model.utils_keys import compute_node_key
 
 
-def compute_distinct_nodes(nodes: pd.DataFrame, edges: pd.DataFrame) -> pd.DataFrame:
-    """Method to compute all distinct nodes out of a set of nodes
+def compute_distinct_nodes(nodes: pd.DataFrame, edges: pd.DataFrame, nodes_keys: dict = None,
+                           nodes_positions: np.ndarray = None, edges_positions: np.ndarray = None) -> pd.DataFrame:
+    """Method to compute all distinct nodes out of a set of nodes. All nodes with the same label and type are
+    grouped at once, a distinct node gets the attributes of its first node and is a root node if its first node is
+    the target of no edge.
 
-    :return: distinct_nodes
-    :rtype: pd.DataFrame (index = label+type)
+    :param pd.DataFrame nodes: Set of all nodes
+    :param pd.DataFrame edges: Set of all edges
+    :param dict nodes_keys: The key of every node id (see compute_nodes_keys), will be computed if not given
+    :param np.ndarray nodes_positions: The positions of the nodes in 'nodes' (e.g. the nodes of a view in the nodes of
+        its model), all nodes if not given
+    :param np.ndarray edges_positions: The positions of the edges in 'edges', all edges if not given
+    :return: distinct_nodes (in the order of the first node of every key)
+    :rtype: pd.DataFrame (index = node key, see compute_node_key)
     """
     # get the columns for the distinct nodes
     columns = list(nodes) + ['frequency', 'isRoot']
-    unique_nodes_set = pd.DataFrame(columns=columns)
+    if nodes_positions is None:
+        nodes_positions = np.arange(len(nodes))
+    if len(nodes_positions) == 0:
+        return pd.DataFrame(columns=columns)
 
-    # iterate over all nodes in 'nodes'
-    for i in range(0, len(nodes)):
-        # get all necessary attributes of 'current_node'
-        current_node = nodes.iloc[i]
-        current_node_id = current_node.name
-        current_node_index = str(current_node.loc['label']) + str(current_node.loc['type'])
+    # compute the key of every node
+    if nodes_keys is None:
+        keys = [compute_node_key(node_label, node_type) for node_label, node_type in
+                zip(nodes['label'].iloc[nodes_positions], nodes['type'].iloc[nodes_positions])]
+    else:
+        keys = [nodes_keys[node_id] for node_id in nodes.index[nodes_positions]]
+
+    # group the nodes by their key (the codes are numbered in the order of the first node of every key)
+    codes, distinct_keys = pd.factorize(np.asarray(keys, dtype=object))
+    frequencies = np.bincount(codes)
+    first_positions = nodes_positions[np.unique(codes, return_index=True)[1]]
+
+    # a node is a root node if it isn't the target of any edge
+    first_nodes_ids = nodes.index[first_positions]
+    targets = edges['target'] if edges_positions is None else edges['target'].iloc[edges_positions]
+    is_root = ~first_nodes_ids.isin(targets)
 
-        # check if 'current_node' is already in 'unique_nodes_set'
-        if current_node_index in list(unique_nodes_set.index):
-            # update frequency of 'current_node' in 'unique_nodes_set'
-            new_frequency = float(unique_nodes_set.loc[current_node_index]['frequency']) + float(1.0)
-            unique_nodes_set.at[current_node_index, 'frequency'] = new_frequency
+    distinct_nodes = {column: nodes[column].values[first_positions] for column in nodes}
+    distinct_nodes['frequency'] = frequencies
+    distinct_nodes['isRoot'] = is_root
 
-        # check if 'current_node' is not already in 'unique_nodes_set'
-        elif current_node_index not in list(unique_nodes_set.index):
-            # add 'current_node' to 'unique_nodes_set'
-            current_node_is_root_node = is_root_node(current_node_id, edges)
-            unique_nodes_set.loc[current_node_index] = [current_node.loc['label'], current_node.loc['type'], 1,
-                                                        current_node_is_root_node]
+    return pd.DataFrame(distinct_nodes, index=pd.Index(distinct_keys, dtype=object), columns=columns)
 
-    return unique_nodes_set
+
+def compute_nodes_keys(nodes: pd.DataFrame, nodes_positions: np.ndarray = None) -> dict:
+    """Method to compute the key (the index of the distinct nodes, see compute_node_key) of all nodes once, so the
+    distinct nodes and edges of all views of a model can be computed without building the keys again
+
+    :param pd.DataFrame nodes: Set of all nodes
+    :param np.ndarray nodes_positions: The positions of the nodes in 'nodes', all nodes if not given
+    :return: nodes_keys (key = node id, value = node key)
+    :rtype: dict
+    """
+    if nodes_positions is None:
+        nodes_positions = slice(None)
+    nodes_keys = {}
+    for node_id, node_label, node_type in zip(nodes.index[nodes_positions], nodes['label'].iloc[nodes_positions],
+                                              nodes['type'].iloc[nodes_positions]):
+        nodes_keys.setdefault(node_id, compute_node_key(node_label, node_type))
+
+    return nodes_keys
 
 
 def node_exists(nodes: pd.DataFrame, node_id: str) -> bool:
@@ -42,21 +77,24 @@ def node_exists(nodes: pd.DataFrame, node_id: str) -> bool:
     :return: True|False
     :rtype: bool
     """
-    nodes_index = list(nodes.index)
-
-    if node_id in nodes_index:
+    # hash lookup in the index of 'nodes'
+    if node_id in nodes.index:
         return True
     else:
         return False
 
 
-def is_root_node(node_id: str, edges: pd.DataFrame) -> bool:
+def is_root_node(node_id: str, edges: pd.DataFrame, adjacency: AdjacencyIndex = None) -> bool:
     """Method to check if a node is a root node
 
     :param node_id:
     :param edges:
+    :param AdjacencyIndex adjacency: The adjacency of the graph (None = scan 'edges')
     :return:
     """
+    if adjacency is not None:
+        return adjacency.get_in_degree(node_id) == 0
+
     # get all edges where the specific node is a target_node
     relevant_edges = edges[edges['target'] == node_id]
 
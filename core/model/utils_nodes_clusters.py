@@ -1,9 +1,11 @@
 import pandas as pd
 import copy
+from core.model.adjacency_index import AdjacencyIndex
+from core.model.utils_keys import compute_node_key
 
 
 def compute_node_index(nodes: pd.DataFrame, node_id: str) -> str:
-    """Method to compute the unique index of a node (label+type)
+    """Method to compute the unique index of a node (the node key of label and type, see compute_node_key)
 
     :param pd.DataFrame nodes: Set of all nodes
     :param node_id: The id of the node for which you want to compute the new index
@@ -14,46 +16,52 @@ def compute_node_index(nodes: pd.DataFrame, node_id: str) -> str:
     node = nodes.loc[node_id]
     node_label = node.loc['label']
     node_type = node.loc['type']
-    node_index = str(node_label) + str(node_type)
+    node_index = compute_node_key(node_label, node_type)
 
     return node_index
 
 
-def compute_connectivity(cluster_nodes: list, edges: pd.DataFrame) -> float:
+def compute_connectivity(cluster_nodes: list, edges: pd.DataFrame,
+                         adjacency: AdjacencyIndex = None) -> float:
     """Method to compute the connectivity for one cluster in one input model
 
     :param list cluster_nodes: The set of nodes of one cluster
     :param pd.DataFrame edges: The set of all edges of the input graph
+    :param AdjacencyIndex adjacency: The adjacency of the input graph (None = scan 'edges')
     :return: connectivity
     :rtype: float
     """
-    communities = detect_communities(cluster_nodes, edges)
+    communities = detect_communities(cluster_nodes, edges, adjacency)
     return 1 / len(communities)
 
 
-def detect_communities(cluster_nodes: list, edges: pd.DataFrame) -> list:
+def detect_communities(cluster_nodes: list, edges: pd.DataFrame,
+                       adjacency: AdjacencyIndex = None) -> list:
     """Method to detect communities for one cluster.
 
     :param list cluster_nodes: A list of all node_ids of the nodes in the cluster
     :param pd.DataFrame edges: The set of all edges of the input graph
+    :param AdjacencyIndex adjacency: The adjacency of the input graph (None = scan 'edges')
     :return: communities (list of lists)
     :rtype: list
     """
     relevant_nodes = copy.copy(cluster_nodes)
     communities = []
     while len(relevant_nodes) > 0:
-        community = detect_community(relevant_nodes, edges)
+        community = detect_community(relevant_nodes, edges, adjacency)
         communities.append(community)
         for node in community:
             relevant_nodes.remove(node)
     return communities
 
 
-def detect_community(cluster_nodes: list, edges: pd.DataFrame) -> list:
+def detect_community(cluster_nodes: list, edges: pd.DataFrame,
+                     adjacency: AdjacencyIndex = None) -> list:
     """Method to detect one community in a cluster.
 
     :param list cluster_nodes: A list of all node_ids of the nodes in the cluster
     :param pd. DataFrame edges: The set of all edges of the input graph
+    :param AdjacencyIndex adjacency: The adjacency of the input graph (None = scan 'edges')
     :return: community (set of node_ids)
     :rtype: list
     """
@@ -64,7 +72,7 @@ def detect_community(cluster_nodes: list, edges: pd.DataFrame) -> list:
 
     while len(visited) > 0:
         current_node = visited[0]
-        neighbours = compute_neighbours(edges, current_node)
+        neighbours = compute_neighbours(edges, current_node, adjacency)
         for i in range(0, len(neighbours)):
             current_neighbour = neighbours[i]
             if current_neighbour not in visited and current_neighbour not in community and current_neighbour in cluster_nodes:
@@ -76,14 +84,19 @@ def detect_community(cluster_nodes: list, edges: pd.DataFrame) -> list:
     return community
 
 
-def compute_neighbours(edges: pd.DataFrame, current_node_id: str) -> list:
+def compute_neighbours(edges: pd.DataFrame, current_node_id: str,
+                       adjacency: AdjacencyIndex = None) -> list:
     """Method to compute the neighbours of a node
 
     :param pd.DataFrame edges: The set of all edges of the input graph
     :param str current_node_id: The id of the node for which you want compute the neighbours
+    :param AdjacencyIndex adjacency: The adjacency of the input graph (None = scan 'edges')
     :return: relevant_nodes (set of neighbour node ids)
     :rtype: list
     """
+    if adjacency is not None:
+        return adjacency.get_neighbours(current_node_id)
+
     relevant_edges = edges[(edges['source'] == current_node_id) | (edges['target'] == current_node_id)]
     relevant_nodes = []
     for i in range(0, len(relevant_edges)):
@@ -96,12 +109,14 @@ def compute_neighbours(edges: pd.DataFrame, current_node_id: str) -> list:
     return relevant_nodes
 
 
-def compute_high_level_nodes(nodes: pd.DataFrame, edges: pd.DataFrame, node_type: str = False) -> list:
+def compute_high_level_nodes(nodes: pd.DataFrame, edges: pd.DataFrame, node_type: str = False,
+                             adjacency: AdjacencyIndex = None) -> list:
     """Method to compute the high level nodes of a graph (all nodes which have no parents)
 
     :param pd.DataFrame nodes: The set of nodes of the graph
     :param pd.DataFrame edges: The set of edges of the graph
     :param str node_type: The type of node which should be considered as high level nodes
+    :param AdjacencyIndex adjacency: The adjacency of the graph (None = scan 'edges')
     :return: A list with all node ids of the high level nodes
     :rtype: list
     """
@@ -109,6 +124,15 @@ def compute_high_level_nodes(nodes: pd.DataFrame, edges: pd.DataFrame, node_type
     high_level_nodes = []
     # iterate over all nodes
     nodes_index = list(nodes.index)
+    if adjacency is not None:
+        # a high level node is the target of no edge
+        for node_index in nodes_index:
+            if node_type and nodes.loc[node_index]['type'] != node_type:
+                continue
+            if adjacency.get_in_degree(node_index) == 0:
+                high_level_nodes.append(node_index)
+        return high_level_nodes
+
     if not node_type:
         for node_index in nodes_index:
             # compute all edges which has 'node' as their target
@@ -132,11 +156,13 @@ def compute_high_level_nodes(nodes: pd.DataFrame, edges: pd.DataFrame, node_type
     return high_level_nodes
 
 
-def compute_child_nodes(high_level_node: str, edges: pd.DataFrame) -> list:
+def compute_child_nodes(high_level_node: str, edges: pd.DataFrame,
+                        adjacency: AdjacencyIndex = None) -> list:
     """Method to compute the child nodes of a specific node
 
     :param high_level_node: The node for which one want to compute the children
     :param edges: The set of all edges of the graph
+    :param AdjacencyIndex adjacency: The adjacency of the graph (None = scan 'edges')
     :return: A list with all ids of the child nodes
     :rtype: list
     """
@@ -149,6 +175,13 @@ def compute_child_nodes(high_level_node: str, edges: pd.DataFrame) -> list:
     while len(visited_nodes) > 0:
         # get the current node
         current_node = visited_nodes.pop(0)
+        if adjacency is not None:
+            # the targets of all edges which has 'current_node' as their source
+            for child_node in adjacency.get_successors(current_node):
+                if child_node not in child_nodes:
+                    child_nodes.append(child_node)
+                    visited_nodes.append(child_node)
+            continue
         # compute all edges which has 'current_node' as their source
         relevant_edges = edges[edges['source'] == current_node]
         if len(relevant_edges) > 0:
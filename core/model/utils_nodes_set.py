@@ -9,9 +9,25 @@ def distinct_node_exists(nodes_set: pd.DataFrame, node_id: str) -> bool:
     :return: True|False
     :rtype: bool
     """
-    nodes_index = list(nodes_set.index)
-
-    if node_id in nodes_index:
+    # hash lookup in the index of 'nodes_set'
+    if node_id in nodes_set.index:
         return True
     else:
         return False
+
+
+def compute_nodes_lookup(nodes_set: pd.DataFrame) -> dict:
+    """Method to compute the lookup of the nodes in 'nodes_set' by their label and type
+
+    :param pd.DataFrame nodes_set: Set of all nodes
+    :return: nodes_lookup ((label, type) -> position of the first node with this label and type)
+    :rtype: dict
+    """
+    nodes_lookup = {}
+    for node_position, (node_label, node_type) in enumerate(zip(nodes_set['label'], nodes_set['type'])):
+        # missing labels or types never match (like in a comparison of the columns)
+        if pd.isna(node_label) or pd.isna(node_type):
+            continue
+        nodes_lookup.setdefault((node_label, node_type), node_position)
+
+    return nodes_lookup
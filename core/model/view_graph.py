@@ -0,0 +1,222 @@
+import numpy as np
+from core.model.graph import *
+from core.model.utils_nodes import compute_distinct_nodes, compute_nodes_keys
+from core.model.utils_edges import compute_distinct_edges
+
+
+class ViewGraph(Graph):
+
+    def __init__(self, model_nodes: pd.DataFrame, model_edges: pd.DataFrame, nodes_positions: list,
+                 edges_positions: list) -> None:
+        """Constructor of the graph of a view. Instead of an own copy of its nodes and edges the graph only keeps
+        their positions in the tables of the complete input model, which are shared by all views of the model.
+        The nodes and edges are sliced out of these tables when they are accessed, the slices aren't kept. The graph
+        copies them into own tables before it is changed for the first time.
+
+        :param pd.DataFrame model_nodes: All nodes of the input model (label|type)
+        :param pd.DataFrame model_edges: All edges of the input model (source|target|type)
+        :param list nodes_positions: The positions of the nodes of the view in 'model_nodes'
+        :param list edges_positions: The positions of the edges of the view in 'model_edges'
+        """
+        super().__init__(None, None)
+        self.__model_nodes = model_nodes
+        self.__model_edges = model_edges
+        self.__nodes_positions = np.asarray(nodes_positions, dtype=np.intp)
+        self.__edges_positions = np.asarray(edges_positions, dtype=np.intp)
+        # the statistics of the slices, they are computed on the first access
+        self.__node_stats = None
+        self.__edge_stats = None
+
+    @property
+    def nodes(self) -> pd.DataFrame:
+        """All nodes (label, type)
+
+        :return: nodes (a new slice of the model nodes, if no own nodes were set)
+        :rtype: pd.DataFrame
+        """
+        nodes = Graph.nodes.fget(self)
+        if nodes is None:
+            return self.__model_nodes.take(self.__nodes_positions)
+
+        return nodes
+
+    @nodes.setter
+    def nodes(self, nodes: pd.DataFrame) -> None:
+        Graph.nodes.fset(self, nodes)
+        self.__node_stats = None
+
+    @property
+    def edges(self) -> pd.DataFrame:
+        """All edges (source, target, type)
+
+        :return: edges (a new slice of the model edges, if no own edges were set)
+        :rtype: pd.DataFrame
+        """
+        edges = Graph.edges.fget(self)
+        if edges is None:
+            return self.__model_edges.take(self.__edges_positions)
+
+        return edges
+
+    @edges.setter
+    def edges(self, edges: pd.DataFrame) -> None:
+        Graph.edges.fset(self, edges)
+        self.__edge_stats = None
+
+    @property
+    def model_nodes(self) -> pd.DataFrame:
+        """Method to get all nodes of the input model, which are shared by all views of the model
+
+        :return: model_nodes
+        :rtype: pd.DataFrame
+        """
+        return self.__model_nodes
+
+    @property
+    def model_edges(self) -> pd.DataFrame:
+        """Method to get all edges of the input model, which are shared by all views of the model
+
+        :return: model_edges
+        :rtype: pd.DataFrame
+        """
+        return self.__model_edges
+
+    @property
+    def nodes_positions(self) -> np.ndarray:
+        """Method to get the positions of the nodes of the view in the nodes of the input model
+
+        :return: nodes_positions
+        :rtype: np.ndarray
+        """
+        return self.__nodes_positions
+
+    @property
+    def edges_positions(self) -> np.ndarray:
+        """Method to get the positions of the edges of the view in the edges of the input model
+
+        :return: edges_positions
+        :rtype: np.ndarray
+        """
+        return self.__edges_positions
+
+    @property
+    def node_stats(self) -> pd.Series:
+        """Method to get the number of nodes per type
+
+        :return: node_stats (None if the graph has less than two nodes)
+        :rtype: pd.Series
+        """
+        if Graph.nodes.fget(self) is None:
+            if self.__node_stats is None:
+                self.__node_stats = Nodes(self.nodes).node_stats
+            return self.__node_stats
+
+        return super().node_stats
+
+    @property
+    def edge_stats(self) -> pd.Series:
+        """Method to get the number of edges per type
+
+        :return: edge_stats (None if the graph has less than two edges)
+        :rtype: pd.Series
+        """
+        if Graph.edges.fget(self) is None:
+            if self.__edge_stats is None:
+                self.__edge_stats = Edges(self.edges).edge_stats
+            return self.__edge_stats
+
+        return super().edge_stats
+
+    def __get_nodes_table(self) -> tuple:
+        """Method to get the table with the nodes of the graph and their positions in it
+
+        :return: (nodes, nodes_positions) the model nodes and the positions of the view, or the own nodes and None
+        :rtype: tuple
+        """
+        nodes = Graph.nodes.fget(self)
+        if nodes is None:
+            return self.__model_nodes, self.__nodes_positions
+
+        return nodes, None
+
+    def __get_edges_table(self) -> tuple:
+        """Method to get the table with the edges of the graph and their positions in it
+
+        :return: (edges, edges_positions) the model edges and the positions of the view, or the own edges and None
+        :rtype: tuple
+        """
+        edges = Graph.edges.fget(self)
+        if edges is None:
+            return self.__model_edges, self.__edges_positions
+
+        return edges, None
+
+    def _before_change(self) -> None:
+        """Method to copy the slices of the model tables into own nodes and edges, before the graph is changed for
+        the first time (the tables of the input model are shared by all its views)
+
+        """
+        if Graph.nodes.fget(self) is None:
+            self.nodes = self.__model_nodes.take(self.__nodes_positions)
+        if Graph.edges.fget(self) is None:
+            self.edges = self.__model_edges.take(self.__edges_positions)
+
+    def _compute_content_hash(self) -> str:
+        """Method to compute the canonical hash of the nodes and edges (see Graph.content_hash) from the positions in
+        the model tables
+
+        :return: content_hash
+        :rtype: str
+        """
+        nodes, nodes_positions = self.__get_nodes_table()
+        edges, edges_positions = self.__get_edges_table()
+
+        return compute_graph_hash(nodes, edges, nodes_positions, edges_positions)
+
+    def initialize_distinct_nodes(self, nodes_keys: dict = None):
+        """Method to initialize the distinct_nodes from the positions in the model tables
+
+        :param dict nodes_keys: The key of every node id (see compute_nodes_keys), will be computed if not given
+        """
+        nodes, nodes_positions = self.__get_nodes_table()
+        edges, edges_positions = self.__get_edges_table()
+        self.distinct_nodes = compute_distinct_nodes(nodes, edges, nodes_keys, nodes_positions, edges_positions)
+
+    def initialize_distinct_edges(self, nodes_keys: dict = None):
+        """Method to initialize the distinct_edges from the positions in the model tables
+
+        :param dict nodes_keys: The key of every node id (see compute_nodes_keys), will be computed if not given
+        """
+        nodes, nodes_positions = self.__get_nodes_table()
+        edges, edges_positions = self.__get_edges_table()
+        if nodes_keys is None:
+            nodes_keys = compute_nodes_keys(nodes, nodes_positions)
+        else:
+            # only the nodes of the view count as known endpoints
+            nodes_ids = nodes.index if nodes_positions is None else nodes.index[nodes_positions]
+            nodes_keys = {node_id: nodes_keys[node_id] for node_id in nodes_ids}
+        self.distinct_edges = compute_distinct_edges(edges, nodes, self.distinct_nodes, nodes_keys, edges_positions)
+
+    def node_exists(self, node_id: str) -> bool:
+        """Method to check if a specific nodes exists in the graph
+
+        :param str node_id: The id of the node
+        :return: True|False
+        :rtype: bool
+        """
+        if Graph.nodes.fget(self) is None:
+            return node_id in self.__model_nodes.index[self.__nodes_positions]
+
+        return super().node_exists(node_id)
+
+    def edge_exists(self, edge_id: str) -> bool:
+        """Method to check if a specific edge exists
+
+        :param str edge_id: The id of the edge
+        :return: True|False
+        :rtype: bool
+        """
+        if Graph.edges.fget(self) is None:
+            return edge_id in self.__model_edges.index[self.__edges_positions]
+
+        return super().edge_exists(edge_id)
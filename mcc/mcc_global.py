@@ -1,23 +1,32 @@
+from typing import Iterable
 from core.model.graph import *
+from core.model.utils_keys import compute_node_key, ROOT_NODE_KEY
+from core.model.graph_summary import GraphSummary
 from core.model.edges_set import *
 from core.model.nodes_set import *
 from core.model.reserved_edges_set import *
 from core.loader.data_loader import *
+from core.loader.utils_data_loader import map_files, uses_workers, Executor
+from core.loader.model_validator import check_files
 from mcc.utils_mcc import update_nodes_set, update_edges_set, initialize_cost_values, \
-    compute_artificial_edges, check_graph_for_all_reserved_edges, check_graph_for_relevant_reserved_edges
-import copy
+    compute_artificial_edges, check_graph_for_all_reserved_edges, check_graph_for_relevant_reserved_edges, load_graph, \
+    load_model_graph, intern_graph
 
 
 class MCCGlobal:
 
-    def __init__(self, path: str, move_cost: float, delete_cost: float, insert_cost: float, threshold: float) -> None:
+    def __init__(self, path: str, move_cost: float, delete_cost: float, insert_cost: float, threshold: float,
+                 element_types: list = None, relationship_types: list = None) -> None:
         """Constructor
 
-        :param str path: The path to the directory where your files are located
+        :param str path: The path to the directory (or zip/tar archive) where your files are located
         :param float move_cost: The cost for the move operation
         :param float delete_cost: The cost for the delete operation
         :param float insert_cost: The cost for the insert operation
         :param: float threshold: The threshold the edges have to fulfill to get into the reference graph
+        :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all),
+            all other elements and their relationships are skipped while loading the input models
+        :param list relationship_types: The relationship types of the edges to load (None = all)
         """
         self.__path = r'' + path
         self.__graphs = []
@@ -29,6 +38,10 @@ class MCCGlobal:
         self.__insert_cost = float(insert_cost)
         self.__threshold = float(threshold)
         self.__rm_graph = None
+        self.__element_types = element_types
+        self.__relationship_types = relationship_types
+        self.__models_count = 0
+        self.__summaries = []
 
     @property
     def path(self) -> str:
@@ -56,6 +69,50 @@ class MCCGlobal:
     def graphs(self, graphs: list) -> None:
         self.__graphs = graphs
 
+    @property
+    def models_count(self) -> int:
+        """Method to get the number of input models which were folded into the sets (see fold_models)
+
+        :return: models_count
+        :rtype: int
+        """
+        return self.__models_count
+
+    @property
+    def summaries(self) -> list:
+        """Method to get the compact data of the folded input models (see fold_models)
+
+        :return: summaries (list of GraphSummary)
+        :rtype: list
+        """
+        return self.__summaries
+
+    @property
+    def element_types(self) -> list:
+        """Method to get the element types (or ArchiMate layers) of the nodes to load
+
+        :return: element_types (None = all)
+        :rtype: list
+        """
+        return self.__element_types
+
+    @element_types.setter
+    def element_types(self, element_types: list) -> None:
+        self.__element_types = element_types
+
+    @property
+    def relationship_types(self) -> list:
+        """Method to get the relationship types of the edges to load
+
+        :return: relationship_types (None = all)
+        :rtype: list
+        """
+        return self.__relationship_types
+
+    @relationship_types.setter
+    def relationship_types(self, relationship_types: list) -> None:
+        self.__relationship_types = relationship_types
+
     @property
     def edges_set(self) -> pd.DataFrame:
         """Method to get all edges of edges_set
@@ -159,32 +216,48 @@ class MCCGlobal:
         """
         self.__graphs.append(graph)
 
-    def load_graphs(self):
-        """Method to load xml documents from the specified directory and transform them into a list of graphs
+    def get_model_paths(self, jobs: int = 1, executor: Executor = None, on_invalid: str = None) -> list:
+        """Method to get the paths of all files in the specified directory (or archive)
 
+        :param int jobs: Number of worker processes to check the files with (1 = serial, None = number of processors)
+        :param Executor executor: Executor to check the files with instead of a new process pool
+        :param str on_invalid: If set all files are checked first, invalid files are left out ('skip') or a
+            ModelValidationError with the problems of all invalid files is raised ('abort')
+        :return: doc_paths
+        :rtype: list
         """
         data_loader = DataLoader(self.__path)
-        # get filenames of all files in specified directory
+        # get filenames of all files in specified directory (or archive)
         filenames = data_loader.load_file_names()
+        doc_paths = [data_loader.get_file_path(str(filename)) for filename in filenames]
+        # check all files before the first one is loaded
+        filenames, doc_paths = check_files(filenames, doc_paths, on_invalid, 'global', jobs, executor)
 
-        # open all files and convert them into graphs
-        for filename in filenames:
-            # load the current file into a dict
-            doc = data_loader.load_file(self.__path + '\\' + str(filename))
-            # get all nodes and edges out of 'doc'
-            nodes = data_loader.get_all_nodes(doc)
-            edges = data_loader.get_all_edges(doc)
+        return doc_paths
 
-            # initialize graph with 'nodes' and 'edges'
-            graph = Graph(nodes, edges)
+    def load_graphs(self, streaming: bool = False, jobs: int = 1, executor: Executor = None, cache_dir: str = None,
+                    on_invalid: str = None):
+        """Method to load xml documents from the specified directory and transform them into a list of graphs
 
-            # initialize/compute the distinct nodes and edges of 'graph'
+        :param bool streaming: If True the files are read with the incremental parser of the DataLoader
+        :param int jobs: Number of worker processes to load the files with (1 = serial, None = number of processors)
+        :param Executor executor: Executor to load the files with instead of a new process pool
+        :param str cache_dir: The directory where the extracted data of the files is cached (None = no cache)
+        :param str on_invalid: If set all files are checked before loading them, invalid files are left out ('skip')
+            or a ModelValidationError with the problems of all invalid files is raised ('abort')
+        """
+        doc_paths = self.get_model_paths(jobs, executor, on_invalid)
 
-            graph.initialize_distinct_nodes()
-            graph.initialize_distinct_edges()
+        # open all files and convert them into graphs (the graphs are returned in the order of 'doc_paths')
+        graphs = map_files(load_graph, doc_paths, jobs, executor, streaming=streaming,
+                           cache_dir=cache_dir, element_types=self.__element_types,
+                           relationship_types=self.__relationship_types)
+        if uses_workers(jobs, executor):
+            # the graphs of the workers don't share the strings and types of this process
+            graphs = [intern_graph(graph) for graph in graphs]
 
-            # append 'graph' to 'graphs'
-            self.__graphs.append(graph)
+        # append all graphs to 'graphs'
+        self.__graphs += graphs
 
     def initiate_sets(self):
         """Method to initiate edges_set and nodes_set for the MCC algorithm
@@ -195,10 +268,46 @@ class MCCGlobal:
         graph_size = len(self.__graphs)
 
         # insert all edges and nodes of 'graph' into 'edges_set' and 'nodes_set'
-        for graph in self.__graphs:
+        # identical input graphs are only inserted once, weighted with the number of their copies
+        graphs, weights = deduplicate_graphs(self.__graphs)
+        for graph, weight in zip(graphs, weights):
+            update_nodes_set(graph, self.__nodes_set, weight)
+            update_edges_set(graph, self.__edges_set, weight)
+
+        self.__complete_sets(graph_size)
+
+    def fold_models(self, models: Iterable, streaming: bool = False, cache_dir: str = None,
+                    keep_summaries: bool = False) -> None:
+        """Method to insert the distinct nodes and edges of input models into edges_set and nodes_set one model after
+        another, without keeping their graphs (use complete_sets instead of initiate_sets afterwards)
+
+        :param Iterable models: The input models, every model can be the path to a file, the content of a file as
+            bytes, a dict with its extracted tables or a Graph (see load_model_graph)
+        :param bool streaming: If True files are read with the incremental parser of the DataLoader
+        :param str cache_dir: The directory where the extracted data of files is cached (None = no cache)
+        :param bool keep_summaries: If True the nodes clusters of every model are kept for the RefPa algorithm
+            (see summaries)
+        """
+        for model in models:
+            graph = load_model_graph(model, streaming, cache_dir, self.__element_types, self.__relationship_types)
             update_nodes_set(graph, self.__nodes_set)
             update_edges_set(graph, self.__edges_set)
+            self.__models_count += 1
+            if keep_summaries:
+                self.__summaries.append(GraphSummary(graph))
 
+    def complete_sets(self) -> None:
+        """Method to complete edges_set and nodes_set after all input models were folded into them (see fold_models)
+
+        """
+        self.__complete_sets(self.__models_count)
+
+    def __complete_sets(self, graph_size: int) -> None:
+        """Method to add the artificial root edges to the sets, compute the relative frequencies and initialize the
+        cost values
+
+        :param int graph_size: The number of input models in the sets
+        """
         # create artificial edge for all root_nodes
         compute_artificial_edges(self.nodes_set, self.edges_set)
 
@@ -220,7 +329,7 @@ class MCCGlobal:
 
         # nodes and edges to build the initial rm_graph
         rm_edges = pd.DataFrame(columns=['source', 'target', 'type','frequency'])
-        rm_nodes = pd.DataFrame.from_dict({'NoneNone': [None, None, None]}, orient='index', columns=['label', 'type', 'frequency'])
+        rm_nodes = pd.DataFrame.from_dict({ROOT_NODE_KEY: [None, None, None]}, orient='index', columns=['label', 'type', 'frequency'])
 
         # build initial rm_graph
         self.__rm_graph = Graph(rm_nodes, rm_edges)
@@ -228,7 +337,7 @@ class MCCGlobal:
         # add new edges until 'frequent_edge_exists' is False
         while frequent_edge_exists is True:
             # get the most frequent edge out of edges_set
-            new_edge = copy.deepcopy(self.__edges_set.get_most_frequent_edge())
+            new_edge = self.__edges_set.get_most_frequent_edge()
 
             # check if 'new_edge' is None (this is the case when we already get all edges out of 'edges_set'
             # -> 'edges_set' is then empty)
@@ -281,8 +390,8 @@ class MCCGlobal:
         nodes_types = list(self.rm_graph.nodes.type.unique())
         stats = pd.DataFrame(columns=['#nodes']+nodes_types+['#edges']+edges_types)
 
-        edges_stats = self.rm_graph.edges.groupby('type').size()
-        nodes_stats = self.rm_graph.nodes.groupby('type').size()
+        edges_stats = self.rm_graph.edges.groupby('type', observed=True).size()
+        nodes_stats = self.rm_graph.nodes.groupby('type', observed=True).size()
 
     def get_node_frequency(self, node: Nodes) -> float:
         """Method to get the  frequency of a Nodes object
@@ -291,7 +400,7 @@ class MCCGlobal:
         :rtype: float
         """
         # compute the id of the node
-        node_id = str(node.loc['label']) + str(node.loc['type'])
+        node_id = compute_node_key(node.loc['label'], node.loc['type'])
         # get the frequency from the nodes_set
         frequency = self.nodes_set.loc[node_id]['frequency']
         return frequency
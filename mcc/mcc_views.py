@@ -1,24 +1,32 @@
-import copy
+import tempfile
 
 from core.loader.data_loader import *
 from core.model.edges_set import *
 from core.model.graph import *
+from core.model.utils_keys import compute_node_key, ROOT_NODE_KEY
 from core.model.nodes_set import *
 from core.model.reserved_edges_set import *
+from core.loader.utils_data_loader import map_files, uses_workers, get_file_signature, Executor
+from core.loader.model_validator import check_files
 from mcc.utils_mcc import update_nodes_set, update_edges_set, initialize_cost_values, \
-    compute_artificial_edges, check_graph_for_all_reserved_edges, check_graph_for_relevant_reserved_edges
+    compute_artificial_edges, check_graph_for_all_reserved_edges, check_graph_for_relevant_reserved_edges, \
+    load_graph_views, load_view_names, load_graph_view, view_graph_changed, intern_graph_views
 
 
 class MCCViews:
 
-    def __init__(self, path: str, move_cost: float, delete_cost: float, insert_cost: float, threshold: float) -> None:
+    def __init__(self, path: str, move_cost: float, delete_cost: float, insert_cost: float, threshold: float,
+                 element_types: list = None, relationship_types: list = None) -> None:
         """Constructor
 
-        :param str path: The path to the directory where your files are located
+        :param str path: The path to the directory (or zip/tar archive) where your files are located
         :param float move_cost: The cost for the move operation
         :param float delete_cost: The cost for the delete operation
         :param float insert_cost: The cost for the insert operation
         :param: float threshold: The threshold the edges have to fulfill to get into the reference graph
+        :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all),
+            all other elements and their relationships are skipped while loading the input models
+        :param list relationship_types: The relationship types of the edges to load (None = all)
         """
         self.__path = r'' + path
         self.__graphs = pd.DataFrame(columns=['model'])
@@ -30,8 +38,16 @@ class MCCViews:
         self.__insert_cost = float(insert_cost)
         self.__threshold = float(threshold)
         self.__rm_graph = None
+        self.__element_types = element_types
+        self.__relationship_types = relationship_types
         self.__current_views = []
-        self.__view_names = []
+        self.__views_index = {}
+        self.__file_signatures = {}
+        # lazy mode: the view names of every file, the options to build the graphs of a view on demand and the
+        # temporary directory for the extracted views (if no cache directory was given)
+        self.__models_view_names = {}
+        self.__lazy_options = None
+        self.__lazy_cache = None
 
     @property
     def path(self) -> str:
@@ -59,6 +75,32 @@ class MCCViews:
     def graphs(self, graphs: list) -> None:
         self.__graphs = graphs
 
+    @property
+    def element_types(self) -> list:
+        """Method to get the element types (or ArchiMate layers) of the nodes to load
+
+        :return: element_types (None = all)
+        :rtype: list
+        """
+        return self.__element_types
+
+    @element_types.setter
+    def element_types(self, element_types: list) -> None:
+        self.__element_types = element_types
+
+    @property
+    def relationship_types(self) -> list:
+        """Method to get the relationship types of the edges to load
+
+        :return: relationship_types (None = all)
+        :rtype: list
+        """
+        return self.__relationship_types
+
+    @relationship_types.setter
+    def relationship_types(self, relationship_types: list) -> None:
+        self.__relationship_types = relationship_types
+
     @property
     def edges_set(self) -> pd.DataFrame:
         """Method to get all edges of edges_set
@@ -162,7 +204,41 @@ class MCCViews:
 
     @property
     def view_names(self) -> list:
-        return self.__view_names
+        """Method to get the names of all views of the input models (in order of appearance)
+
+        :return: view_names
+        :rtype: list
+        """
+        return list(self.__views_index.keys())
+
+    @property
+    def lazy(self) -> bool:
+        """Method to check if the graphs of the views are built on demand (see load_graphs_views)
+
+        :return: True|False
+        :rtype: bool
+        """
+        return self.__lazy_options is not None
+
+    @property
+    def views_index(self) -> dict:
+        """Method to get the view index which maps every view name to the graphs of this view of all input models
+        (in the order of the input models). In lazy mode the paths and hashes of the files are mapped instead of the
+        graphs (see load_graph_view)
+
+        :return: views_index
+        :rtype: dict
+        """
+        return self.__views_index
+
+    def get_view_names(self, min_support: int = 1) -> list:
+        """Method to get the names of all views which exist in at least 'min_support' input models
+
+        :param int min_support: The minimum number of input models which have to contain the view
+        :return: view_names
+        :rtype: list
+        """
+        return [view_name for view_name, views in self.__views_index.items() if len(views) >= min_support]
 
     def get_most_frequent_edge(self) -> pd.Series:
         """Method to get the most frequent_edges out of edges_set
@@ -180,61 +256,240 @@ class MCCViews:
         """
         self.__graphs.append(graph)
 
-    def load_graphs_views(self):
+    def load_graphs_views(self, streaming: bool = False, jobs: int = 1, executor: Executor = None, cache_dir: str = None,
+                          lazy: bool = False, on_invalid: str = None):
         """Method to load xml documents from the specified directory and transform them into a set of graphs
 
+        :param bool streaming: If True the files are read with the incremental parser of the DataLoader
+        :param int jobs: Number of worker processes to load the files with (1 = serial, None = number of processors)
+        :param Executor executor: Executor to load the files with instead of a new process pool
+        :param str cache_dir: The directory where the extracted data of the files is cached (None = no cache)
+        :param bool lazy: If True every file is read once and the graphs of its views are stored in separate entries
+            of the cache (in a temporary directory if no 'cache_dir' is given). Only the view names are kept, the
+            graphs of a view are loaded out of the cache when they are requested (get_views) and released after
+            mining the view
+        :param str on_invalid: If set all files are checked before loading them, invalid files are left out ('skip')
+            or a ModelValidationError with the problems of all invalid files is raised ('abort')
         """
         data_loader = DataLoader(self.__path)
-        # get filenames of all files in specified directory
+        # get filenames of all files in specified directory (or archive)
         filenames = data_loader.load_file_names()
+        doc_paths = [data_loader.get_file_path(str(filename)) for filename in filenames]
+        # check all files before the first one is loaded
+        filenames, doc_paths = check_files(filenames, doc_paths, on_invalid, 'views', jobs, executor)
+
+        if lazy:
+            if cache_dir is None:
+                # the directory is deleted together with this object
+                self.__lazy_cache = tempfile.TemporaryDirectory(prefix='mcc-views-')
+                cache_dir = self.__lazy_cache.name
+            self.__lazy_options = {'streaming': streaming, 'cache_dir': cache_dir,
+                                   'element_types': self.__element_types,
+                                   'relationship_types': self.__relationship_types}
+            # only keep the names of the views of all files (the results are in the order of 'doc_paths')
+            models_view_names = map_files(load_view_names, doc_paths, jobs, executor, **self.__lazy_options)
+            for filename, doc_path, (file_hash, model_view_names) in zip(filenames, doc_paths, models_view_names):
+                self.__models_view_names[str(filename)] = (doc_path, file_hash, model_view_names)
+                self.__file_signatures[str(filename)] = get_file_signature(doc_path)
+
+            self.__build_views_index()
+            return
+
+        # open all files and convert their views into graphs (the results are in the order of 'doc_paths')
+        models = map_files(load_graph_views, doc_paths, jobs, executor, streaming=streaming,
+                           cache_dir=cache_dir, element_types=self.__element_types,
+                           relationship_types=self.__relationship_types)
+
+        for filename, doc_path, (model_view_names, model_graphs) in zip(filenames, doc_paths, models):
+            if uses_workers(jobs, executor):
+                # the graphs of the workers don't share the strings and types of this process
+                model_graphs = intern_graph_views(model_graphs)
+            self.__graphs.loc[filename] = [model_graphs]
+            self.__file_signatures[filename] = get_file_signature(doc_path)
+
+        self.__build_views_index()
+
+    def update_graphs_views(self, streaming: bool = None, jobs: int = 1, executor: Executor = None,
+                            cache_dir: str = None, on_invalid: str = None) -> list:
+        """Method to reload all files which were added, changed or deleted since they were loaded
+
+        :param bool streaming: If True the files are read with the incremental parser of the DataLoader (None = False,
+            in lazy mode the option of load_graphs_views is used, another value raises a ValueError)
+        :param int jobs: Number of worker processes to load the files with (1 = serial, None = number of processors)
+        :param Executor executor: Executor to load the files with instead of a new process pool
+        :param str cache_dir: The directory where the extracted data of the files is cached (None = no cache, in lazy
+            mode the directory of load_graphs_views is used, another directory raises a ValueError)
+        :param str on_invalid: If set the changed files are checked before loading them, invalid files are left out
+            like deleted files until they are changed again ('skip') or a ModelValidationError is raised ('abort')
+        :return: The names of all views which changed in at least one model (have to be mined again)
+        :rtype: list
+        """
+        if self.lazy:
+            for option, value in [('streaming', streaming), ('cache_dir', cache_dir)]:
+                if value is not None and value != self.__lazy_options[option]:
+                    raise ValueError('in lazy mode the files are reloaded with the ' + option + ' option of '
+                                     'load_graphs_views, it can\'t be changed')
+
+        data_loader = DataLoader(self.__path)
+        filenames = [str(filename) for filename in data_loader.load_file_names()]
+        changed_views = []
 
-        # open all files and convert them into graphs
+        # get all files which were added or changed
+        changed_filenames = []
+        changed_signatures = []
         for filename in filenames:
-            # load the current file into a dict
-            doc = data_loader.load_file(self.__path + '\\' + str(filename))
-            # initialize the DataFrame for the doc views
-            doc_views = pd.DataFrame(columns=['nodes', 'edges'])
-            # get all views of 'doc'
-            views = data_loader.get_all_views(doc)
-
-            # iterate over all views to get the node and edge ids of all views
-            for i in range(0, len(views)):
-                view_name = str(views[i]['name']['#text']).lower()
-                view_nodes = data_loader.get_view_nodes(views[i])
-                if len(view_nodes) is 0:
-                    continue
-                # view_id = data_loader.get_view_name(view_name)
-                view_edges = data_loader.get_view_edges(views[i])
-                doc_views.loc[view_name] = [view_nodes, view_edges]
-                if view_name not in self.__view_names:
-                    self.__view_names.append(view_name)
-
-            # initialize the final DataFrame for the views of the graph
-            graph_views = pd.DataFrame(columns=['nodes', 'edges'])
-            # iterate over all views in 'doc_views' to get the edge and node objects out of 'doc'
-            for i in range(0, len(doc_views)):
-                current_view = doc_views.iloc[i]
-                current_view_name = current_view.name
-                current_view_nodes = data_loader.get_all_view_nodes_objects(doc, current_view.loc['nodes'])
-                current_view_edges = data_loader.get_all_view_edges_objects(doc, current_view.loc['edges'],
-                                                                            current_view.loc['nodes'])
-                graph_views.loc[current_view_name] = [current_view_nodes, current_view_edges]
-
-            model_graphs = pd.DataFrame(columns=['graph'])
-
-            # iterate over all views in 'graph_views'
-            for i in range(0, len(graph_views)):
-                current_graph_nodes = graph_views.iloc[i]['nodes']
-                current_graph_edges = graph_views.iloc[i]['edges']
-                current_graph = Graph(current_graph_nodes, current_graph_edges)
-
-                # initialize/compute the distinct nodes and edges of 'graph'
-                current_graph.initialize_distinct_nodes()
-                current_graph.initialize_distinct_edges()
-
-                model_graphs.loc[graph_views.iloc[i].name] = [current_graph]
+            signature = get_file_signature(data_loader.get_file_path(filename))
+            if self.__file_signatures.get(filename) != signature:
+                changed_filenames.append(filename)
+                changed_signatures.append(signature)
+
+        doc_paths = [data_loader.get_file_path(filename) for filename in changed_filenames]
+        # check the changed files, invalid ones are handled again after their next change
+        signatures = dict(zip(changed_filenames, changed_signatures))
+        changed_filenames, doc_paths = check_files(changed_filenames, doc_paths, on_invalid, 'views', jobs, executor)
+        changed_signatures = [signatures[filename] for filename in changed_filenames]
+        # remember the signatures of the skipped files, so they aren't checked again on every call
+        skipped_filenames = set(signatures) - set(changed_filenames)
+        for filename in skipped_filenames:
+            self.__file_signatures[filename] = signatures[filename]
+        # forget the signatures of all deleted files (also of skipped files which were never loaded)
+        self.__file_signatures = {filename: signature for filename, signature in self.__file_signatures.items()
+                                  if filename in filenames}
+        # the previously loaded state of a skipped file is outdated, so it is dropped like a deleted file
+        filenames = [filename for filename in filenames if filename not in skipped_filenames]
+        if self.lazy:
+            return self.__update_models_view_names(filenames, changed_filenames, changed_signatures, doc_paths, jobs,
+                                                   executor)
+
+        # reload the changed files and compare their views with the loaded ones
+        models = map_files(load_graph_views, doc_paths, jobs, executor, streaming=bool(streaming),
+                           cache_dir=cache_dir, element_types=self.__element_types,
+                           relationship_types=self.__relationship_types)
+        for filename, signature, (model_view_names, model_graphs) in zip(changed_filenames, changed_signatures,
+                                                                       models):
+            if uses_workers(jobs, executor):
+                model_graphs = intern_graph_views(model_graphs)
+            if filename in self.__graphs.index:
+                old_model_graphs = self.__graphs.loc[filename]['model']
+            else:
+                old_model_graphs = pd.DataFrame(columns=['graph'])
+            for view_name in list(old_model_graphs.index) + list(model_graphs.index):
+                old_graph = old_model_graphs.loc[view_name]['graph'] if view_name in old_model_graphs.index else None
+                new_graph = model_graphs.loc[view_name]['graph'] if view_name in model_graphs.index else None
+                if view_graph_changed(old_graph, new_graph) and view_name not in changed_views:
+                    changed_views.append(view_name)
 
             self.__graphs.loc[filename] = [model_graphs]
+            self.__file_signatures[filename] = signature
+
+        # drop all deleted (and skipped) files
+        for filename in list(self.__graphs.index):
+            if filename not in filenames:
+                for view_name in self.__graphs.loc[filename]['model'].index:
+                    if view_name not in changed_views:
+                        changed_views.append(view_name)
+                self.__graphs.drop(filename, inplace=True)
+
+        # keep the models and view names in the order of a fresh load
+        self.__graphs = self.__graphs.loc[[filename for filename in filenames if filename in self.__graphs.index]]
+        self.__build_views_index()
+
+        return changed_views
+
+    def __update_models_view_names(self, filenames: list, changed_filenames: list, changed_signatures: list,
+                                   doc_paths: list, jobs: int, executor: Executor) -> list:
+        """Method to reload the view names of the changed files in lazy mode, all views of a changed file count as
+        changed (their graphs are not kept to compare them)
+
+        :return: The names of all views which changed in at least one model
+        :rtype: list
+        """
+        changed_views = []
+        models_view_names = map_files(load_view_names, doc_paths, jobs, executor, **self.__lazy_options)
+        for filename, signature, doc_path, (file_hash, model_view_names) in zip(changed_filenames, changed_signatures,
+                                                                                doc_paths, models_view_names):
+            old_model_view_names = self.__models_view_names.get(filename, (None, None, []))[2]
+            for view_name in old_model_view_names + model_view_names:
+                if view_name not in changed_views:
+                    changed_views.append(view_name)
+
+            self.__models_view_names[filename] = (doc_path, file_hash, model_view_names)
+            self.__file_signatures[filename] = signature
+
+        # drop all deleted (and skipped) files
+        for filename in list(self.__models_view_names.keys()):
+            if filename not in filenames:
+                for view_name in self.__models_view_names[filename][2]:
+                    if view_name not in changed_views:
+                        changed_views.append(view_name)
+                del self.__models_view_names[filename]
+
+        # keep the models and view names in the order of a fresh load
+        self.__models_view_names = {filename: self.__models_view_names[filename] for filename in filenames
+                                    if filename in self.__models_view_names}
+        self.__build_views_index()
+
+        return changed_views
+
+    def __build_views_index(self) -> None:
+        """Method to build the view index out of the graphs of all input models
+
+        :return: None
+        """
+        self.__views_index = {}
+        if self.lazy:
+            for doc_path, file_hash, model_view_names in self.__models_view_names.values():
+                for view_name in model_view_names:
+                    self.__views_index.setdefault(view_name, []).append((doc_path, file_hash))
+            return
+
+        for i in range(0, len(self.__graphs)):
+            model_graphs = self.__graphs.iloc[i]['model']
+            # the view names are collected in order of appearance over all input models
+            for view_name, graph in zip(model_graphs.index, model_graphs['graph']):
+                self.__views_index.setdefault(view_name, []).append(graph)
+
+    def get_views(self, view_name: str) -> list:
+        """Method to get the graphs of a view of all models which contain the view
+
+        :param str view_name: The name of the view
+        :return: views
+        :rtype: list
+        """
+        if self.lazy:
+            # load the graphs of the view out of the cache entries of the files which contain it
+            return [load_graph_view(doc_path, file_hash, view_name, **self.__lazy_options)
+                    for doc_path, file_hash in self.__views_index.get(view_name, [])]
+
+        return self.__views_index.get(view_name, [])
+
+    def iter_views(self, min_support: int = 1):
+        """Generator to get the graphs of all views (which exist in at least 'min_support' input models) one view
+        name after another. In lazy mode the graphs of a view are only built when the view is reached
+
+        :param int min_support: The minimum number of input models which have to contain the view
+        :return: (view_name, views) for every view
+        :rtype: generator
+        """
+        for view_name in self.get_view_names(min_support):
+            yield view_name, self.get_views(view_name)
+
+    def mine_view(self, view_name: str) -> Graph:
+        """Method to execute the MCC-views algorithm for one view of all models
+
+        :param str view_name: The name of the view
+        :return: A snapshot of the reference graph of the view
+        :rtype: Graph
+        """
+        self.current_views = self.get_views(view_name)
+        self.initiate_sets()
+        self.execute()
+
+        if self.lazy:
+            # release the graphs of the view
+            self.current_views = []
+
+        return self.rm_graph.snapshot()
 
     def initiate_sets(self):
         """Method to initiate edges_set and nodes_set for the MCC algorithm
@@ -249,9 +504,11 @@ class MCCViews:
                                                           inplace=True)
 
         # insert all edges and nodes of 'view' into 'edges_set' and 'nodes_set'
-        for view in self.current_views:
-            update_nodes_set(view, self.__nodes_set)
-            update_edges_set(view, self.__edges_set)
+        # identical input graphs are only inserted once, weighted with the number of their copies
+        views, weights = deduplicate_graphs(self.current_views)
+        for view, weight in zip(views, weights):
+            update_nodes_set(view, self.__nodes_set, weight)
+            update_edges_set(view, self.__edges_set, weight)
 
         # create artificial edge for all root_nodes
         compute_artificial_edges(self.nodes_set, self.edges_set)
@@ -274,7 +531,7 @@ class MCCViews:
 
         # nodes and edges to build the initial rm_graph
         rm_edges = pd.DataFrame(columns=['source', 'target', 'type','frequency'])
-        rm_nodes = pd.DataFrame.from_dict({'NoneNone': [None, None, None]}, orient='index', columns=['label', 'type','frequency'])
+        rm_nodes = pd.DataFrame.from_dict({ROOT_NODE_KEY: [None, None, None]}, orient='index', columns=['label', 'type','frequency'])
 
         # build initial rm_graph
         self.__rm_graph = Graph(rm_nodes, rm_edges)
@@ -282,7 +539,7 @@ class MCCViews:
         # add new edges until 'frequent_edge_exists' is False
         while frequent_edge_exists is True:
             # get the most frequent edge out of edges_set
-            new_edge = copy.deepcopy(self.__edges_set.get_most_frequent_edge())
+            new_edge = self.__edges_set.get_most_frequent_edge()
 
             # check if 'new_edge' is None (this is the case when we already get all edges out of 'edges_set'
             # -> 'edges_set' is then empty)
@@ -337,7 +594,7 @@ class MCCViews:
         :rtype: float
         """
         # compute the id of the node
-        node_id = str(node.loc['label']) + str(node.loc['type'])
+        node_id = compute_node_key(node.loc['label'], node.loc['type'])
         # get the frequency from the nodes_set
         frequency = self.nodes_set.loc[node_id]['frequency']
         return frequency
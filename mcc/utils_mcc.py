@@ -1,14 +1,416 @@
 from core.model.graph import *
+from core.model.view_graph import ViewGraph
+from core.model.utils_nodes import compute_nodes_keys
+from core.model.utils_keys import compute_node_key, compute_edge_key, ROOT_NODE_KEY
 from core.model.edges_set import *
 from core.model.nodes_set import *
 from core.model.reserved_edges_set import *
+from core.loader.data_loader import DataLoader
+from core.loader.model_cache import ModelCache
+from core.model.string_table import STRING_TABLE, compact_entry
 
 
-def update_nodes_set(graph: Graph, nodes_set: pd.DataFrame) -> None:
+def load_graph(doc_path: str, streaming: bool = False, cache_dir: str = None, element_types: list = None,
+               relationship_types: list = None) -> Graph:
+    """Method to load one xml document and transform it into a graph with its distinct nodes and edges.
+    Top-level function so it can be sent to worker processes.
+
+    :param str doc_path: The path to the file (or its content as bytes, see open_file)
+    :param bool streaming: If True the file is read with the incremental parser of the DataLoader
+    :param str cache_dir: The directory where the extracted data of the file is cached (None = no cache)
+    :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+    :param list relationship_types: The relationship types of the edges to load (None = all)
+    :return: graph
+    :rtype: Graph
+    """
+    data_loader = DataLoader(cache_dir=cache_dir)
+    cache = data_loader.cache
+
+    # try to get the extracted data out of the cache (entries loaded with type filters are stored separately)
+    kind = ModelCache.get_filtered_kind('graph', DataLoader.expand_element_types(element_types), relationship_types)
+    entry = None
+    if cache is not None:
+        file_hash = cache.compute_file_hash(doc_path)
+        entry = cache.load(file_hash, kind)
+
+    if entry is None:
+        if streaming:
+            # parse the file directly into the nodes and edges tables
+            model = data_loader.iterparse_file(doc_path, 'global', element_types, relationship_types)
+            nodes = model['nodes']
+            edges = model['edges']
+        else:
+            # load the file into a dict
+            doc = data_loader.load_file(doc_path, 'global', element_types, relationship_types)
+            # get all nodes and edges out of 'doc'
+            nodes = data_loader.get_all_nodes(doc)
+            edges = data_loader.get_all_edges(doc)
+
+        # initialize graph with 'nodes' and 'edges'
+        graph = Graph(nodes, edges)
+
+        # initialize/compute the distinct nodes and edges of 'graph'
+        graph.initialize_distinct_nodes()
+        graph.initialize_distinct_edges()
+
+        if cache is not None:
+            cache.save(file_hash, kind, {'nodes': graph.nodes, 'edges': graph.edges,
+                                            'distinct_nodes': graph.distinct_nodes,
+                                            'distinct_edges': graph.distinct_edges})
+    else:
+        # rebuild the graph out of the cached tables (interned like freshly extracted ones)
+        graph = create_graph(compact_entry(entry))
+
+    return graph
+
+
+def create_graph(entry: dict) -> Graph:
+    """Method to build a graph out of extracted tables
+
+    :param dict entry: The extracted tables (nodes|edges|distinct_nodes|distinct_edges)
+    :return: graph
+    :rtype: Graph
+    """
+    graph = Graph(entry['nodes'], entry['edges'])
+    graph.distinct_nodes = entry['distinct_nodes']
+    graph.distinct_edges = entry['distinct_edges']
+
+    return graph
+
+
+def intern_graph(graph: Graph) -> Graph:
+    """Method to intern the tables of a graph, which was loaded by a worker process, into the string table of this
+    process (see compact_entry)
+
+    :param Graph graph: The unpickled graph (see load_graph)
+    :return: interned_graph (a new graph)
+    :rtype: Graph
+    """
+    return create_graph(compact_entry({'nodes': graph.nodes, 'edges': graph.edges,
+                                       'distinct_nodes': graph.distinct_nodes,
+                                       'distinct_edges': graph.distinct_edges}))
+
+
+def intern_graph_views(model_graphs: pd.DataFrame) -> pd.DataFrame:
+    """Method to intern the tables of the view graphs of a model, which were loaded by a worker process, into the
+    string table of this process (see compact_entry). The interned graphs share the tables of the model again.
+
+    :param pd.DataFrame model_graphs: The unpickled graphs of the views (see load_graph_views)
+    :return: interned_model_graphs (new graphs)
+    :rtype: pd.DataFrame
+    """
+    interned_model_graphs = pd.DataFrame(columns=['graph'])
+    if len(model_graphs) == 0:
+        return interned_model_graphs
+
+    # all views of a model share its tables
+    first_graph = model_graphs.iloc[0]['graph']
+    entry = compact_entry({'nodes': first_graph.model_nodes, 'edges': first_graph.model_edges,
+                           'views': [{'nodes_positions': graph.nodes_positions,
+                                      'edges_positions': graph.edges_positions,
+                                      'distinct_nodes': graph.distinct_nodes,
+                                      'distinct_edges': graph.distinct_edges} for graph in model_graphs['graph']]})
+    for view_name, view in zip(model_graphs.index, entry['views']):
+        interned_model_graphs.loc[view_name] = [create_view_graph(entry, view)]
+
+    return interned_model_graphs
+
+
+def load_model_graph(model, streaming: bool = False, cache_dir: str = None, element_types: list = None,
+                     relationship_types: list = None) -> Graph:
+    """Method to transform one input model of any supported source into a graph with its distinct nodes and edges
+
+    :param model: The input model: the path to a file, the content of a file as bytes, a dict with the extracted
+        tables (nodes|edges, optional distinct_nodes|distinct_edges) or a Graph. Extracted tables and graphs are
+        taken as they are (the type filters aren't applied to them)
+    :param bool streaming: If True files are read with the incremental parser of the DataLoader
+    :param str cache_dir: The directory where the extracted data of files is cached (None = no cache)
+    :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+    :param list relationship_types: The relationship types of the edges to load (None = all)
+    :return: graph
+    :rtype: Graph
+    """
+    if isinstance(model, (str, bytes)):
+        return load_graph(model, streaming, cache_dir, element_types, relationship_types)
+
+    if isinstance(model, Graph):
+        graph = model
+    elif isinstance(model, dict):
+        graph = Graph(model['nodes'], model['edges'])
+        graph.distinct_nodes = model.get('distinct_nodes')
+        graph.distinct_edges = model.get('distinct_edges')
+    else:
+        raise TypeError('an input model has to be a path, bytes, a dict with its tables or a Graph, not ' +
+                        type(model).__name__)
+
+    # compute the distinct nodes and edges if they weren't given
+    if graph.distinct_nodes is None:
+        graph.initialize_distinct_nodes()
+    if graph.distinct_edges is None:
+        graph.initialize_distinct_edges()
+
+    return graph
+
+
+def load_graph_views(doc_path: str, streaming: bool = False, cache_dir: str = None, element_types: list = None,
+                     relationship_types: list = None) -> tuple:
+    """Method to load one xml document and transform every view of it into a graph with its distinct nodes and edges.
+    Top-level function so it can be sent to worker processes.
+
+    :param str doc_path: The path to the file
+    :param bool streaming: If True the file is read with the incremental parser of the DataLoader
+    :param str cache_dir: The directory where the extracted data of the file is cached (None = no cache)
+    :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+    :param list relationship_types: The relationship types of the edges to load (None = all)
+    :return: (view_names, model_graphs) the names of the views in order of appearance and the graphs of the views
+    :rtype: tuple
+    """
+    entry = load_views_entry(doc_path, streaming, cache_dir, element_types, relationship_types)
+
+    model_graphs = pd.DataFrame(columns=['graph'])
+
+    # iterate over all extracted views and build their graphs
+    for view in entry['views']:
+        model_graphs.loc[view['name']] = [create_view_graph(entry, view)]
+
+    return entry['view_names'], model_graphs
+
+
+def load_view_names(doc_path: str, streaming: bool = False, cache_dir: str = None, element_types: list = None,
+                    relationship_types: list = None) -> tuple:
+    """Method to get the names of all views of one xml document without keeping their graphs. The graph of every view
+    is stored in its own cache entry, so it can be rebuilt later on without reading the file or the other views of the
+    file again (see load_graph_view). Top-level function so it can be sent to worker processes.
+
+    :param str doc_path: The path to the file (or its content as bytes, see open_file)
+    :param bool streaming: If True the file is read with the incremental parser of the DataLoader
+    :param str cache_dir: The directory where the extracted views of the file are cached
+    :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+    :param list relationship_types: The relationship types of the edges to load (None = all)
+    :return: (file_hash, view_names) the hash of the file (the key of its cache entries) and the names of the views in
+        order of appearance
+    :rtype: tuple
+    """
+    data_loader = DataLoader(cache_dir=cache_dir)
+    cache = data_loader.cache
+    expanded_element_types = DataLoader.expand_element_types(element_types)
+
+    kind = ModelCache.get_filtered_kind('view-names', expanded_element_types, relationship_types)
+    file_hash = cache.compute_file_hash(doc_path)
+    entry = cache.load(file_hash, kind)
+    if entry is None:
+        extracted_views = extract_graph_views(data_loader, doc_path, streaming, None, element_types,
+                                              relationship_types)
+        for view in extracted_views['views']:
+            graph = create_view_graph(extracted_views, view)
+            cache.save(file_hash, ModelCache.get_filtered_kind(ModelCache.get_view_kind(view['name']),
+                                                               expanded_element_types, relationship_types),
+                       {'nodes': graph.nodes, 'edges': graph.edges, 'distinct_nodes': graph.distinct_nodes,
+                        'distinct_edges': graph.distinct_edges})
+        # the names are saved last, so they are only found if the entries of all views exist
+        entry = {'view_names': extracted_views['view_names']}
+        cache.save(file_hash, kind, entry)
+
+    return file_hash, entry['view_names']
+
+
+def load_graph_view(doc_path: str, file_hash: str, view_name: str, streaming: bool = False, cache_dir: str = None,
+                    element_types: list = None, relationship_types: list = None) -> Graph:
+    """Method to load the graph of one view of one xml document out of its cache entry (see load_view_names), only
+    if the entry is missing the file is read again
+
+    :param str doc_path: The path to the file (or its content as bytes, see open_file)
+    :param str file_hash: The hash of the file, which load_view_names returned
+    :param str view_name: The name of the view
+    :param bool streaming: If True the file is read with the incremental parser of the DataLoader
+    :param str cache_dir: The directory where the extracted views of the file are cached
+    :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+    :param list relationship_types: The relationship types of the edges to load (None = all)
+    :return: graph (None if the file doesn't contain the view)
+    :rtype: Graph
+    """
+    cache = ModelCache(cache_dir)
+    kind = ModelCache.get_filtered_kind(ModelCache.get_view_kind(view_name),
+                                        DataLoader.expand_element_types(element_types), relationship_types)
+    entry = cache.load(file_hash, kind)
+    if entry is None:
+        # the cache entries were deleted, extract the views of the file again
+        file_hash, view_names = load_view_names(doc_path, streaming, cache_dir, element_types, relationship_types)
+        if view_name not in view_names:
+            return None
+        entry = cache.load(file_hash, kind)
+
+    # intern the cached tables like freshly extracted ones
+    return create_graph(compact_entry(entry))
+
+
+def load_views_entry(doc_path: str, streaming: bool = False, cache_dir: str = None, element_types: list = None,
+                     relationship_types: list = None, intern_tables: bool = True) -> dict:
+    """Method to get the extracted views of one xml document out of the cache or to extract them
+
+    :param str doc_path: The path to the file
+    :param bool streaming: If True the file is read with the incremental parser of the DataLoader
+    :param str cache_dir: The directory where the extracted data of the file is cached (None = no cache)
+    :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+    :param list relationship_types: The relationship types of the edges to load (None = all)
+    :param bool intern_tables: If False the tables of a cached entry aren't interned (e.g. if only the view names are
+        needed)
+    :return: The extracted views (see extract_graph_views)
+    :rtype: dict
+    """
+    data_loader = DataLoader(cache_dir=cache_dir)
+    cache = data_loader.cache
+
+    # try to get the extracted data out of the cache (entries loaded with type filters are stored separately)
+    kind = ModelCache.get_filtered_kind('views', DataLoader.expand_element_types(element_types), relationship_types)
+    entry = None
+    if cache is not None:
+        file_hash = cache.compute_file_hash(doc_path)
+        entry = cache.load(file_hash, kind)
+
+    if entry is not None:
+        if intern_tables:
+            # intern the cached tables like freshly extracted ones
+            entry = compact_entry(entry)
+    else:
+        entry = extract_graph_views(data_loader, doc_path, streaming, None, element_types, relationship_types)
+        if cache is not None:
+            cache.save(file_hash, kind, entry)
+
+    return entry
+
+
+def create_view_graph(entry: dict, view: dict) -> ViewGraph:
+    """Method to build the graph of an extracted view, all graphs of the views of one model share its tables
+
+    :param dict entry: The extracted views of the model (see extract_graph_views)
+    :param dict view: The extracted view
+    :return: graph
+    :rtype: ViewGraph
+    """
+    graph = ViewGraph(entry['nodes'], entry['edges'], view['nodes_positions'], view['edges_positions'])
+    graph.distinct_nodes = view['distinct_nodes']
+    graph.distinct_edges = view['distinct_edges']
+
+    return graph
+
+
+def extract_graph_views(data_loader: DataLoader, doc_path: str, streaming: bool = False,
+                        view_names: list = None, element_types: list = None,
+                        relationship_types: list = None) -> dict:
+    """Method to extract the views of one xml document. The nodes and edges of the complete model are stored once,
+    every view only keeps the positions of its nodes and edges in them and its distinct tables.
+
+    :param DataLoader data_loader: The DataLoader to use
+    :param str doc_path: The path to the file
+    :param bool streaming: If True the file is read with the incremental parser of the DataLoader
+    :param list view_names: The names of the views to build the tables for (None = all views), the names of all
+        views are collected in any case
+    :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+    :param list relationship_types: The relationship types of the edges to load (None = all)
+    :return: A dict with the view names in order of appearance, the nodes and edges of the model and a list of all
+        views (name|nodes_positions|edges_positions|distinct_nodes|distinct_edges)
+    :rtype: dict
+    """
+    selected_view_names = view_names
+    view_names = []
+
+    if streaming:
+        # parse the file directly into the nodes and edges tables and the views of the model
+        model = data_loader.iterparse_file(doc_path, 'views', element_types, relationship_types)
+        nodes = model['nodes']
+        edges = model['edges']
+    else:
+        # load the file into a dict and get the nodes and edges of the complete model out of it
+        doc = data_loader.load_file(doc_path, 'views', element_types, relationship_types)
+        nodes = data_loader.get_all_nodes(doc)
+        edges = data_loader.get_all_edges(doc)
+    # build the index of the model once for all of its views
+    index = data_loader.build_table_index(nodes, edges)
+
+    # initialize the DataFrame for the doc views
+    doc_views = pd.DataFrame(columns=['nodes', 'edges'])
+    # get all views of 'doc'
+    views = model['views'] if streaming else data_loader.get_all_views(doc)
+
+    # iterate over all views to get the node and edge ids of all views
+    for i in range(0, len(views)):
+        if streaming:
+            view_name = str(views[i]['name']).lower()
+            view_nodes = views[i]['nodes']
+        else:
+            view_name = str(views[i]['name']['#text']).lower()
+            view_nodes = data_loader.get_view_nodes(views[i])
+        if element_types is not None:
+            # ignore the nodes whose elements were excluded by the element type filter
+            view_nodes = {node_id: children for node_id, children in view_nodes.items() if node_id in index['nodes']}
+        if len(view_nodes) == 0:
+            continue
+        view_edges = views[i]['edges'] if streaming else data_loader.get_view_edges(views[i])
+        doc_views.loc[view_name] = [view_nodes, view_edges]
+        if view_name not in view_names:
+            view_names.append(view_name)
+
+    graph_views = []
+    if selected_view_names is not None and len(selected_view_names) == 0:
+        return {'view_names': view_names, 'nodes': nodes, 'edges': edges, 'views': graph_views}
+
+    # the keys of the nodes are the same in all views
+    nodes_keys = compute_nodes_keys(nodes)
+
+    # iterate over all views in 'doc_views' to get the positions of their nodes and edges in the model
+    for i in range(0, len(doc_views)):
+        current_view = doc_views.iloc[i]
+        if selected_view_names is not None and current_view.name not in selected_view_names:
+            continue
+        current_view_nodes_ids = current_view.loc['nodes']
+        current_view_edges_ids = current_view.loc['edges']
+        nodes_positions = data_loader.get_view_nodes_positions(index, current_view_nodes_ids)
+        edges_positions = data_loader.get_view_edges_positions(index, current_view_edges_ids, current_view_nodes_ids)
+
+        # compute the distinct nodes and edges of the view
+        current_graph = ViewGraph(nodes, edges, nodes_positions, edges_positions)
+        current_graph.initialize_distinct_nodes(nodes_keys)
+        current_graph.initialize_distinct_edges(nodes_keys)
+
+        graph_views.append({'name': current_view.name, 'nodes_positions': current_graph.nodes_positions,
+                            'edges_positions': current_graph.edges_positions,
+                            'distinct_nodes': current_graph.distinct_nodes,
+                            'distinct_edges': current_graph.distinct_edges})
+
+    return {'view_names': view_names, 'nodes': nodes, 'edges': edges, 'views': graph_views}
+
+
+def view_graph_changed(old_graph: Graph, new_graph: Graph) -> bool:
+    """Method to check if a view has to be mined again, this is the case if its distinct nodes or edges changed
+
+    :param Graph old_graph: The graph of the view before the change (None if the view didn't exist)
+    :param Graph new_graph: The graph of the view after the change (None if the view doesn't exist anymore)
+    :return: True|False
+    :rtype: bool
+    """
+    if old_graph is None or new_graph is None:
+        return old_graph is not new_graph
+
+    # compare the values of the types, the categories of the type columns grow with every loaded model, so the
+    # tables of the same view loaded at different times can have different dtypes
+    old_nodes = old_graph.distinct_nodes.astype({'type': object})
+    new_nodes = new_graph.distinct_nodes.astype({'type': object})
+    old_edges = old_graph.distinct_edges[['type', 'frequency']].astype({'type': object})
+    new_edges = new_graph.distinct_edges[['type', 'frequency']].astype({'type': object})
+
+    # the source and target nodes of the distinct edges are part of their index
+    return not (old_nodes.equals(new_nodes) and
+                old_graph.distinct_edges.index.equals(new_graph.distinct_edges.index) and
+                old_edges.equals(new_edges))
+
+
+def update_nodes_set(graph: Graph, nodes_set: pd.DataFrame, weight: int = 1) -> None:
     """Method to update the nodes_set with new nodes
 
     :param Graph graph: The graph from which you want to add the nodes to the nodes_set
     :param pd.DataFrame nodes_set: The nodes_set where you want to add new nodes
+    :param int weight: The number of input graphs with the same content as 'graph'
     """
     # iterate through all distinct nodes of an graph and add this node to the nodes_set if it doesn't exist else update the frequency
     distinct_graph_nodes = graph.distinct_nodes
@@ -16,14 +418,15 @@ def update_nodes_set(graph: Graph, nodes_set: pd.DataFrame) -> None:
     for i in range(0, len(distinct_graph_nodes_index)):
         current_node_id = distinct_graph_nodes_index[i]
         current_node = distinct_graph_nodes.loc[current_node_id]
-        nodes_set.add_distinct_node(current_node)
+        nodes_set.add_distinct_node(current_node, weight)
 
 
-def update_edges_set(graph: Graph, edges_set: pd.DataFrame) -> None:
+def update_edges_set(graph: Graph, edges_set: pd.DataFrame, weight: int = 1) -> None:
     """Method to update the edges_set with new edges
 
     :param Graph graph: The graph from which you want to add the edges to the edges_set
     :param pd.DataFrame edges_set: The edges_set where you want to add new edges
+    :param int weight: The number of input graphs with the same content as 'graph'
     """
     # get all distinct edges of 'graph'
     distinct_graph_edges = graph.distinct_edges
@@ -34,7 +437,7 @@ def update_edges_set(graph: Graph, edges_set: pd.DataFrame) -> None:
     for i in range(0, len(distinct_graph_edges_index)):
         current_edge_id = distinct_graph_edges_index[i]
         current_edge = distinct_graph_edges.loc[current_edge_id]
-        edges_set.add_distinct_edge(current_edge)
+        edges_set.add_distinct_edge(current_edge, weight)
 
 
 def initialize_cost_values(edges_set: EdgesSet, nodes_set: NodesSet, move_cost: float, insert_cost: float,
@@ -56,7 +459,7 @@ def initialize_cost_values(edges_set: EdgesSet, nodes_set: NodesSet, move_cost:
         current_edge_id = edges_set_index[i]
         # get the frequency and id of the target node of the current edge
         target_node = edges_set.edges_set.loc[current_edge_id]['target']
-        target_node_id = str(target_node.loc['label']) + str(target_node.loc['type'])
+        target_node_id = compute_node_key(target_node.loc['label'], target_node.loc['type'])
         target_node_frequency = nodes_set.nodes_set.loc[target_node_id]['frequency']
 
         # compute and set the cost value for current edge
@@ -76,17 +479,20 @@ def compute_artificial_edges(nodes_set: pd.DataFrame, edges_set: pd.DataFrame) -
     for i in range(0, len(root_nodes)):
         current_root_node = root_nodes.iloc[i]
         # compute the edge id for the artificial edge
-        artificial_edge_id = "None" + current_root_node.loc['label'] + current_root_node.loc['type'] + "root_edge"
+        artificial_edge_id = compute_edge_key(ROOT_NODE_KEY, current_root_node.name, 'root_edge')
         # get the frequency of 'current_root_node'
         current_root_node_frequency = float(current_root_node.loc['frequency'])
         # build pd.Series for 'current_root_node'
-        none_nodes = pd.DataFrame.from_dict({'NoneNone': [None, None]}, orient='index', columns=['label', 'type'])
+        none_nodes = pd.DataFrame.from_dict({ROOT_NODE_KEY: [None, None]}, orient='index', columns=['label', 'type'])
         none_node = none_nodes.iloc[0]
 
         # append the artificial_edge to 'edges_set' and set 'current_root_node_frequency' as the frequency for the new edge
         edges_set.loc[artificial_edge_id] = [none_node, current_root_node, 'root_edge', current_root_node_frequency,
                                              None]
 
+    # the enlargement turns the categorical type column into an object column
+    STRING_TABLE.categorize_types(edges_set)
+
 
 def check_graph_for_all_reserved_edges(reserved_edges_set: ReservedEdgesSet, rm_graph: Graph) -> None:
     """Method to check for all edges in 'reserved_edges_set' if they could be added to rm_graph
@@ -125,7 +531,8 @@ def check_graph_for_relevant_reserved_edges(reserved_edges_set: ReservedEdgesSet
 
     # add all edges of 'reserved_new_edges' to 'rm_graph'
     for i in range(0, len(reserved_new_edges)):
-        new_edge = copy.deepcopy(reserved_new_edges.iloc[i])
+        # a copy of the row, the source and target nodes are shared (they aren't changed)
+        new_edge = reserved_new_edges.iloc[i].copy()
         rm_graph.add_edge(new_edge)
         new_edge_target_node = new_edge.loc['target']
         frequency = new_edge_target_node['frequency']
@@ -139,7 +546,7 @@ def check_graph_for_relevant_reserved_edges(reserved_edges_set: ReservedEdgesSet
         :rtype: float
         """
         # compute the id of the node
-        node_id = str(node.loc['label']) + str(node.loc['type'])
+        node_id = compute_node_key(node.loc['label'], node.loc['type'])
         # get the frequency from the nodes_set
         frequency = self.nodes_set.loc[node_id]['frequency']
         return frequency
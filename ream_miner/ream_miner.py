@@ -4,15 +4,21 @@ from refpa.utils_refpa import compute_clusters_for_all_input_graphs, evaluate_cl
 
 class ReamMiner:
 
-    def __init__(self, path: str, threshod: float) -> None:
+    def __init__(self, path: str, threshod: float, element_types: list = None,
+                 relationship_types: list = None) -> None:
         """Constructor
 
         :param str path: relative path to directory where the xml files for the input models are located
+        :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+        :param list relationship_types: The relationship types of the edges to load (None = all)
         """
         self.__path = path
         self.__rm_graphs = pd.DataFrame(columns=['rm_graph'])
         self.__initial_graphs_views = pd.DataFrame(columns=['initial_rm_graph', 'input_views', 'common_nodes'])
         self.__threshold = threshod
+        self.__mcc_views_algorithm = None
+        self.__element_types = element_types
+        self.__relationship_types = relationship_types
 
     @property
     def path(self):
@@ -40,6 +46,17 @@ class ReamMiner:
     def threshold(self, threshold: float) -> None:
         self.__threshold = threshold
 
+    @property
+    def view_names(self) -> list:
+        """Method to get the names of all viewpoints of the loaded input models
+
+        :return: view_names
+        :rtype: list
+        """
+        if self.__mcc_views_algorithm is None:
+            return []
+        return self.__mcc_views_algorithm.view_names
+
     @property
     def rm_graphs(self) -> pd.DataFrame:
         """Method to get the set of final reference graphs
@@ -54,10 +71,12 @@ class ReamMiner:
     def rm_graphs(self, rm_graphs: pd.DataFrame) -> None:
         self.__rm_graphs = rm_graphs
 
-    def create_initial_rm_graphs(self) -> None:
+    def create_initial_rm_graphs(self, view_names: list = None, min_support: int = 1) -> None:
         """Method to merge the viewpoints of all input models into one model per viewpoint
         and to compute the common nodes of for the viewpoints of all input models
 
+        :param list view_names: The names of the viewpoints to merge (None = all viewpoints)
+        :param int min_support: The minimum number of input models a viewpoint has to exist in to be merged
         :return: None
         """
         # set the path to the directory where the xml files for the input models are located
@@ -69,34 +88,24 @@ class ReamMiner:
         mcc_insert_cost = float(10.0)
         mcc_threshold = -100.0
         # execute mcc_views_algorithm to merge viewpoints of all input models into one model per viewpoint
-        mcc_views_algorithm = MCCViews(path, mcc_move_cost, mcc_delete_cost, mcc_insert_cost, mcc_threshold)
-        mcc_views_algorithm.load_graphs_views()
+        # (the input models are only loaded once, later calls reuse them)
+        if self.__mcc_views_algorithm is None:
+            self.__mcc_views_algorithm = MCCViews(path, mcc_move_cost, mcc_delete_cost, mcc_insert_cost,
+                                                  mcc_threshold, self.__element_types, self.__relationship_types)
+            self.__mcc_views_algorithm.load_graphs_views()
+        mcc_views_algorithm = self.__mcc_views_algorithm
 
-        models = mcc_views_algorithm.graphs
-        view_names = mcc_views_algorithm.view_names
-        number_of_views = len(view_names)
+        if view_names is None:
+            # get the names of all views which exist in at least 'min_support' input models
+            view_names = mcc_views_algorithm.get_view_names(min_support)
 
         """Iterate over all different viewpoints of all input models to initialize the common nodes 
         and the initial_rm_graph for every viewpoint.
         """
-        for i in range(0, number_of_views):
-            current_views = []
-            # get the name of the current_view
-            current_view_name = view_names[i]
+        for current_view_name in view_names:
             print(current_view_name)
-            # iterate over all models
-            for j in range(0, len(models)):
-                # check if current model contains current view
-                try:
-                    # get the current view of the current model
-                    current_model_view = models.iloc[j]['model'].loc[current_view_name].loc['graph']
-                    # append current view to 'current_views'
-                    current_views.append(current_model_view)
-                except KeyError as ke:
-                    input_graph_name = models.iloc[j].name
-                    print(
-                        'Viewpoint \'' + current_view_name + '\' does not exist for input graph \'' + input_graph_name + '\'!')
-                    continue
+            # get the current view of all input models which contain it
+            current_views = mcc_views_algorithm.get_views(current_view_name)
 
             # initiate edges and nodes set of 'mcc_views_algorithm' for 'current_views'
             mcc_views_algorithm.current_views = current_views
@@ -105,11 +114,11 @@ class ReamMiner:
             # execute 'mcc_views_algorithm' on 'current_views' to merge views of all input models into one model
             mcc_views_algorithm.execute()
 
-            # create deep copy of result model of 'mcc_views_algorithm'
-            initial_rm_graph = copy.deepcopy(mcc_views_algorithm.rm_graph)
+            # create a snapshot of the result model of 'mcc_views_algorithm' (it is copied when it is changed below)
+            initial_rm_graph = mcc_views_algorithm.rm_graph.snapshot()
 
             # delete root nodes and root edges out of 'initial_rm_graph'
-            root_node_id = 'NoneNone'
+            root_node_id = ROOT_NODE_KEY
             initial_rm_graph.delete_node(root_node_id)
             initial_rm_graph.delete_root_edges()
 
@@ -127,13 +136,37 @@ class ReamMiner:
             # add 'initial_rm_graph' and 'common_nodes' for the current viewpoint to 'initial_graphs_views'
             self.__initial_graphs_views.loc[current_view_name] = [initial_rm_graph, current_views, common_nodes]
 
-    def execute(self) -> None:
+    def update_graphs_views(self) -> list:
+        """Method to reload all input models which changed since they were loaded and to drop the viewpoints
+        which don't exist anymore
+
+        :return: The names of all viewpoints which changed (have to be merged and executed again)
+        :rtype: list
+        """
+        if self.__mcc_views_algorithm is None:
+            return []
+
+        changed_views = self.__mcc_views_algorithm.update_graphs_views()
+        view_names = self.__mcc_views_algorithm.view_names
+        for view_name in changed_views:
+            if view_name not in view_names:
+                if view_name in self.__initial_graphs_views.index:
+                    self.__initial_graphs_views.drop(view_name, inplace=True)
+                if view_name in self.__rm_graphs.index:
+                    self.__rm_graphs.drop(view_name, inplace=True)
+
+        return [view_name for view_name in changed_views if view_name in view_names]
+
+    def execute(self, view_names: list = None) -> None:
         """Method to execute the RefPa-views algorithm on the single views of the input models
 
+        :param list view_names: The names of the viewpoints to execute the algorithm for (None = all viewpoints)
         :return: None
         """
 
         for i in range(0, len(self.__initial_graphs_views)):
+            if view_names is not None and self.__initial_graphs_views.iloc[i].name not in view_names:
+                continue
             # get current viewpoints
             current_input_views = self.__initial_graphs_views.iloc[i]['input_views']
             # compute the clusters (groups of nodes) for all input models
@@ -5,10 +5,12 @@ from refpa.utils_refpa import compute_common_nodes, compute_clusters_for_all_inp
 
 class RefPaGlobal:
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, element_types: list = None, relationship_types: list = None) -> None:
         """Constructor
 
         :param str path: relative path to directory where the xml files for the input models are located
+        :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+        :param list relationship_types: The relationship types of the edges to load (None = all)
         """
         self.__path = path
         self.__rm_graph = None
@@ -23,7 +25,8 @@ class RefPaGlobal:
         mcc_insert_cost = float(10.0)
         mcc_threshold = -100.0
         # execute mcc algorithm to merge all input models into one model
-        self.__mcc_algorithm = MCCGlobal(self.path, mcc_move_cost, mcc_delete_cost, mcc_insert_cost, mcc_threshold)
+        self.__mcc_algorithm = MCCGlobal(self.path, mcc_move_cost, mcc_delete_cost, mcc_insert_cost, mcc_threshold,
+                                         element_types, relationship_types)
 
     @property
     def path(self) -> str:
@@ -53,7 +56,7 @@ class RefPaGlobal:
 
     @property
     def graphs_set(self) -> list:
-        """Method to get all input models as a list of graph objects
+        """Method to get all input models as a list of graph objects (GraphSummary objects if the models were folded)
 
         :return: graphs_set
         :rtype: list
@@ -96,26 +99,35 @@ class RefPaGlobal:
         """
         return self.__rm_graph_nodes
 
-    def create_initial_rm_graph(self) -> None:
+    def create_initial_rm_graph(self, fold: bool = False, models: Iterable = None) -> None:
         """Method to merge all input models into one model
 
+        :param bool fold: If True the input models are folded into the sets one after another and only their nodes
+            clusters are kept instead of their graphs (see MCCGlobal.fold_models)
+        :param Iterable models: The input models to fold (None = all files of 'path'), only used with 'fold'
         :return: None
         """
-        self.__mcc_algorithm.load_graphs()
-        self.__mcc_algorithm.initiate_sets()
+        if fold:
+            if models is None:
+                models = self.__mcc_algorithm.get_model_paths()
+            self.__mcc_algorithm.fold_models(models, keep_summaries=True)
+            self.__mcc_algorithm.complete_sets()
+        else:
+            self.__mcc_algorithm.load_graphs()
+            self.__mcc_algorithm.initiate_sets()
         self.__mcc_algorithm.execute()
 
         # set the merged model as the initial graph
         initial_graph = self.__mcc_algorithm.rm_graph
 
         # delete the root nodes and edges out of the 'initial_graph'
-        root_node_id = 'NoneNone'
+        root_node_id = ROOT_NODE_KEY
         initial_graph.delete_node(root_node_id)
         initial_graph.delete_root_edges()
 
-        # set the graphs set and the initial rm_graph
+        # set the graphs set (the summaries of the folded models) and the initial rm_graph
         self.__rm_graph = initial_graph
-        self.__graphs_set = self.__mcc_algorithm.graphs
+        self.__graphs_set = self.__mcc_algorithm.summaries if fold else self.__mcc_algorithm.graphs
 
     def compute_common_nodes(self) -> None:
         """Method to compute the common nodes out of the nodes of all input models
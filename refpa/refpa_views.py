@@ -5,12 +5,16 @@ from refpa.utils_refpa import compute_common_nodes, compute_clusters_for_all_inp
 
 class RefPaViews:
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, element_types: list = None, relationship_types: list = None) -> None:
         """Constructor
 
         :param str path: relative path to directory where the xml files for the input models are located
+        :param list element_types: The element types (or ArchiMate layers) of the nodes to load (None = all)
+        :param list relationship_types: The relationship types of the edges to load (None = all)
         """
         self.__path = path
+        self.__element_types = element_types
+        self.__relationship_types = relationship_types
         self.__rm_graphs = pd.DataFrame(columns=['rm_graph'])
         self.__initial_graphs_views = pd.DataFrame(columns=['initial_rm_graph', 'input_views', 'common_nodes'])
 
@@ -40,10 +44,11 @@ class RefPaViews:
     def rm_graphs(self, rm_graphs: pd.DataFrame) -> None:
         self.__rm_graphs = rm_graphs
 
-    def create_initial_rm_graphs(self) -> None:
+    def create_initial_rm_graphs(self, min_support: int = 1) -> None:
         """Method to merge the viewpoints of all input models into one model per viewpoint
         and to compute the common nodes of for the viewpoints of all input models
 
+        :param int min_support: The minimum number of input models a viewpoint has to exist in to be merged
         :return: None
         """
         # set the path to the directory where the xml files for the input models are located
@@ -55,33 +60,19 @@ class RefPaViews:
         mcc_insert_cost = float(10.0)
         mcc_threshold = -100.0
         # execute mcc_views_algorithm to merge viewpoints of all input models into one model per viewpoint
-        mcc_views_algorithm = MCCViews(path, mcc_move_cost, mcc_delete_cost, mcc_insert_cost, mcc_threshold)
+        mcc_views_algorithm = MCCViews(path, mcc_move_cost, mcc_delete_cost, mcc_insert_cost, mcc_threshold,
+                                       self.__element_types, self.__relationship_types)
         mcc_views_algorithm.load_graphs_views()
 
-        models = mcc_views_algorithm.graphs
-        view_names = mcc_views_algorithm.view_names
-        number_of_views = len(view_names)
+        # get the names of all views which exist in at least 'min_support' input models
+        view_names = mcc_views_algorithm.get_view_names(min_support)
         """Iterate over all different viewpoints of all input models to initialize the common nodes 
         and the initial_rm_graph for every viewpoint.
         """
-        for i in range(0, number_of_views):
-            current_views = []
-            # get the name of the current_view
-            current_view_name = view_names[i]
+        for current_view_name in view_names:
             print(current_view_name)
-            # iterate over all models
-            for j in range(0, len(models)):
-                # check if current model contains current view
-                try:
-                    # get the current view of the current model
-                    current_model_view = models.iloc[j]['model'].loc[current_view_name].loc['graph']
-                    # append current view to 'current_views'
-                    current_views.append(current_model_view)
-                except KeyError as ke:
-                    input_graph_name = models.iloc[j].name
-                    print(
-                        'Viewpoint \'' + current_view_name + '\' does not exist for input graph \'' + input_graph_name + '\'!')
-                    continue
+            # get the current view of all input models which contain it
+            current_views = mcc_views_algorithm.get_views(current_view_name)
 
             # initiate edges and nodes set of 'mcc_views_algorithm' for 'current_views'
             mcc_views_algorithm.current_views = current_views
@@ -90,11 +81,11 @@ class RefPaViews:
             # execute 'mcc_views_algorithm' on 'current_views' to merge views of all input models into one model
             mcc_views_algorithm.execute()
 
-            # create deep copy of result model of 'mcc_views_algorithm'
-            initial_rm_graph = copy.deepcopy(mcc_views_algorithm.rm_graph)
+            # create a snapshot of the result model of 'mcc_views_algorithm' (it is copied when it is changed below)
+            initial_rm_graph = mcc_views_algorithm.rm_graph.snapshot()
 
             # delete root nodes and root edges out of 'initial_rm_graph'
-            root_node_id = 'NoneNone'
+            root_node_id = ROOT_NODE_KEY
             initial_rm_graph.delete_node(root_node_id)
             initial_rm_graph.delete_root_edges()
 
@@ -5,7 +5,7 @@ def compute_common_nodes(nodes_set: pd.DataFrame) -> list:
     """Method to compute the common nodes out of the nodes of all input models
 
     :param pd.DataFrame nodes_set: The set of the nodes of all input models
-    :return: common_nodes (list of unique node_ids(label+type)
+    :return: common_nodes (list of unique node_ids (node keys, see compute_node_key)
     :rtype: list
     """
     common_nodes_dataframe = nodes_set[nodes_set['frequency'] == 1.0]
@@ -20,7 +20,9 @@ def compute_clusters_for_all_input_graphs(graphs_set: list) -> None:
 
     :param list graphs_set: A set of all input graphs
     """
-    for graph in graphs_set:
+    # identical graphs have the same clusters, so only the first graph of every content is clustered
+    graphs, _ = deduplicate_graphs(graphs_set)
+    for graph in graphs:
         graph.compute_nodes_clusters()
 
 
@@ -32,8 +34,12 @@ def evaluate_clusters(graphs_set: list) -> pd.DataFrame:
     # initialize the clusters for the 'rm_graph'
     rm_clusters = pd.DataFrame(columns=['nodes', 'evaluation_metric'])
 
-    # iterate over all graphs in 'graphs_set'
-    for graph in graphs_set:
+    # a copy of a graph can't replace a cluster of the first graph with the same content (the metric has to be
+    # higher), so every content is evaluated once, whatever its weight
+    graphs, _ = deduplicate_graphs(graphs_set)
+
+    # iterate over all distinct graphs in 'graphs_set'
+    for graph in graphs:
         # get clusters of the current graph
         graph_clusters = graph.nodes_clusters
         # get a list of indexes of the clusters of the current graph
@@ -101,19 +107,11 @@ def create_final_rm_graph(rm_graph_nodes: list, rm_graph: Graph) -> None:
     # compute and mark all nodes which should be in the final rm_graph
     rm_graph.compute_reference_nodes(rm_graph_nodes)
 
-    rm_graph_nodes_index = list(rm_graph.nodes.index)
     # delete all non-reference nodes out of rm_graph
-    for i in range(0, len(rm_graph_nodes_index)):
-        current_node_id = rm_graph_nodes_index[i]
-        if rm_graph.nodes.loc[current_node_id]['is_part_of_reference'] == False:
-            rm_graph.delete_node(current_node_id)
+    rm_graph.delete_nodes_where(lambda nodes: nodes['is_part_of_reference'] == False)
 
     # compute and all edges which should be in the final rm_graph
     rm_graph.compute_reference_edges()
 
-    rm_graph_edges_index = list(rm_graph.edges.index)
     # delete all non-reference edges out of rm_graph
-    for i in range(0, len(rm_graph_edges_index)):
-        current_edge_id = rm_graph_edges_index[i]
-        if rm_graph.edges.loc[current_edge_id]['is_part_of_reference'] == False:
-            rm_graph.delete_edge(current_edge_id)
+    rm_graph.delete_edges_where(lambda edges: edges['is_part_of_reference'] == False)
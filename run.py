@@ -1,19 +1,103 @@
 import codecs
+import os
+import time
 
 from ream_miner.ream_miner import ReamMiner
 from mcc.mcc_global import *
 from mcc.mcc_views import *
 from refpa.refpa_global import *
 from refpa.refpa_views import *
-import copy
 
 
-def execute_mcc(input_path: str, output_path: str, threshold) -> None:
+def get_view_output_paths(view_name: str, output_path: str) -> list:
+    """Method to get the paths of the csv files of the reference graph of a viewpoint
+
+    :parameter view_name: The name of the viewpoint
+    :parameter output_path: Location where you want to save the output model
+    :return: [nodes_path, edges_path, node_stats_path, edge_stats_path]
+    :rtype: list
+    """
+    # build the file name (= viewpoint name)
+    file_name = str(view_name).replace('/', '_')
+
+    return [output_path + '\\' + file_name + '_nodes.csv', output_path + '\\' + file_name + '_edges.csv',
+            output_path + '\\stats' + '\\' + file_name + '_node_stats.csv',
+            output_path + '\\stats' + '\\' + file_name + '_edge_stats.csv']
+
+
+def write_views_output(rm_graphs: pd.DataFrame, column: str, output_path: str, view_names: list = None) -> None:
+    """Method to write the reference graphs of the different viewpoints to csv files and to one ArchiMate exchange file
+
+    :parameter rm_graphs: The reference graphs (index = viewpoint name)
+    :parameter column: The column of 'rm_graphs' which contains the reference graphs
+    :parameter output_path: Location where you want to save the output model
+    :parameter view_names: The names of the viewpoints whose csv files are written (None = all), the ArchiMate
+        exchange file always contains the reference graphs of all viewpoints
+    :return: None
+    """
+    # initiate the root_element (for the ArchiMate-Model)
+    root_element = None
+    for i in range(0, len(rm_graphs)):
+        # get the name of the reference graph of the current viewpoint (= viewpoint name)
+        current_rm_graph_name = rm_graphs.iloc[i].name
+        # get the reference graph of the current viewpoint
+        current_rm_graph = rm_graphs.iloc[i][column]
+
+        # build the file name (= viewpoint name)
+        file_name = str(current_rm_graph_name).replace('/', '_')
+        # update the root_element with the current view name
+        root_element = current_rm_graph.to_lxml_element(file_name, root_element)
+        if view_names is not None and current_rm_graph_name not in view_names:
+            continue
+
+        # get all edges and nodes of 'current_rm_graph' (with their readable ids)
+        current_rm_graph_nodes, current_rm_graph_edges = current_rm_graph.get_readable_tables()
+        nodes_path, edges_path, node_stats_path, edge_stats_path = get_view_output_paths(current_rm_graph_name,
+                                                                                         output_path)
+        # save nodes and edges to csv
+        current_rm_graph_nodes.to_csv(nodes_path, sep=",", index_label='id')
+        current_rm_graph_edges.to_csv(edges_path, sep=",", index_label='id')
+
+        # get the node and edges stats (the stats of an earlier run of a graph which has none now are deleted)
+        for stats, stats_path in [(current_rm_graph.node_stats, node_stats_path),
+                                  (current_rm_graph.edge_stats, edge_stats_path)]:
+            if stats is not None:
+                stats.to_csv(stats_path, sep=",", index_label='type', header=['count'])
+            elif os.path.exists(stats_path):
+                os.remove(stats_path)
+    # update the root_element to get a ncname valid element
+    root_element = Graph.recreate_identifier(root_element)
+    # get the xml string
+    xml = Graph.element_to_xml_string(root_element)
+    # create the ArchiMate exchange file
+    f = codecs.open(output_path + "/" + "reference_model.xml", "w+", "utf-8")
+    f.write(xml)
+    f.close()
+
+
+def remove_views_output(view_names: list, output_path: str) -> None:
+    """Method to delete the csv files of viewpoints which don't exist anymore
+
+    :parameter view_names: The names of the viewpoints
+    :parameter output_path: Location where the output model is saved
+    :return: None
+    """
+    for view_name in view_names:
+        for file_path in get_view_output_paths(view_name, output_path):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+
+def execute_mcc(input_path: str, output_path: str, threshold, on_invalid: str = None, fold: bool = False) -> None:
     """Method to execute the MCC algorithm on the global input models
 
     :parameter input_path: The path to the folder which contains the input files
     :parameter output_path: Location where you want to save the output model
     :parameter threshold: The threshold to use for the algorithm
+    :parameter on_invalid: If set the input files are checked first, invalid ones are skipped ('skip') or the run
+        is aborted ('abort')
+    :parameter fold: If True the input models are folded into the sets one after another instead of keeping the
+        graphs of all input models
     :return: None
     """
     # set the path to directory where all xml files of the input models are located
@@ -25,23 +109,29 @@ def execute_mcc(input_path: str, output_path: str, threshold) -> None:
     # initialize mcc algorithm
     mcc_algorithm = MCCGlobal(path, move_cost, delete_cost, insert_cost, threshold)
 
-    # do first step of mcc algorithm: load all input models out of xml files into graph data structure
-    mcc_algorithm.load_graphs()
-    # do second step of mcc algorithm: compute the initial edges and nodes set over all input models
-    mcc_algorithm.initiate_sets()
+    if fold:
+        # do first and second step of mcc algorithm at once: insert one input model after another into the sets
+        mcc_algorithm.fold_models(mcc_algorithm.get_model_paths(on_invalid=on_invalid))
+        mcc_algorithm.complete_sets()
+    else:
+        # do first step of mcc algorithm: load all input models out of xml files into graph data structure
+        mcc_algorithm.load_graphs(on_invalid=on_invalid)
+        # do second step of mcc algorithm: compute the initial edges and nodes set over all input models
+        mcc_algorithm.initiate_sets()
     # do third step of mcc algorithm: execute the algorithm
     mcc_algorithm.execute()
 
     # write nodes and edges set of the resulting reference graph to csv document
     # (first parameter = relative path to directory where one want to save the files)
+    rm_graph_nodes, rm_graph_edges = mcc_algorithm.rm_graph.get_readable_tables()
     path = output_path + "\\" + 'nodes.csv'
-    mcc_algorithm.rm_graph.nodes.to_csv(path, sep=",", index_label='id')
+    rm_graph_nodes.to_csv(path, sep=",", index_label='id')
     path = output_path + "\\" + 'edges.csv'
-    mcc_algorithm.rm_graph.edges.to_csv(path, sep=",", index_label='id')
+    rm_graph_edges.to_csv(path, sep=",", index_label='id')
 
     # get the node and edges stats
-    node_stats = Nodes(mcc_algorithm.rm_graph.nodes).node_stats
-    edge_stats = Edges(mcc_algorithm.rm_graph.edges).edge_stats
+    node_stats = mcc_algorithm.rm_graph.node_stats
+    edge_stats = mcc_algorithm.rm_graph.edge_stats
     if node_stats is not None:
         node_stats_path = output_path + '\\stats' + '\\' + 'node_stats.csv'
         node_stats.to_csv(node_stats_path, sep=",", index_label='type', header=['count'])
@@ -61,12 +151,18 @@ def execute_mcc(input_path: str, output_path: str, threshold) -> None:
     f.close()
 
 
-def execute_mcc_views(input_path: str, output_path: str, threshold: float) -> None:
+def execute_mcc_views(input_path: str, output_path: str, threshold: float, min_support: int = 1,
+                      lazy: bool = False, cache_dir: str = None, on_invalid: str = None) -> None:
     """Method to execute the MCC-views algorithm on the single views of the input models
 
     :parameter input_path: The path to the folder which contains the input files
     :parameter output_path: Location where you want to save the output model
     :parameter threshold: The threshold to use for the algorithm
+    :parameter min_support: The minimum number of input models a view has to exist in to be mined
+    :parameter lazy: If True the graphs of a view are only built while the view is mined (less memory)
+    :parameter cache_dir: The directory where the extracted data of the input files is cached (None = no cache)
+    :parameter on_invalid: If set the input files are checked first, invalid ones are skipped ('skip') or the run
+        is aborted ('abort')
     :return: None
     """
     # set the path to directory where all xml files of the input models are located
@@ -79,112 +175,87 @@ def execute_mcc_views(input_path: str, output_path: str, threshold: float) -> No
     mcc_views_algorithm = MCCViews(path, move_cost, delete_cost, insert_cost, threshold)
 
     # do first step of mcc algorithm: load all views of input models out of xml files into graph data structure
-    mcc_views_algorithm.load_graphs_views()
+    mcc_views_algorithm.load_graphs_views(cache_dir=cache_dir, lazy=lazy, on_invalid=on_invalid)
 
     # initialize the DataFrame where one want to save all resulting reference graphs for the different views
     reference_graphs = pd.DataFrame(columns=['graph'])
 
-    # get all views of all input models
-    models = mcc_views_algorithm.graphs
-    view_names = mcc_views_algorithm.view_names
-    number_of_views = len(view_names)
+    # get the names of all views which exist in at least 'min_support' input models
+    view_names = mcc_views_algorithm.get_view_names(min_support)
 
     # iterate over all views
-    for i in range(0, number_of_views):
-        # local variable to save the set of views we currently work on
-        current_views = []
-        # get the name of the current_view
-        current_view_name = view_names[i]
+    for current_view_name in view_names:
         # print output to see the progress of the algorithm
         print(current_view_name)
 
-        # iterate over all models
-        for j in range(0, len(models)):
-            # check if current model contains current view
-            try:
-                # get the current view of the current model
-                current_model_view = models.iloc[j]['model'].loc[current_view_name].loc['graph']
-                # append current view to 'current_views'
-                current_views.append(current_model_view)
-            except KeyError as ke:
-                input_graph_name = models.iloc[j].name
-                print(
-                    'Viewpoint \'' + current_view_name + '\' does not exist for input graph \'' + input_graph_name + '\'!')
-                continue
-        # execute the mcc views algorithm for the current views as the set of input graphs
-        mcc_views_algorithm.current_views = current_views
-
-        # do second step of mcc algorithm: compute the initial edges and nodes set over all input models
-        mcc_views_algorithm.initiate_sets()
-        # do third step of mcc algorithm: execute the algorithm
-        mcc_views_algorithm.execute()
-
-        # create a deep copy 'rm_graph' attribute of mcc algorithm
-        # this is because that attribute will e overwritten in the next iteration for the next viewpoints
-        # else the results would be lost
-        rm_graph = copy.deepcopy(mcc_views_algorithm.rm_graph)
-        # save the copy in 'reference_graphs'
-        reference_graphs.loc[current_view_name] = [rm_graph]
+        # execute the mcc views algorithm for the current view of all input models as the set of input graphs and
+        # save a copy of the resulting reference graph in 'reference_graphs'
+        # (the 'rm_graph' attribute of mcc algorithm will be overwritten in the next iteration for the next viewpoint)
+        reference_graphs.loc[current_view_name] = [mcc_views_algorithm.mine_view(current_view_name)]
 
     """ After we executed the mcc algorithm for all viewpoints of all input models, all result reference graphs will 
-    be saved in 'reference_graphs' -> iterate over all graphs in 'reference_graphs' to save their nodes and edges 
-    in csv files"""
-    # initiate the root_element (for the ArchiMate-Model)
-    root_element = None
-    for i in range(0, len(reference_graphs)):
-        # get the name of the reference graph of the current viewpoint (= viewpoint name)
-        current_rm_graph_name = reference_graphs.iloc[i].name
-        # get the reference graph of the current viewpoint
-        current_rm_graph = reference_graphs.iloc[i]['graph']
+    be saved in 'reference_graphs' -> save their nodes and edges in csv files"""
+    write_views_output(reference_graphs, 'graph', output_path)
 
-        # get all edges and nodes of 'current_rm_graph'
-        current_rm_graph_edges = current_rm_graph.edges
-        current_rm_graph_nodes = current_rm_graph.nodes
 
-        # build the file name (= viewpoint name)
-        file_name = str(current_rm_graph_name).replace('/', '_')
-        # update the root_element with the current view name
-        root_element = current_rm_graph.to_lxml_element(file_name, root_element)
-        # set the path to place where you want to save the csv file for the nodes set of 'current_rm_graph'
-        file_path = output_path + '\\' + file_name + '_nodes.csv'
-        # save nodes to csv
-        current_rm_graph_nodes.to_csv(file_path, sep=",", index_label='id')
-        # set the path to place where you want to save the csv file for the edges set of 'current_rm_graph'
-        file_path = output_path + '\\' + file_name + '_edges.csv'
-        # save edges to csv
-        current_rm_graph_edges.to_csv(file_path, sep=",", index_label='id')
-
-        # get the node and edges stats
-        node_stats = Nodes(current_rm_graph.nodes).node_stats
-        edge_stats = Edges(current_rm_graph.edges).edge_stats
-        if node_stats is not None:
-            node_stats_path = output_path + '\\stats' + '\\' + file_name + '_node_stats.csv'
-            node_stats.to_csv(node_stats_path, sep=",", index_label='type', header=['count'])
-        if edge_stats is not None:
-            edge_stats_path = output_path + '\\stats' + '\\' + file_name + '_edge_stats.csv'
-            edge_stats.to_csv(edge_stats_path, sep=",", index_label='type', header=['count'])
-    # update the root_element to get a ncname valid element
-    root_element = Graph.recreate_identifier(root_element)
-    # get the xml string
-    xml = Graph.element_to_xml_string(root_element)
-    # create the ArchiMate exchange file
-    f = codecs.open(output_path + "/" + "reference_model.xml", "w+", "utf-8")
-    f.write(xml)
-    f.close()
+def watch_mcc_views(input_path: str, output_path: str, threshold: float, interval: float = 5.0,
+                    cache_dir: str = None, on_invalid: str = 'skip') -> None:
+    """Method to execute the MCC-views algorithm continuously: the input files are checked for changes every
+    'interval' seconds and only the viewpoints which are affected by a change are mined and exported again
 
+    :parameter input_path: The path to the folder which contains the input files
+    :parameter output_path: Location where you want to save the output model
+    :parameter threshold: The threshold to use for the algorithm
+    :parameter interval: The number of seconds to wait between two checks for changed input files
+    :parameter cache_dir: The directory where the extracted data of the input files is cached (None = no cache)
+    :parameter on_invalid: How invalid input files are handled, by default they are skipped until they are changed
+        again (e.g. a file which is read while it is saved)
+    :return: None
+    """
+    # set the costs for move, delete, insert operation and for the threshold
+    move_cost = float(2.0)
+    delete_cost = float(1.0)
+    insert_cost = float(10.0)
+    mcc_views_algorithm = MCCViews(input_path, move_cost, delete_cost, insert_cost, threshold)
+    mcc_views_algorithm.load_graphs_views(cache_dir=cache_dir, on_invalid=on_invalid)
 
-def execute_refpa(input_path: str, output_path: str):
+    # the reference graphs of all viewpoints which were already mined
+    reference_graphs = pd.DataFrame(columns=['graph'])
+    changed_views = list(mcc_views_algorithm.view_names)
+    while True:
+        view_names = mcc_views_algorithm.view_names
+        # drop the reference graphs and the csv files of viewpoints which don't exist anymore
+        remove_views_output([name for name in reference_graphs.index if name not in view_names], output_path)
+        reference_graphs = reference_graphs.loc[[name for name in reference_graphs.index if name in view_names]]
+        # mine only the viewpoints which changed
+        for view_name in changed_views:
+            if view_name in view_names:
+                print(view_name)
+                reference_graphs.loc[view_name] = [mcc_views_algorithm.mine_view(view_name)]
+
+        if len(changed_views) > 0:
+            # write the csv files of the changed viewpoints and the ArchiMate exchange file with all viewpoints
+            reference_graphs = reference_graphs.loc[[name for name in view_names if name in reference_graphs.index]]
+            write_views_output(reference_graphs, 'graph', output_path, changed_views)
+
+        time.sleep(interval)
+        changed_views = mcc_views_algorithm.update_graphs_views(cache_dir=cache_dir, on_invalid=on_invalid)
+
+
+def execute_refpa(input_path: str, output_path: str, fold: bool = False):
     """Method to execute the RefPa algorithm on the global input models
 
     :parameter input_path: The path to the folder which contains the input files
     :parameter output_path: Location where you want to save the output model
+    :parameter fold: If True the input models are folded into the sets one after another and only their nodes
+        clusters are kept instead of their graphs
     :return: None
     """
     # initialize refpa algorithm
     refpa_algorithm = RefPaGlobal(input_path)
 
     # Step one of refpa algorithm: merge all input models into one global input model
-    refpa_algorithm.create_initial_rm_graph()
+    refpa_algorithm.create_initial_rm_graph(fold)
     # Step two of refpa algorithm: compute the common-practice nodes
     refpa_algorithm.compute_common_nodes()
     # Step three of refpa algorithm: build nodes clusters
@@ -198,14 +269,15 @@ def execute_refpa(input_path: str, output_path: str):
 
     # write nodes and edges set of the resulting reference graph to csv document
     # (first parameter = relative path to directory where one want to save the files)
+    rm_graph_nodes, rm_graph_edges = refpa_algorithm.rm_graph.get_readable_tables()
     path = output_path + "\\" + "nodes.csv"
-    refpa_algorithm.rm_graph.nodes.to_csv(path, sep=",", index_label='id')
+    rm_graph_nodes.to_csv(path, sep=",", index_label='id')
     path = output_path + "\\" + "edges.csv"
-    refpa_algorithm.rm_graph.edges.to_csv(path, sep=",", index_label='id')
+    rm_graph_edges.to_csv(path, sep=",", index_label='id')
 
     # get the node and edges stats
-    node_stats = Nodes(refpa_algorithm.rm_graph.nodes).node_stats
-    edge_stats = Edges(refpa_algorithm.rm_graph.edges).edge_stats
+    node_stats = refpa_algorithm.rm_graph.node_stats
+    edge_stats = refpa_algorithm.rm_graph.edge_stats
     if node_stats is not None:
         node_stats_path = output_path + '\\stats' + '\\' + 'node_stats.csv'
         node_stats.to_csv(node_stats_path, sep=",", index_label='type', header=['count'])
@@ -225,18 +297,19 @@ def execute_refpa(input_path: str, output_path: str):
     f.close()
 
 
-def execute_refpa_views(input_path: str, output_path: str):
+def execute_refpa_views(input_path: str, output_path: str, min_support: int = 1):
     """Method to execute the RefPa-views algorithm on the single views of the input models
 
     :parameter input_path: The path to the folder which contains the input files
     :parameter output_path: Location where you want to save the output model
+    :parameter min_support: The minimum number of input models a view has to exist in to be mined
     :return: None
     """
     # initialize refpa algorithm
     refpa_views_algorithm = RefPaViews(input_path)
 
     # do first step of refpa algorithm: merge the different views of input models into global input models
-    refpa_views_algorithm.create_initial_rm_graphs()
+    refpa_views_algorithm.create_initial_rm_graphs(min_support=min_support)
     # do second step of refpa algorithm: compute common nodes, compute nodes groups, evaluate nodes groups,
     # create final reference graph for a the different viewpoints
     refpa_views_algorithm.execute()
@@ -251,10 +324,9 @@ def execute_refpa_views(input_path: str, output_path: str):
         # get the name of the reference graph of the current viewpoint (= viewpoint name)
         current_rm_graph_name = final_rm_graphs.iloc[i].name
 
-        # get all edges and nodes of 'current_rm_graph'
+        # get all edges and nodes of 'current_rm_graph' (with their readable ids)
         current_rm_graph = final_rm_graphs.iloc[i]['rm_graph']
-        current_rm_graph_edges = current_rm_graph.edges
-        current_rm_graph_nodes = current_rm_graph.nodes
+        current_rm_graph_nodes, current_rm_graph_edges = current_rm_graph.get_readable_tables()
         # build the file name (= viewpoint name)
         file_name = str(current_rm_graph_name).replace('/', '_')
         # update the root_element with the current view name
@@ -269,8 +341,8 @@ def execute_refpa_views(input_path: str, output_path: str):
         current_rm_graph_edges.to_csv(file_path, sep=",", index_label='id')
 
         # get the node and edges stats
-        node_stats = Nodes(current_rm_graph.nodes).node_stats
-        edge_stats = Edges(current_rm_graph.edges).edge_stats
+        node_stats = current_rm_graph.node_stats
+        edge_stats = current_rm_graph.edge_stats
         if node_stats is not None:
             node_stats_path = output_path + '\\stats' + '\\' + file_name + '_node_stats.csv'
             node_stats.to_csv(node_stats_path, sep=",", index_label='type', header=['count'])
@@ -289,68 +361,58 @@ def execute_refpa_views(input_path: str, output_path: str):
     f.close()
 
 
-def execute_combined_views(input_path: str, output_path: str, threshold: float):
+def execute_combined_views(input_path: str, output_path: str, threshold: float, min_support: int = 1):
     """Method to execute the RefPa-views algorithm on the single views of the input models
 
     :parameter input_path: The path to the folder which contains the input files
     :parameter output_path: Location where you want to save the output model
     :parameter threshold: The threshold to use for the algorithm
+    :parameter min_support: The minimum number of input models a view has to exist in to be mined
     :return: None
     """
     # initialize refpa algorithm
     ream_miner = ReamMiner(input_path, threshold)
 
     # do first step of refpa algorithm: merge the different views of input models into global input models
-    ream_miner.create_initial_rm_graphs()
+    ream_miner.create_initial_rm_graphs(min_support=min_support)
     # do second step of refpa algorithm: compute common nodes, compute nodes groups, evaluate nodes groups,
     # create final reference graph for a the different viewpoints
     ream_miner.execute()
 
-    # get the different reference graphs for the different viewpoints
-    final_rm_graphs = ream_miner.rm_graphs
+    # write the reference graphs for the different viewpoints to csv files and the ArchiMate exchange file
+    write_views_output(ream_miner.rm_graphs, 'rm_graph', output_path)
 
-    # initiate the root_element (for the ArchiMate-Model)
-    root_element = None
-    # iterate over all reference graph in 'final_rm_graphs' to write their nodes and edges to csv files
-    for i in range(0, len(final_rm_graphs)):
-        # get the name of the reference graph of the current viewpoint (= viewpoint name)
-        current_rm_graph_name = final_rm_graphs.iloc[i].name
 
-        # get all edges and nodes of 'current_rm_graph'
-        current_rm_graph = final_rm_graphs.iloc[i]['rm_graph']
-        current_rm_graph_edges = current_rm_graph.edges
-        current_rm_graph_nodes = current_rm_graph.nodes
-        # build the file name (= viewpoint name)
-        file_name = str(current_rm_graph_name).replace('/', '_')
-        # update the root_element with the current view name
-        root_element = current_rm_graph.to_lxml_element(file_name, root_element)
-        # set the path to place where you want to save the csv file for the nodes set of 'current_rm_graph'
-        file_path = output_path + '\\' + file_name + '_nodes.csv'
-        # save nodes to csv
-        current_rm_graph_nodes.to_csv(file_path, sep=",", index_label='id')
-        # set the path to place where you want to save the csv file for the edges set of 'current_rm_graph'
-        file_path = output_path + '\\' + file_name + '_edges.csv'
-        # save edges to csv
-        current_rm_graph_edges.to_csv(file_path, sep=",", index_label='id')
+def watch_combined_views(input_path: str, output_path: str, threshold: float, interval: float = 5.0) -> None:
+    """Method to execute the combined views algorithm continuously: the input files are checked for changes every
+    'interval' seconds and only the viewpoints which are affected by a change are mined and exported again
 
-        # get the node and edges stats
-        node_stats = Nodes(current_rm_graph.nodes).node_stats
-        edge_stats = Edges(current_rm_graph.edges).edge_stats
-        if node_stats is not None:
-            node_stats_path = output_path + '\\stats' + '\\' + file_name + '_node_stats.csv'
-            node_stats.to_csv(node_stats_path, sep=",", index_label='type', header=['count'])
-        if edge_stats is not None:
-            edge_stats_path = output_path + '\\stats' + '\\' + file_name + '_edge_stats.csv'
-            edge_stats.to_csv(edge_stats_path, sep=",", index_label='type', header=['count'])
-    # current_rm_graph_edges.to_csv(file_path, sep=",", index_label='id')
-    # update the root_element to get a ncname valid element
-    root_element = Graph.recreate_identifier(root_element)
-    # get the xml string
-    xml = Graph.element_to_xml_string(root_element)
-    # create the ArchiMate exchange file
-    f = codecs.open(output_path + "/" + "reference_model.xml", "w+", "utf-8")
-    f.write(xml)
-    f.close()
+    :parameter input_path: The path to the folder which contains the input files
+    :parameter output_path: Location where you want to save the output model
+    :parameter threshold: The threshold to use for the algorithm
+    :parameter interval: The number of seconds to wait between two checks for changed input files
+    :return: None
+    """
+    ream_miner = ReamMiner(input_path, threshold)
+    ream_miner.create_initial_rm_graphs()
+    ream_miner.execute()
+    write_views_output(ream_miner.rm_graphs, 'rm_graph', output_path)
+
+    while True:
+        time.sleep(interval)
+        old_view_names = list(ream_miner.rm_graphs.index)
+        changed_views = ream_miner.update_graphs_views()
+        # delete the csv files of the viewpoints which don't exist anymore
+        removed_views = [name for name in old_view_names if name not in ream_miner.rm_graphs.index]
+        remove_views_output(removed_views, output_path)
+        if len(changed_views) > 0 or len(removed_views) > 0:
+            # merge and execute only the viewpoints which changed
+            ream_miner.create_initial_rm_graphs(changed_views)
+            ream_miner.execute(changed_views)
+            view_names = ream_miner.view_names
+            rm_graphs = ream_miner.rm_graphs
+            write_views_output(rm_graphs.loc[[name for name in view_names if name in rm_graphs.index]],
+                               'rm_graph', output_path, changed_views)
 
 
 if __name__ == '__main__':
@@ -362,3 +424,5 @@ if __name__ == '__main__':
     #execute_refpa(r'data/input_data/AML', r'data/results/refpa_global/AML')
     #execute_refpa_views(r'data/input_data/AML', r'data/results/refpa_views/AML')
     #execute_combined_views(r'data/input_data/AML', r'data/results/combined_views/AML', 4.0)
+    #watch_mcc_views(r'data/input_data/AML', r'data/results/mcc_views/AML', 4.0)
+    #watch_combined_views(r'data/input_data/AML', r'data/results/combined_views/AML', 4.0)
@@ -0,0 +1,51 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.graph import Graph
+from core.model.adjacency_index import AdjacencyIndex
+from core.model.utils_nodes_clusters import compute_neighbours, compute_child_nodes, compute_high_level_nodes
+
+
+class TestAdjacencyIndex (TestCase):
+    def test_index_follows_changes_of_graph(self):
+        nodes = pd.DataFrame({'label': ['a', 'b', 'c'], 'type': ['X', 'X', 'Y'], 'frequency': [1, 1, 1]},
+                             index=['aX', 'bX', 'cY'])
+        edges = pd.DataFrame({'source': ['aX', 'bX', 'cY'], 'target': ['bX', 'cY', 'cY'],
+                              'type': ['A', 'B', 'root_edge'], 'frequency': [1, 1, 1]}, index=['e1', 'e2', 'e3'])
+        graph = Graph(nodes, edges)
+        adjacency_index = graph.adjacency_index
+
+        node_c = pd.Series({'label': 'c', 'type': 'Y', 'frequency': 1}, name='cY')
+        node_a = pd.Series({'label': 'a', 'type': 'X', 'frequency': 1}, name='aX')
+        graph.add_edge(pd.Series({'source': node_c, 'target': node_a, 'type': 'A', 'frequency': 1}, name='e4'))
+        graph.delete_edge('e1')
+        graph.delete_root_edges()
+
+        # the index is updated in place and gives the same results as scanning the edges
+        self.assertIs(adjacency_index, graph.adjacency_index)
+        self.assertEqual(['e2'], adjacency_index.get_in_edges('cY'))
+        self.assertEqual(compute_high_level_nodes(graph.nodes, graph.edges),
+                         compute_high_level_nodes(graph.nodes, graph.edges, adjacency=adjacency_index))
+        for node_id in ['aX', 'bX', 'cY', 'unknown']:
+            self.assertEqual(compute_neighbours(graph.edges, node_id),
+                             compute_neighbours(graph.edges, node_id, adjacency_index))
+            self.assertEqual(compute_child_nodes(node_id, graph.edges),
+                             compute_child_nodes(node_id, graph.edges, adjacency_index))
+
+    def test_same_results_as_edges_scan(self):
+        nodes = pd.DataFrame({'label': ['a', 'b', 'c', 'd'], 'type': ['X', 'X', 'Y', 'Y']},
+                             index=['n1', 'n2', 'n3', 'n4'])
+        # 'e4' is a self loop, 'e5' points to an unknown node
+        edges = pd.DataFrame({'source': ['n1', 'n2', 'n1', 'n3', 'n4'], 'target': ['n2', 'n3', 'n3', 'n3', 'n9'],
+                              'type': ['A', 'B', 'A', 'A', 'B']}, index=['e1', 'e2', 'e3', 'e4', 'e5'])
+        adjacency_index = AdjacencyIndex(edges)
+
+        self.assertEqual(['n2', 'n3'], adjacency_index.get_successors('n1'))
+        self.assertEqual(['n2', 'n1', 'n3'], adjacency_index.get_predecessors('n3'))
+        self.assertEqual(3, adjacency_index.get_in_degree('n3'))
+        self.assertEqual(0, adjacency_index.get_out_degree('n9'))
+        self.assertEqual(0, adjacency_index.get_in_degree('unknown'))
+        self.assertEqual(compute_high_level_nodes(nodes, edges),
+                         compute_high_level_nodes(nodes, edges, adjacency=adjacency_index))
+        for node_id in ['n1', 'n2', 'n3', 'n4', 'n9', 'unknown']:
+            self.assertEqual(compute_neighbours(edges, node_id), compute_neighbours(edges, node_id, adjacency_index))
+            self.assertEqual(compute_child_nodes(node_id, edges), compute_child_nodes(node_id, edges, adjacency_index))
@@ -1,7 +1,190 @@
 from unittest import TestCase
+import os
+import gzip
+import shutil
+import tempfile
+import tarfile
+import zipfile
+from unittest import mock
 from core.loader.data_loader import *
+from core.loader.model_validator import validate_file
+from core.loader.utils_data_loader import map_files
+from core.model.graph import Graph, compute_graph_hash
+from core.model.utils_nodes import compute_distinct_nodes
+from core.model.utils_edges import compute_distinct_edges
+from mcc.utils_mcc import load_graph_views
+
+TEST_MODEL = """<?xml version="1.0" encoding="UTF-8"?>
+<model xmlns="http://www.opengroup.org/xsd/archimate/3.0/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+       identifier="model">
+  <name xml:lang="de">test</name>
+  <elements>
+    <element identifier="id1" xsi:type="BusinessProcess"><name xml:lang="de">Order</name></element>
+    <element identifier="id2" xsi:type="BusinessObject"><name xml:lang="de">Invoice</name></element>
+    <element identifier="id3" xsi:type="BusinessActor"><name xml:lang="de">Customer</name></element>
+    <element identifier="id4" xsi:type="ApplicationComponent"><name xml:lang="de">ERP</name></element>
+  </elements>
+  <relationships>
+    <relationship identifier="r1" source="id1" target="id2" xsi:type="Access"/>
+    <relationship identifier="r2" source="id3" target="id1" xsi:type="Assignment"/>
+    <relationship identifier="r3" source="id4" target="id1" xsi:type="Serving"/>
+  </relationships>
+  <views>
+    <diagrams>
+      <view identifier="v1" xsi:type="Diagram">
+        <name xml:lang="de">Overview</name>
+        <node identifier="n1" elementRef="id3" xsi:type="Element">
+          <node identifier="n2" elementRef="id1" xsi:type="Element"/>
+        </node>
+        <node identifier="n3" xsi:type="Container">
+          <node identifier="n4" elementRef="id2" xsi:type="Element"/>
+        </node>
+        <node identifier="n5" xsi:type="Label"/>
+        <connection identifier="c1" relationshipRef="r1" xsi:type="Relationship" source="n2" target="n4"/>
+      </view>
+      <view identifier="v2" xsi:type="Diagram">
+        <name xml:lang="de">Applications</name>
+        <node identifier="n6" elementRef="id4" xsi:type="Element"/>
+        <node identifier="n7" elementRef="id1" xsi:type="Element"/>
+      </view>
+    </diagrams>
+  </views>
+</model>
+"""
+
 
 class TestDataLoader (TestCase):
+    def setUp(self):
+        handle, self.test_file = tempfile.mkstemp(suffix='.xml')
+        with os.fdopen(handle, 'w', encoding='utf-8') as file:
+            file.write(TEST_MODEL)
+
+    def tearDown(self):
+        os.remove(self.test_file)
+
+    def test_iterparse_file(self):
+        data_loader = DataLoader()
+        doc = data_loader.load_file(self.test_file)
+        model = data_loader.iterparse_file(self.test_file)
+
+        self.assertEqual(data_loader.get_all_nodes(doc).to_string(), model['nodes'].to_string())
+        self.assertEqual(data_loader.get_all_edges(doc).to_string(), model['edges'].to_string())
+        self.assertEqual(['Overview', 'Applications'], [view['name'] for view in model['views']])
+        for view, view_doc in zip(model['views'], data_loader.get_all_views(doc)):
+            view_nodes = data_loader.get_view_nodes(view_doc)
+            view_edges = data_loader.get_view_edges(view_doc)
+            self.assertEqual(view_nodes, view['nodes'])
+            self.assertEqual(view_edges, view['edges'])
+            self.assertEqual(data_loader.get_all_view_nodes_objects(doc, view_nodes).to_string(),
+                             data_loader.get_view_nodes_frame(model['nodes'], view['nodes']).to_string())
+            self.assertEqual(data_loader.get_all_view_edges_objects(doc, view_edges, view_nodes).to_string(),
+                             data_loader.get_view_edges_frame(model['edges'], view['edges'],
+                                                              view['nodes']).to_string())
+
+    def test_load_compressed_files(self):
+        expected = DataLoader.get_all_nodes(DataLoader.load_file(self.test_file)).to_string()
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        gzip_path = os.path.join(directory, 'model.xml.gz')
+        with gzip.open(gzip_path, 'wt', encoding='utf-8') as file:
+            file.write(TEST_MODEL)
+        zip_path = os.path.join(directory, 'models.zip')
+        with zipfile.ZipFile(zip_path, 'w') as archive:
+            archive.writestr('models/model.xml', TEST_MODEL)
+
+        data_loader = DataLoader(zip_path)
+        self.assertEqual(['models/model.xml'], data_loader.load_file_names())
+        doc_paths = [gzip_path, data_loader.get_file_path('models/model.xml')]
+        for doc_path in doc_paths:
+            self.assertEqual(expected, DataLoader.get_all_nodes(DataLoader.load_file(doc_path)).to_string())
+            self.assertEqual(expected, DataLoader.iterparse_file(doc_path)['nodes'].to_string())
+
+    def test_read_tar_archive_once(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        tar_path = os.path.join(directory, 'models.tar.gz')
+        with tarfile.open(tar_path, 'w:gz') as archive:
+            for filename in ['a.xml', 'b.xml', 'c.xml']:
+                archive.add(self.test_file, filename)
+
+        data_loader = DataLoader(tar_path)
+        self.assertEqual(['a.xml', 'b.xml', 'c.xml'], data_loader.load_file_names())
+        # the files are requested in another order than the one of the archive
+        doc_paths = [data_loader.get_file_path(filename) for filename in ['c.xml', 'a.xml', 'b.xml']]
+        expected = DataLoader.get_all_nodes(DataLoader.load_file(self.test_file)).to_string()
+        with mock.patch('tarfile.open', wraps=tarfile.open) as tar_open:
+            nodes = map_files(DataLoader.iterparse_file, doc_paths + [self.test_file])
+        self.assertEqual(1, tar_open.call_count)
+        self.assertEqual([expected] * 4, [model['nodes'].to_string() for model in nodes])
+
+    def test_load_file_from_bytes(self):
+        expected = DataLoader.get_all_nodes(DataLoader.load_file(self.test_file)).to_string()
+
+        for content in [TEST_MODEL.encode('utf-8'), gzip.compress(TEST_MODEL.encode('utf-8'))]:
+            self.assertEqual(expected, DataLoader.get_all_nodes(DataLoader.load_file(content)).to_string())
+            self.assertEqual(expected, DataLoader.iterparse_file(content)['nodes'].to_string())
+
+    def test_load_file_with_type_filters(self):
+        doc = DataLoader.load_file(self.test_file, element_types=['business'], relationship_types=['Access', 'Serving'])
+        model = DataLoader.iterparse_file(self.test_file, element_types=['business'],
+                                          relationship_types=['Access', 'Serving'])
+
+        # 'id4' isn't part of the business layer, 'r2' has another type and 'r3' is connected to 'id4'
+        self.assertEqual(['id1', 'id2', 'id3'], list(DataLoader.get_all_nodes(doc).index))
+        self.assertEqual(['r1'], list(DataLoader.get_all_edges(doc).index))
+        self.assertEqual(['id1', 'id2', 'id3'], list(model['nodes'].index))
+        self.assertEqual(['r1'], list(model['edges'].index))
+
+    def test_validate_file(self):
+        self.assertEqual([], validate_file(self.test_file, 'views'))
+
+        # remove the name of an element and let a relationship point to an unknown element
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            file.write(TEST_MODEL.replace('<name xml:lang="de">ERP</name>', '').replace('source="id4"', 'source="id9"'))
+        self.assertEqual(['element \'id4\': missing name', 'relationship \'r3\': source \'id9\' doesn\'t exist'],
+                         validate_file(self.test_file, 'views'))
+
+    def test_view_graphs_share_model_tables(self):
+        data_loader = DataLoader()
+        doc = data_loader.load_file(self.test_file)
+        view_names, model_graphs = load_graph_views(self.test_file)
+
+        self.assertEqual(['overview', 'applications'], view_names)
+        for view_name, view_doc in zip(view_names, data_loader.get_all_views(doc)):
+            view_nodes = data_loader.get_view_nodes(view_doc)
+            view_edges = data_loader.get_view_edges(view_doc)
+            graph = model_graphs.loc[view_name]['graph']
+            self.assertEqual(data_loader.get_all_view_nodes_objects(doc, view_nodes).to_string(),
+                             graph.nodes.to_string())
+            self.assertEqual(data_loader.get_all_view_edges_objects(doc, view_edges, view_nodes).to_string(),
+                             graph.edges.to_string())
+        # the views only keep positions into the tables of the model
+        overview_graph = model_graphs.loc['overview']['graph']
+        applications_graph = model_graphs.loc['applications']['graph']
+        self.assertEqual([0, 1, 2], list(overview_graph.nodes_positions))
+        self.assertEqual([0, 3], list(applications_graph.nodes_positions))
+        # the hash and the distinct tables are computed without keeping a slice of the model tables
+        self.assertEqual(compute_graph_hash(overview_graph.nodes, overview_graph.edges), overview_graph.content_hash)
+        self.assertTrue(compute_distinct_nodes(overview_graph.nodes, overview_graph.edges)
+                        .equals(overview_graph.distinct_nodes))
+        self.assertEqual(list(compute_distinct_edges(overview_graph.edges, overview_graph.nodes,
+                                                     overview_graph.distinct_nodes).index),
+                         list(overview_graph.distinct_edges.index))
+        self.assertIsNot(overview_graph.nodes, overview_graph.nodes)
+        self.assertIsNone(Graph.nodes.fget(overview_graph))
+        self.assertIsNone(Graph.edges.fget(overview_graph))
+
+        # a changed view gets own tables, the other views of the model keep theirs
+        self.assertEqual(3, overview_graph.node_stats.sum())
+        overview_graph.delete_nodes(['id1'])
+        overview_graph.delete_edge(overview_graph.edges.index[0])
+        self.assertEqual(['id2', 'id3'], list(overview_graph.nodes.index))
+        self.assertEqual(2, overview_graph.node_stats.sum())
+        self.assertEqual(['id1', 'id4'], list(applications_graph.nodes.index))
+        self.assertIsNotNone(Graph.nodes.fget(overview_graph))
+        self.assertIsNone(Graph.nodes.fget(applications_graph))
+
     def test_get_view_nodes(self):
         expected = [{'id1': ['id2', 'id4'], 'id3': [], 'id2': ['id6'], 'id4': [], 'id6': []}, {'id1': [], 'id5': []}]
 
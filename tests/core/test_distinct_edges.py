@@ -0,0 +1,25 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.utils_nodes import compute_distinct_nodes
+from core.model.utils_edges import compute_distinct_edges
+from core.model.utils_keys import compute_node_key, compute_edge_key
+
+
+class TestDistinctEdges (TestCase):
+    def test_compute_distinct_edges(self):
+        nodes = pd.DataFrame({'label': ['a', 'b', 'b'], 'type': ['X', 'Y', 'Y']}, index=['n1', 'n2', 'n3'])
+        # 'e2' points to an unknown node, the edges after it are still counted
+        edges = pd.DataFrame({'source': ['n1', 'n9', 'n1', 'n1', 'n2'],
+                              'target': ['n2', 'n1', 'n3', 'n2', 'n1'],
+                              'type': ['A', 'A', 'A', 'A', 'B']},
+                             index=['e1', 'e2', 'e3', 'e4', 'e5'])
+        distinct_nodes = compute_distinct_nodes(nodes, edges)
+        distinct_edges = compute_distinct_edges(edges, nodes, distinct_nodes)
+
+        a_key = compute_node_key('a', 'X')
+        b_key = compute_node_key('b', 'Y')
+        self.assertEqual([compute_edge_key(a_key, b_key, 'A'), compute_edge_key(b_key, a_key, 'B')],
+                         list(distinct_edges.index))
+        self.assertEqual([3, 1], list(distinct_edges['frequency']))
+        self.assertEqual(a_key, distinct_edges.iloc[0]['source'].name)
+        self.assertEqual(b_key, distinct_edges.iloc[0]['target'].name)
@@ -0,0 +1,22 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.utils_nodes import compute_distinct_nodes, compute_nodes_keys
+from core.model.utils_keys import compute_node_key
+
+
+class TestDistinctNodes (TestCase):
+    def test_compute_distinct_nodes(self):
+        nodes = pd.DataFrame({'label': ['b', 'a', 'b'], 'type': ['Y', 'X', 'Y']}, index=['n1', 'n2', 'n3'])
+        # only 'n1' is the target of an edge, 'n3' (with the same key) isn't
+        edges = pd.DataFrame({'source': ['n2'], 'target': ['n1'], 'type': ['A']}, index=['e1'])
+        distinct_nodes = compute_distinct_nodes(nodes, edges)
+
+        # in the order of the first node of every key, the first node decides if it is a root node
+        self.assertEqual([compute_node_key('b', 'Y'), compute_node_key('a', 'X')], list(distinct_nodes.index))
+        self.assertEqual(['label', 'type', 'frequency', 'isRoot'], list(distinct_nodes.columns))
+        self.assertEqual([2, 1], list(distinct_nodes['frequency']))
+        self.assertEqual('int64', distinct_nodes['frequency'].dtype.name)
+        self.assertEqual([False, True], list(distinct_nodes['isRoot']))
+
+        # precomputed keys give the same result
+        self.assertTrue(distinct_nodes.equals(compute_distinct_nodes(nodes, edges, compute_nodes_keys(nodes))))
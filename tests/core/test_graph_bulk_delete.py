@@ -0,0 +1,32 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.graph import Graph
+
+
+class TestGraphBulkDelete (TestCase):
+    def setUp(self):
+        nodes = pd.DataFrame({'label': ['a', 'b', 'c', None], 'type': ['X', 'Y', 'Y', None]},
+                             index=['n1', 'n2', 'n3', 'root'])
+        edges = pd.DataFrame({'source': ['n1', 'n2', 'n3', 'root'], 'target': ['n2', 'n3', 'n1', 'n1'],
+                              'type': ['A', 'A', 'B', 'root_edge']}, index=['e1', 'e2', 'e3', 'e4'])
+        self.graph = Graph(nodes, edges)
+
+    def test_delete_edges(self):
+        self.assertEqual(['n2'], self.graph.adjacency_index.get_successors('n1'))
+        deleted_edges_ids = self.graph.delete_edges(['e1', 'e9'])
+        self.assertEqual(['e1'], list(deleted_edges_ids))
+        self.assertEqual([], self.graph.adjacency_index.get_successors('n1'))
+
+        self.graph.delete_root_edges()
+        self.assertEqual(['e2', 'e3'], list(self.graph.edges.index))
+
+    def test_delete_nodes_where(self):
+        snapshot = self.graph.snapshot()
+        snapshot.delete_nodes_where(lambda nodes: nodes['type'] == 'Y')
+        self.assertEqual(['n1', 'root'], list(snapshot.nodes.index))
+        self.assertEqual(4, len(self.graph.nodes))
+
+    def test_keep_induced_subgraph(self):
+        self.graph.keep_induced_subgraph(['n1', 'n2', 'root'])
+        self.assertEqual(['n1', 'n2', 'root'], list(self.graph.nodes.index))
+        self.assertEqual(['e1', 'e4'], list(self.graph.edges.index))
@@ -0,0 +1,44 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.graph import Graph
+
+
+class TestGraphDerivedData (TestCase):
+    def setUp(self):
+        nodes = pd.DataFrame({'label': ['a', 'b', 'c'], 'type': ['X', 'Y', 'Y']}, index=['n1', 'n2', 'n3'])
+        edges = pd.DataFrame({'source': ['n1', 'n1'], 'target': ['n2', 'n3'], 'type': ['A', 'A']},
+                             index=['e1', 'e2'])
+        self.graph = Graph(nodes, edges)
+
+    def test_computed_once_per_version(self):
+        high_level_nodes = self.graph.high_level_nodes
+        self.graph.compute_nodes_clusters()
+        nodes_clusters = self.graph.nodes_clusters
+        self.graph.compute_nodes_clusters()
+        self.assertIs(high_level_nodes, self.graph.high_level_nodes)
+        self.assertIs(nodes_clusters, self.graph.nodes_clusters)
+        self.assertEqual(['n1'], self.graph.high_level_nodes)
+
+    def test_invalidated_by_changes(self):
+        version = self.graph.version
+        content_hash = self.graph.content_hash
+        self.graph.initialize_distinct_nodes()
+        self.graph.compute_nodes_clusters()
+        self.assertEqual(3, len(self.graph.distinct_nodes))
+        self.assertEqual(2, self.graph.node_stats.loc['Y'])
+
+        self.graph.delete_edge('e1')
+        self.graph.delete_node('n3')
+        self.assertEqual(version + 2, self.graph.version)
+        self.assertNotEqual(content_hash, self.graph.content_hash)
+        self.assertEqual(['n1', 'n2'], self.graph.high_level_nodes)
+        self.assertEqual(1, self.graph.node_stats.loc['Y'])
+        # the distinct nodes and the clusters of the previous version aren't returned anymore
+        self.assertIsNone(self.graph.distinct_nodes)
+        self.assertEqual(0, len(self.graph.nodes_clusters))
+        self.graph.initialize_distinct_nodes()
+        self.assertEqual(2, len(self.graph.distinct_nodes))
+
+        # deleting nothing doesn't change the version
+        self.graph.delete_nodes(['n9'])
+        self.assertEqual(version + 2, self.graph.version)
@@ -0,0 +1,33 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.graph import Graph, deduplicate_graphs
+
+
+def create_graph(ids: list, labels: list, edges_ids: list) -> Graph:
+    nodes = pd.DataFrame({'label': labels, 'type': ['Process', 'Object', 'Actor']}, index=ids)
+    edges = pd.DataFrame({'source': [ids[0], ids[2]], 'target': [ids[1], ids[0]], 'type': ['Access', 'Assignment']},
+                         index=edges_ids)
+    return Graph(nodes, edges)
+
+
+class TestGraphHash (TestCase):
+    def test_graph_content_hash(self):
+        graph = create_graph(['id1', 'id2', 'id3'], ['Order', 'Invoice', 'Customer'], ['r1', 'r2'])
+        # the same model with other identifiers has the same content, another label doesn't
+        copied_graph = create_graph(['copy1', 'copy2', 'copy3'], ['Order', 'Invoice', 'Customer'], ['rel1', 'rel2'])
+        other_graph = create_graph(['id1', 'id2', 'id3'], ['Order', 'Invoice', 'Supplier'], ['r1', 'r2'])
+
+        self.assertEqual(graph.content_hash, copied_graph.content_hash)
+        # the order of the nodes and edges doesn't matter
+        reversed_graph = Graph(copied_graph.nodes.iloc[::-1], copied_graph.edges.iloc[::-1])
+        self.assertEqual(graph.content_hash, reversed_graph.content_hash)
+        self.assertNotEqual(graph.content_hash, other_graph.content_hash)
+
+    def test_deduplicate_graphs(self):
+        graph = create_graph(['id1', 'id2', 'id3'], ['Order', 'Invoice', 'Customer'], ['r1', 'r2'])
+        copied_graph = create_graph(['copy1', 'copy2', 'copy3'], ['Order', 'Invoice', 'Customer'], ['rel1', 'rel2'])
+        other_graph = create_graph(['id1', 'id2', 'id3'], ['Order', 'Invoice', 'Supplier'], ['r1', 'r2'])
+
+        graphs, weights = deduplicate_graphs([graph, other_graph, copied_graph])
+        self.assertEqual([graph, other_graph], graphs)
+        self.assertEqual([2, 1], weights)
@@ -0,0 +1,27 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.graph import Graph
+from core.model.utils_keys import compute_node_key
+
+
+class TestGraphSnapshot (TestCase):
+    def test_snapshot_is_copied_on_write(self):
+        nodes = pd.DataFrame({'label': ['a', 'b'], 'type': ['X', 'X'], 'frequency': [1, 1]}, index=['aX', 'bX'])
+        edges = pd.DataFrame({'source': ['aX', 'NoneNone'], 'target': ['bX', 'aX'], 'type': ['A', 'root_edge'],
+                              'frequency': [1, 1]}, index=['e1', 'e2'])
+        graph = Graph(nodes, edges)
+        snapshot = graph.snapshot()
+
+        # the snapshot shares the tables until it changes them
+        self.assertIs(graph.nodes, snapshot.nodes)
+        snapshot.delete_node('aX')
+        snapshot.delete_root_edges()
+        self.assertEqual(['bX'], list(snapshot.nodes.index))
+        self.assertEqual(['e1'], list(snapshot.edges.index))
+        self.assertEqual(['aX', 'bX'], list(graph.nodes.index))
+        self.assertEqual(['e1', 'e2'], list(graph.edges.index))
+
+        # nodes added to the graph are not added to the snapshot
+        graph.add_node(pd.Series({'label': 'c', 'type': 'X'}), 1)
+        self.assertEqual(['aX', 'bX', compute_node_key('c', 'X')], list(graph.nodes.index))
+        self.assertEqual(['bX'], list(snapshot.nodes.index))
@@ -0,0 +1,31 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.utils_nodes import compute_distinct_nodes
+from core.model.utils_keys import compute_node_key, compute_edge_key, compute_readable_tables, ROOT_NODE_KEY
+
+
+class TestKeys (TestCase):
+    def test_keys_dont_collide(self):
+        # both nodes have the readable id 'OrderProcess'
+        nodes = pd.DataFrame({'label': ['Order', 'OrderP'], 'type': ['Process', 'rocess']}, index=['n1', 'n2'])
+        edges = pd.DataFrame(columns=['source', 'target', 'type'])
+        distinct_nodes = compute_distinct_nodes(nodes, edges)
+
+        self.assertEqual([compute_node_key('Order', 'Process'), compute_node_key('OrderP', 'rocess')],
+                         list(distinct_nodes.index))
+        self.assertEqual(2 * 8, len(distinct_nodes.index[0]))
+
+    def test_readable_tables(self):
+        node_key = compute_node_key('a', 'X')
+        nodes = pd.DataFrame({'label': [None, 'a', 'b'], 'type': [None, 'X', 'X']},
+                             index=[ROOT_NODE_KEY, node_key, 'id-1'])
+        edges = pd.DataFrame({'source': [ROOT_NODE_KEY, node_key], 'target': [node_key, 'id-1'],
+                              'type': ['root_edge', 'A']},
+                             index=[compute_edge_key(ROOT_NODE_KEY, node_key, 'root_edge'), 'id-2'])
+        readable_nodes, readable_edges = compute_readable_tables(nodes, edges)
+
+        # ids which are no keys are kept
+        self.assertEqual(['NoneNone', 'aX', 'id-1'], list(readable_nodes.index))
+        self.assertEqual(['NoneaXroot_edge', 'id-2'], list(readable_edges.index))
+        self.assertEqual(['NoneNone', 'aX'], list(readable_edges['source']))
+        self.assertEqual([node_key, 'id-2'], [edges.iloc[1]['source'], edges.index[1]])
@@ -0,0 +1,88 @@
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+from unittest import mock
+from core.loader.data_loader import DataLoader
+from core.loader.model_cache import ModelCache
+from mcc.mcc_views import MCCViews
+
+TEST_MODEL = """<?xml version="1.0" encoding="UTF-8"?>
+<model xmlns="http://www.opengroup.org/xsd/archimate/3.0/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+       identifier="model">
+  <name xml:lang="de">test</name>
+  <elements>
+    <element identifier="id1" xsi:type="BusinessProcess"><name xml:lang="de">Order</name></element>
+    <element identifier="id2" xsi:type="BusinessObject"><name xml:lang="de">Invoice</name></element>
+    <element identifier="id3" xsi:type="ApplicationComponent"><name xml:lang="de">ERP</name></element>
+  </elements>
+  <relationships>
+    <relationship identifier="r1" source="id1" target="id2" xsi:type="Access"/>
+    <relationship identifier="r2" source="id3" target="id1" xsi:type="Serving"/>
+  </relationships>
+  <views>
+    <diagrams>
+      <view identifier="v1" xsi:type="Diagram">
+        <name xml:lang="de">Overview</name>
+        <node identifier="n1" elementRef="id1" xsi:type="Element"/>
+        <node identifier="n2" elementRef="id2" xsi:type="Element"/>
+        <node identifier="n3" elementRef="id3" xsi:type="Element"/>
+        <connection identifier="c1" relationshipRef="r1" xsi:type="Relationship" source="n1" target="n2"/>
+        <connection identifier="c2" relationshipRef="r2" xsi:type="Relationship" source="n3" target="n1"/>
+      </view>
+      <view identifier="v2" xsi:type="Diagram">
+        <name xml:lang="de">Applications</name>
+        <node identifier="n4" elementRef="id3" xsi:type="Element"/>
+        <node identifier="n5" elementRef="id1" xsi:type="Element"/>
+        <connection identifier="c3" relationshipRef="r2" xsi:type="Relationship" source="n4" target="n5"/>
+      </view>
+    </diagrams>
+  </views>
+</model>
+"""
+
+
+class TestLazyViews (TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.input_path = os.path.join(self.directory, 'input')
+        os.makedirs(self.input_path)
+        # the models differ in one relationship of the view 'overview'
+        for i, content in enumerate([TEST_MODEL, TEST_MODEL, TEST_MODEL.replace('source="n3" target="n1"',
+                                                                                  'source="n1" target="n3"')]):
+            with open(os.path.join(self.input_path, 'model' + str(i) + '.xml'), 'w', encoding='utf-8') as file:
+                file.write(content)
+
+    def mine_all_views(self, **kwargs) -> dict:
+        mcc_views = MCCViews(self.input_path, 2.0, 1.0, 10.0, 1.0)
+        mcc_views.load_graphs_views(**kwargs)
+        reference_graphs = {}
+        # building the graphs of a view doesn't read the files again
+        with mock.patch.object(DataLoader, 'load_file', side_effect=AssertionError), \
+                mock.patch.object(DataLoader, 'iterparse_file', side_effect=AssertionError), \
+                mock.patch.object(ModelCache, 'compute_file_hash', side_effect=AssertionError):
+            for view_name in mcc_views.view_names:
+                readable_tables = mcc_views.mine_view(view_name).get_readable_tables()
+                reference_graphs[view_name] = [table.to_string() for table in readable_tables]
+
+        return reference_graphs
+
+    def test_lazy_equals_eager(self):
+        expected = self.mine_all_views()
+        self.assertEqual(['overview', 'applications'], list(expected.keys()))
+
+        self.assertEqual(expected, self.mine_all_views(lazy=True))
+        self.assertEqual(expected, self.mine_all_views(lazy=True, streaming=True))
+        self.assertEqual(expected, self.mine_all_views(lazy=True, cache_dir=os.path.join(self.directory, 'cache')))
+        # a second run uses the cache entries of the first one
+        self.assertEqual(expected, self.mine_all_views(lazy=True, cache_dir=os.path.join(self.directory, 'cache')))
+
+    def test_update_keeps_lazy_options(self):
+        mcc_views = MCCViews(self.input_path, 2.0, 1.0, 10.0, 1.0)
+        mcc_views.load_graphs_views(lazy=True)
+        self.assertEqual([], mcc_views.update_graphs_views())
+        with self.assertRaises(ValueError):
+            mcc_views.update_graphs_views(streaming=True)
+        with self.assertRaises(ValueError):
+            mcc_views.update_graphs_views(cache_dir=os.path.join(self.directory, 'cache'))
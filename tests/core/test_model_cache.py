@@ -0,0 +1,76 @@
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+from unittest import mock
+from core.loader.data_loader import DataLoader
+from core.loader.model_cache import ModelCache, LOADER_VERSION
+from mcc.utils_mcc import load_graph
+
+TEST_MODEL = """<?xml version="1.0" encoding="UTF-8"?>
+<model xmlns="http://www.opengroup.org/xsd/archimate/3.0/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+       identifier="model">
+  <name xml:lang="de">test</name>
+  <elements>
+    <element identifier="id1" xsi:type="BusinessProcess"><name xml:lang="de">Order</name></element>
+    <element identifier="id2" xsi:type="BusinessObject"><name xml:lang="de">Invoice</name></element>
+    <element identifier="id3" xsi:type="ApplicationComponent"><name xml:lang="de">ERP</name></element>
+  </elements>
+  <relationships>
+    <relationship identifier="r1" source="id1" target="id2" xsi:type="Access"/>
+    <relationship identifier="r2" source="id3" target="id1" xsi:type="Serving"/>
+  </relationships>
+</model>
+"""
+
+
+class TestModelCache (TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.test_file = os.path.join(self.directory, 'model.xml')
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            file.write(TEST_MODEL)
+        self.cache_dir = os.path.join(self.directory, 'cache')
+
+    def assert_same_graph(self, expected, graph):
+        for table in ['nodes', 'edges', 'distinct_nodes', 'distinct_edges']:
+            self.assertEqual(getattr(expected, table).to_string(), getattr(graph, table).to_string())
+
+    def test_warm_load_equals_cold_parse(self):
+        cold_graph = load_graph(self.test_file)
+        load_graph(self.test_file, cache_dir=self.cache_dir)
+        cache = ModelCache(self.cache_dir)
+        file_hash = cache.compute_file_hash(self.test_file)
+        entry_path = cache.get_entry_path(file_hash, 'graph')
+        self.assertEqual([os.path.basename(entry_path)], os.listdir(self.cache_dir))
+        self.assertIn('-' + LOADER_VERSION + '-', os.path.basename(entry_path))
+
+        # the warm load is answered out of the cache without parsing the file, even for the streaming parser
+        with mock.patch.object(DataLoader, 'load_file', side_effect=AssertionError), \
+                mock.patch.object(DataLoader, 'iterparse_file', side_effect=AssertionError):
+            self.assert_same_graph(cold_graph, load_graph(self.test_file, cache_dir=self.cache_dir))
+            self.assert_same_graph(cold_graph, load_graph(self.test_file, True, self.cache_dir))
+        self.assertEqual(1, len(os.listdir(self.cache_dir)))
+
+    def test_filters_create_separate_entries(self):
+        load_graph(self.test_file, cache_dir=self.cache_dir)
+        cold_graph = load_graph(self.test_file, element_types=['business'])
+        load_graph(self.test_file, cache_dir=self.cache_dir, element_types=['business'])
+        self.assertEqual(2, len(os.listdir(self.cache_dir)))
+
+        filtered_graph = load_graph(self.test_file, cache_dir=self.cache_dir, element_types=['business'])
+        self.assert_same_graph(cold_graph, filtered_graph)
+        self.assertEqual(3, len(load_graph(self.test_file, cache_dir=self.cache_dir).nodes))
+        # the same filter given by its element types shares the entry
+        load_graph(self.test_file, cache_dir=self.cache_dir,
+                   element_types=['BusinessProcess', 'BusinessObject'])
+        self.assertEqual(3, len(os.listdir(self.cache_dir)))
+
+    def test_failed_write(self):
+        cache = ModelCache(self.cache_dir)
+        # an entry which can't be pickled is neither stored nor leaves a temporary file behind
+        with self.assertRaises(Exception):
+            cache.save('hash', 'graph', {'nodes': lambda: None})
+        self.assertEqual([], os.listdir(self.cache_dir))
+        self.assertIsNone(cache.load('hash', 'graph'))
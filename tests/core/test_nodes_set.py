@@ -0,0 +1,20 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.nodes_set import NodesSet
+
+
+class TestNodesSet (TestCase):
+    def test_get_node(self):
+        nodes_set = NodesSet()
+        nodes_set.add_distinct_node(pd.Series({'label': 'a', 'type': 'X', 'frequency': 1, 'isRoot': True}, name='aX'))
+        nodes_set.add_distinct_node(pd.Series({'label': 'b', 'type': 'X', 'frequency': 2, 'isRoot': False}, name='bX'))
+
+        self.assertEqual('bX', nodes_set.get_node('b', 'X').name)
+        self.assertIsNone(nodes_set.get_node('b', 'Y'))
+
+        # the lookup follows rows appended to and dropped from 'nodes_set'
+        nodes_set.add_distinct_node(pd.Series({'label': 'c', 'type': 'Y', 'frequency': 1, 'isRoot': True}, name='cY'))
+        self.assertEqual(1, nodes_set.get_node('c', 'Y')['frequency'])
+        nodes_set.nodes_set.drop('aX', inplace=True)
+        self.assertIsNone(nodes_set.get_node('a', 'X'))
+        self.assertEqual('bX', nodes_set.get_node('b', 'X').name)
@@ -0,0 +1,26 @@
+from unittest import TestCase
+import pandas as pd
+from core.model.nodes_set import NodesSet
+
+
+class TestRowBuffer (TestCase):
+    def test_buffered_nodes_set(self):
+        distinct_nodes = pd.DataFrame({'label': ['a', 'b', 'a'], 'type': ['X', 'X', 'X'], 'frequency': [1, 2, 3],
+                                       'isRoot': [True, False, True]}, index=['aX', 'bX', 'aX'])
+        nodes_set = NodesSet()
+        for i in range(0, len(distinct_nodes)):
+            nodes_set.add_distinct_node(distinct_nodes.iloc[i])
+
+        # the frequency of the pending node is updated, the dtypes are the ones of a row by row enlarged frame (with
+        # the types as categorical column)
+        self.assertEqual(['aX', 'bX'], list(nodes_set.nodes_set.index))
+        self.assertEqual([4, 2], list(nodes_set.nodes_set['frequency']))
+        self.assertEqual(['object', 'category', 'int64', 'bool'],
+                         [str(dtype) for dtype in nodes_set.nodes_set.dtypes])
+
+        # nodes added after the first read are appended to the frame
+        nodes_set.add_distinct_node(pd.Series({'label': 'c', 'type': 'X', 'frequency': 1, 'isRoot': False}, name='cX'))
+        nodes_set.add_distinct_node(distinct_nodes.iloc[1])
+        self.assertEqual(['aX', 'bX', 'cX'], list(nodes_set.nodes_set.index))
+        self.assertEqual([4, 4, 1], list(nodes_set.nodes_set['frequency']))
+        self.assertEqual('category', nodes_set.nodes_set['type'].dtype.name)
@@ -0,0 +1,59 @@
+from unittest import TestCase
+import pickle
+import pandas as pd
+from core.model.string_table import StringTable, STRING_TABLE, compact_nodes, compact_edges, compact_entry
+from core.model.graph import Graph
+from core.model.utils_keys import ROOT_NODE_KEY
+
+
+class TestStringTable (TestCase):
+    def test_compact_table(self):
+        string_table = StringTable()
+        # build the strings at runtime, so they aren't the same objects from the start
+        first_label = ''.join(['Or', 'der'])
+        second_label = ''.join(['Ord', 'er'])
+        nodes = pd.DataFrame({'label': [first_label, second_label, None], 'type': ['Process', 'Actor', 'Process']},
+                             index=['n1', 'n2', 'n3'], dtype=object)
+        compacted_nodes = string_table.compact_table(nodes, ['label'])
+
+        self.assertIs(compacted_nodes['label'].iloc[0], compacted_nodes['label'].iloc[1])
+        self.assertIsNone(compacted_nodes['label'].iloc[2])
+        self.assertEqual('category', compacted_nodes['type'].dtype.name)
+        self.assertEqual(['n1', 'n3'], list(compacted_nodes[compacted_nodes['type'] == 'Process'].index))
+
+        # a new type extends the known types, a missing type keeps the column as it is
+        edges = pd.DataFrame({'source': ['n1'], 'target': ['n2'], 'type': ['Flow']}, index=['e1'], dtype=object)
+        string_table.compact_table(edges, ['source', 'target'])
+        self.assertEqual(['Process', 'Actor', 'Flow'], string_table.types)
+        nodes.loc['n4'] = ['Order', None]
+        self.assertEqual(object, string_table.compact_table(nodes, ['label'])['type'].dtype)
+
+    def test_compact_entry(self):
+        nodes = compact_nodes(pd.DataFrame({'label': ['Order'], 'type': ['Process']}, index=['n1'], dtype=object))
+        edges = compact_edges(pd.DataFrame({'source': ['n1'], 'target': ['n1'], 'type': ['Flow']}, index=['e1'],
+                                           dtype=object))
+        # unpickled tables (e.g. out of the cache) hold their own strings
+        entry = pickle.loads(pickle.dumps({'nodes': nodes, 'edges': edges, 'distinct_nodes': None}))
+        self.assertIsNot(nodes['label'].iloc[0], entry['nodes']['label'].iloc[0])
+
+        compacted_entry = compact_entry(entry)
+        self.assertIs(nodes['label'].iloc[0], compacted_entry['nodes']['label'].iloc[0])
+        self.assertIs(nodes.index[0], compacted_entry['edges']['source'].iloc[0])
+        self.assertEqual(STRING_TABLE.types_dtype, compacted_entry['edges']['type'].dtype)
+        self.assertIsNone(compacted_entry['distinct_nodes'])
+
+    def test_categorized_rm_graph(self):
+        rm_nodes = pd.DataFrame.from_dict({ROOT_NODE_KEY: [None, None, None]}, orient='index',
+                                          columns=['label', 'type', 'frequency'])
+        rm_graph = Graph(rm_nodes, pd.DataFrame(columns=['source', 'target', 'type', 'frequency']))
+        node = pd.Series({'label': 'Order', 'type': 'Process'})
+        rm_graph.add_node(node, 1.0)
+        rm_graph.add_node(pd.Series({'label': 'ERP', 'type': 'Application'}), 1.0)
+
+        # the type None of the root node is the missing value of the categorical column
+        self.assertEqual('category', rm_graph.nodes['type'].dtype.name)
+        self.assertTrue(pd.isna(rm_graph.nodes['type'].loc[ROOT_NODE_KEY]))
+        self.assertEqual(2, len(rm_graph.node_stats))
+        readable_nodes = rm_graph.get_readable_tables()[0]
+        self.assertEqual(['NoneNone', 'OrderProcess', 'ERPApplication'], list(readable_nodes.index))
+        self.assertIsNone(readable_nodes['type'].loc['NoneNone'])
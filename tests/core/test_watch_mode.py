@@ -0,0 +1,152 @@
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+from unittest import mock
+import run
+from mcc.mcc_views import MCCViews
+from mcc.utils_mcc import load_graph_views, view_graph_changed
+
+TEST_MODEL = """<?xml version="1.0" encoding="UTF-8"?>
+<model xmlns="http://www.opengroup.org/xsd/archimate/3.0/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+       identifier="model">
+  <name xml:lang="de">test</name>
+  <elements>
+    <element identifier="id1" xsi:type="BusinessProcess"><name xml:lang="de">Order</name></element>
+    <element identifier="id2" xsi:type="BusinessObject"><name xml:lang="de">Invoice</name></element>
+    <element identifier="id3" xsi:type="ApplicationComponent"><name xml:lang="de">ERP</name></element>
+  </elements>
+  <relationships>
+    <relationship identifier="r1" source="id1" target="id2" xsi:type="Access"/>
+    <relationship identifier="r2" source="id3" target="id1" xsi:type="Serving"/>
+  </relationships>
+  <views>
+    <diagrams>
+      <view identifier="v1" xsi:type="Diagram">
+        <name xml:lang="de">Overview</name>
+        <node identifier="n1" elementRef="id1" xsi:type="Element"/>
+        <node identifier="n2" elementRef="id2" xsi:type="Element"/>
+        <connection identifier="c1" relationshipRef="r1" xsi:type="Relationship" source="n1" target="n2"/>
+      </view>
+      <view identifier="v2" xsi:type="Diagram">
+        <name xml:lang="de">Applications</name>
+        <node identifier="n3" elementRef="id3" xsi:type="Element"/>
+        <node identifier="n4" elementRef="id1" xsi:type="Element"/>
+        <connection identifier="c2" relationshipRef="r2" xsi:type="Relationship" source="n3" target="n4"/>
+      </view>
+      <view identifier="v3" xsi:type="Diagram">
+        <name xml:lang="de">Processes</name>
+        <node identifier="n5" elementRef="id1" xsi:type="Element"/>
+      </view>
+    </diagrams>
+  </views>
+</model>
+"""
+
+
+class StopWatching (Exception):
+    pass
+
+
+class TestWatchMode (TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.input_path = os.path.join(self.directory, 'input')
+        self.output_path = os.path.join(self.directory, 'output')
+        os.makedirs(self.input_path)
+        os.makedirs(self.output_path)
+        for filename in ['a.xml', 'b.xml']:
+            self.write_model(filename, TEST_MODEL)
+
+    def write_model(self, filename, content):
+        with open(os.path.join(self.input_path, filename), 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def test_view_graph_changed(self):
+        view_names, model_graphs = load_graph_views(os.path.join(self.input_path, 'a.xml'))
+        self.write_model('a.xml', TEST_MODEL.replace('>Invoice<', '>Offer<'))
+        changed_view_names, changed_model_graphs = load_graph_views(os.path.join(self.input_path, 'a.xml'))
+
+        overview_graph = model_graphs.loc['overview']['graph']
+        self.assertFalse(view_graph_changed(overview_graph, load_graph_views(
+            os.path.join(self.input_path, 'b.xml'))[1].loc['overview']['graph']))
+        self.assertTrue(view_graph_changed(overview_graph, changed_model_graphs.loc['overview']['graph']))
+        self.assertFalse(view_graph_changed(model_graphs.loc['applications']['graph'],
+                                            changed_model_graphs.loc['applications']['graph']))
+        self.assertTrue(view_graph_changed(None, overview_graph))
+        self.assertFalse(view_graph_changed(None, None))
+
+    def test_update_graphs_views(self):
+        mcc_views = MCCViews(self.input_path, 2.0, 1.0, 10.0, 1.0)
+        mcc_views.load_graphs_views()
+        self.assertEqual([], mcc_views.update_graphs_views())
+
+        # a file which is saved again with the same content changes its signature, but not its views
+        self.write_model('a.xml', TEST_MODEL + '\n')
+        self.assertEqual([], mcc_views.update_graphs_views())
+        self.write_model('a.xml', TEST_MODEL.replace('>Invoice<', '>Offer<'))
+        self.assertEqual(['overview'], mcc_views.update_graphs_views())
+
+        # the views of a deleted file changed
+        os.remove(os.path.join(self.input_path, 'b.xml'))
+        self.assertEqual(['overview', 'applications', 'processes'], mcc_views.update_graphs_views())
+        self.assertEqual(1, len(mcc_views.get_views('overview')))
+
+    def test_skip_invalid_changed_file(self):
+        for lazy in [False, True]:
+            self.write_model('a.xml', TEST_MODEL)
+            mcc_views = MCCViews(self.input_path, 2.0, 1.0, 10.0, 1.0)
+            mcc_views.load_graphs_views(lazy=lazy)
+
+            # a loaded file which becomes invalid is left out until it is valid again
+            self.write_model('a.xml', TEST_MODEL.replace('<name xml:lang="de">ERP</name>', ''))
+            with mock.patch('builtins.print'):
+                self.assertEqual(['overview', 'applications', 'processes'],
+                                 mcc_views.update_graphs_views(on_invalid='skip'))
+            self.assertEqual(1, len(mcc_views.get_views('applications')))
+            self.assertEqual([], mcc_views.update_graphs_views(on_invalid='skip'))
+            self.write_model('a.xml', TEST_MODEL)
+            self.assertEqual(['overview', 'applications', 'processes'],
+                             mcc_views.update_graphs_views(on_invalid='skip'))
+            self.assertEqual(2, len(mcc_views.get_views('applications')))
+
+    def test_watch_mcc_views(self):
+        overview_paths = run.get_view_output_paths('overview', self.output_path)
+        applications_paths = run.get_view_output_paths('applications', self.output_path)
+        processes_paths = run.get_view_output_paths('processes', self.output_path)
+
+        def change_models(interval):
+            if change_models.calls == 1:
+                raise StopWatching()
+            change_models.calls += 1
+            # a reference graph with only its root edge has no edge stats
+            self.assertTrue(all(os.path.exists(path) for path in overview_paths + applications_paths +
+                                processes_paths[:3]))
+            self.assertFalse(os.path.exists(processes_paths[3]))
+            # mark the csv files to see which ones are written again
+            for path in overview_paths + applications_paths + processes_paths[:3]:
+                with open(path, 'w') as file:
+                    file.write('marker')
+            # change the view 'overview' of all models and remove the view 'applications'
+            content = TEST_MODEL.replace('>Invoice<', '>Offer<')
+            content = content[:content.index('<view identifier="v2"')] + \
+                content[content.index('<view identifier="v3"'):]
+            for filename in ['a.xml', 'b.xml']:
+                self.write_model(filename, content)
+        change_models.calls = 0
+
+        with mock.patch('run.time.sleep', side_effect=change_models), mock.patch('builtins.print'):
+            with self.assertRaises(StopWatching):
+                run.watch_mcc_views(self.input_path, self.output_path, 1.0)
+
+        # only the changed view is written again, the files of the removed view are deleted
+        with open(overview_paths[0]) as file:
+            self.assertIn('Offer', file.read())
+        self.assertFalse(any(os.path.exists(path) for path in applications_paths))
+        with open(processes_paths[0]) as file:
+            self.assertEqual('marker', file.read())
+        with open(os.path.join(self.output_path, 'reference_model.xml'), encoding='utf-8') as file:
+            reference_model = file.read()
+        self.assertIn('Offer', reference_model)
+        self.assertNotIn('ERP', reference_model)